@@ -0,0 +1,216 @@
+"""
+Deterministic stand-in for the Ollama /api/generate endpoint, for load testing
+without a real model.
+
+    cd python_backend
+    python -m benchmarks.fake_ollama --port 11435 --latency lognormal:-0.5,0.6 --tokens-per-sec 15
+    OLLAMA_URL=http://localhost:11435/api/generate python app.py
+
+Both streaming (NDJSON chunks, Ollama's default) and non-streaming replies are
+supported, as is `format: json`. Replies come from fixtures.model_reply, so
+they have the shapes the blueprints parse. Failure modes can be injected: HTTP 500s
+(--error-rate), malformed JSON bodies (--malformed-rate) and requests that hang
+past the client's timeout (--hang-rate). GET /stats reports request counters.
+"""
+import argparse
+import datetime
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.fixtures import model_reply
+
+
+def parse_distribution(spec):
+    """
+    Parse a latency spec into a sampler taking an RNG:
+    fixed:S | uniform:LO,HI | normal:MEAN,SD | lognormal:MU,SIGMA | exp:MEAN   (seconds)
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda rng: rng.lognormvariate(values[0], values[1])
+    if kind == "exp":
+        return lambda rng: rng.expovariate(1.0 / values[0])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def corrupt(text, rng):
+    """Damage a JSON completion the ways small models do: truncation, chatter, or a stray comma."""
+    mode = rng.choice(("truncate", "chatter", "comma"))
+    if mode == "truncate":
+        return text[:max(1, int(len(text) * rng.uniform(0.3, 0.9)))]
+    if mode == "chatter":
+        return "Sure! Here is the JSON you asked for:\n" + text + "\nLet me know if you need more."
+    return text.replace("}", "},", 1)
+
+
+class FakeModel:
+    def __init__(self, args):
+        self.args = args
+        self.first_token = parse_distribution(args.latency)
+        self._rng = random.Random(args.seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0,
+                      "errors": 0, "malformed": 0, "hung": 0, "streamed": 0}
+
+    def draw(self):
+        """Draw one request's random outcomes under the lock so runs replay identically for a seed."""
+        with self._lock:
+            rng = random.Random(self._rng.getrandbits(64))
+        return rng
+
+    def enter(self):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+
+    def leave(self):
+        with self._lock:
+            self.stats["in_flight"] -= 1
+
+    def count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+
+def tokenize(text):
+    """Split a completion into ~4-character chunks, roughly how an LLM emits tokens."""
+    return [text[i:i + 4] for i in range(0, len(text), 4)] or [""]
+
+
+def make_handler(model):
+    args = model.args
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *log_args):
+            if args.verbose:
+                super().log_message(fmt, *log_args)
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/api/tags":
+                return self._send_json(200, {"models": [{"name": "phi"}, {"name": "llama3.2:1b"}]})
+            if self.path == "/stats":
+                return self._send_json(200, model.stats)
+            self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/api/generate":
+                return self._send_json(404, {"error": "not found"})
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return self._send_json(400, {"error": "invalid JSON body"})
+
+            model.enter()
+            try:
+                self._generate(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass # client gave up (e.g. its timeout fired)
+            finally:
+                model.leave()
+
+        def _generate(self, body):
+            rng = model.draw()
+            if rng.random() < args.hang_rate:
+                model.count("hung")
+                time.sleep(args.hang_seconds)
+            if rng.random() < args.error_rate:
+                model.count("errors")
+                time.sleep(model.first_token(rng))
+                return self._send_json(500, {"error": "model runner has unexpectedly stopped"})
+
+            text = model_reply(body.get("prompt", ""), rng)
+            if body.get("format") == "json" and rng.random() < args.malformed_rate:
+                model.count("malformed")
+                text = corrupt(text, rng)
+
+            num_predict = (body.get("options") or {}).get("num_predict")
+            tokens = tokenize(text)
+            if num_predict:
+                tokens = tokens[:max(1, int(num_predict))]
+            per_token = 1.0 / args.tokens_per_sec if args.tokens_per_sec > 0 else 0.0
+            started = time.perf_counter()
+            time.sleep(model.first_token(rng))
+
+            name = body.get("model", "phi")
+            if body.get("stream", True):
+                model.count("streamed")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for token in tokens:
+                    time.sleep(per_token)
+                    self._chunk({"model": name, "created_at": _now(), "response": token, "done": False})
+                self._chunk(self._final(name, "", len(tokens), started))
+                self.wfile.write(b"0\r\n\r\n")
+            else:
+                time.sleep(per_token * len(tokens))
+                self._send_json(200, self._final(name, "".join(tokens), len(tokens), started))
+
+        def _chunk(self, payload):
+            data = json.dumps(payload).encode("utf-8") + b"\n"
+            self.wfile.write(b"%x\r\n" % len(data) + data + b"\r\n")
+            self.wfile.flush()
+
+        @staticmethod
+        def _final(name, response, eval_count, started):
+            total_ns = int((time.perf_counter() - started) * 1e9)
+            return {"model": name, "created_at": _now(), "response": response, "done": True,
+                    "total_duration": total_ns, "eval_count": eval_count}
+
+    return Handler
+
+
+def _now():
+    return datetime.datetime.utcnow().isoformat() + "Z"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", default="lognormal:-1.0,0.5", help="time-to-first-token distribution (seconds)")
+    parser.add_argument("--tokens-per-sec", type=float, default=15.0, help="generation rate; 0 for instant")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="fraction of format=json replies corrupted")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="fraction of requests that stall first")
+    parser.add_argument("--hang-seconds", type=float, default=150.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(FakeModel(args)))
+    server.daemon_threads = True
+    print(f"Fake Ollama listening on http://{args.host}:{args.port}/api/generate")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
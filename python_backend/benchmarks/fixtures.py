@@ -0,0 +1,300 @@
+"""
+Synthetic fixtures for the API benchmarks: full-size O*NET tables, generated
+resume PDFs, and stubbed Ollama / external HTTP responses.
+
+Everything is derived from a seeded RNG so runs are reproducible.
+"""
+import io
+import json
+import random
+
+import pandas as pd
+
+SEED = 1234
+
+# The 35 O*NET "Skills" elements plus the technology names the repo's Skills.txt carries
+ONET_SKILLS = [
+    "Reading Comprehension", "Active Listening", "Writing", "Speaking", "Mathematics", "Science",
+    "Critical Thinking", "Active Learning", "Learning Strategies", "Monitoring", "Social Perceptiveness",
+    "Coordination", "Persuasion", "Negotiation", "Instructing", "Service Orientation",
+    "Complex Problem Solving", "Operations Analysis", "Technology Design", "Equipment Selection",
+    "Installation", "Programming", "Operations Monitoring", "Operation and Control",
+    "Equipment Maintenance", "Troubleshooting", "Repairing", "Quality Control Analysis",
+    "Judgment and Decision Making", "Systems Analysis", "Systems Evaluation", "Time Management",
+    "Management of Financial Resources", "Management of Material Resources",
+    "Management of Personnel Resources",
+]
+
+TECH_NAMES = [
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust", "Ruby", "PHP", "Kotlin",
+    "Swift", "Scala", "R", "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch",
+    "React", "Angular", "Vue.js", "Node.js", "Express", "Django", "Flask", "Spring Boot", "HTML", "CSS",
+    "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins", "Git", "GitHub Actions", "AWS",
+    "Microsoft Azure", "Google Cloud Platform", "Linux", "Bash", "PowerShell", "Apache Kafka",
+    "Apache Spark", "Hadoop", "Tableau", "Power BI", "Microsoft Excel", "SAP", "Salesforce",
+    "Jira", "Confluence", "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy", "MATLAB",
+    "AutoCAD", "Oracle Database", "Microsoft SQL Server", "GraphQL", "REST API", "Figma",
+]
+
+_OCCUPATION_WORDS = (
+    ["Software", "Data", "Network", "Database", "Web", "Systems", "Security", "Cloud", "Financial",
+     "Marketing", "Mechanical", "Electrical", "Civil", "Industrial", "Medical", "Clinical", "Sales",
+     "Operations", "Quality", "Research", "Logistics", "Environmental", "Chemical", "Nuclear"],
+    ["Developers", "Analysts", "Engineers", "Architects", "Administrators", "Scientists",
+     "Technicians", "Managers", "Specialists", "Coordinators", "Consultants", "Inspectors"],
+    ["", ", Applications", ", Systems Software", ", All Other", ", Senior", ", Entry Level"],
+)
+
+# Real titles from the repo's sample data, so role lookups hit the same rows
+KNOWN_TITLES = [
+    ("15-1132.00", "Software Developers, Applications"),
+    ("15-1133.00", "Software Developers, Systems Software"),
+    ("15-2051.00", "Data Scientists"),
+    ("15-1254.00", "Web Developers"),
+]
+
+
+def onet_tables(n_occupations=1016, tech_per_occupation=32, n_extra_tech=800, seed=SEED):
+    """Return (occupations, tech_data, skills_df) shaped like the loaded O*NET frames."""
+    rng = random.Random(seed)
+    titles = []
+    seen = set()
+    for code, title in KNOWN_TITLES:
+        titles.append((code, title))
+        seen.add(title)
+    adjectives, nouns, suffixes = _OCCUPATION_WORDS
+    while len(titles) < n_occupations:
+        title = f"{rng.choice(adjectives)} {rng.choice(nouns)}{rng.choice(suffixes)}"
+        if title in seen:
+            title = f"{title} {len(titles)}"
+        seen.add(title)
+        code = f"{rng.randint(11, 53)}-{rng.randint(1000, 9999)}.{rng.choice(['00', '01', '02'])}"
+        titles.append((code, title))
+
+    occupations = pd.DataFrame(
+        [{"O*NET-SOC Code": code, "Title": title, "Description": f"Synthetic description for {title}."}
+         for code, title in titles],
+        dtype=str
+    )
+
+    tech_pool = TECH_NAMES + [f"Tool {i:04d}" for i in range(n_extra_tech)]
+    rows = []
+    for code, title in titles:
+        for example in rng.sample(tech_pool, tech_per_occupation):
+            rows.append({
+                "O*NET-SOC Code": code,
+                "Title": title,
+                "Example": example,
+                "Commodity Code": str(43232400 + rng.randint(0, 99)),
+                "Commodity Title": "Development software",
+            })
+    tech_data = pd.DataFrame(rows, dtype=str)
+
+    skills_df = pd.DataFrame({
+        "Element Name": sorted(ONET_SKILLS + TECH_NAMES[:45]),
+    })
+    skills_df["Data Value"] = [round(rng.uniform(1.5, 4.8), 2) for _ in range(len(skills_df))]
+    return occupations, tech_data, skills_df
+
+
+# -----------------------------
+# SYNTHETIC RESUMES / JDS
+# -----------------------------
+def resume_lines(n_lines, seed=SEED):
+    rng = random.Random(seed + n_lines)
+    vocab = ONET_SKILLS + TECH_NAMES
+    filler = ["built", "designed", "led", "shipped", "improved", "migrated", "scaled", "automated",
+              "the", "platform", "service", "pipeline", "team", "customers", "latency", "by", "percent"]
+    lines = []
+    for i in range(n_lines):
+        words = rng.sample(filler, 6) + rng.sample(vocab, 2)
+        rng.shuffle(words)
+        lines.append(" ".join(words))
+    return lines
+
+
+def job_description(n_skills=12, seed=SEED):
+    rng = random.Random(seed + n_skills)
+    skills = rng.sample(ONET_SKILLS, n_skills // 2) + rng.sample(TECH_NAMES, n_skills - n_skills // 2)
+    return "We are hiring an engineer. Requirements: " + ", ".join(skills) + ". Strong communication."
+
+
+def make_pdf(lines, lines_per_page=45):
+    """Build a minimal multi-page text PDF (Helvetica) without any PDF library."""
+    def escape(text):
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = []  # object bodies, 1-indexed by position + 1
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(None)  # pages tree, filled in once page ids are known
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_ids = []
+    for page in pages:
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 760 Td"]
+        for line in page:
+            ops.append(f"({escape(line)}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+FAILURE_STORIES = [
+    "I was so nervous in the final interview round that I froze on the first question.",
+    "The coding challenge had a dynamic programming algorithm I could not finish in time.",
+    "Applied to 80 jobs with my resume and got ghosted by almost all of them.",
+    "My resume is too short and the ATS filtered it out before anyone read it.",
+    "They said I lacked experience with the stack and the requirements were too advanced.",
+    "HR call went fine but the behavioral round was rough. I hope to improve next time.",
+]
+
+
+# -----------------------------
+# STUBBED OLLAMA / HTTP LAYER
+# -----------------------------
+class StubResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self._payload
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StubStreamResponse(StubResponse):
+    """A streamed (NDJSON) Ollama reply: ~4-character chunks, then a final done line."""
+
+    def __init__(self, text):
+        super().__init__({"response": text, "done": True})
+        self._chunks = [text[i:i + 4] for i in range(0, len(text), 4)]
+
+    def iter_lines(self):
+        for chunk in self._chunks:
+            yield json.dumps({"response": chunk, "done": False}).encode("utf-8")
+        yield json.dumps({"response": "", "done": True}).encode("utf-8")
+
+
+class _FeedEntry:
+    def __init__(self, i):
+        self.title = f"Tech company {i} announces restructuring"
+        self.link = f"https://news.example.com/{i}"
+        self.published = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class _Feed:
+    def __init__(self, n):
+        self.entries = [_FeedEntry(i) for i in range(n)]
+
+
+def model_reply(prompt, rng=None):
+    """A plausible completion for each prompt shape the blueprints send to the model."""
+    rng = rng or random.Random(SEED)
+    if '"plan"' in prompt:
+        skills = [s.strip() for s in prompt.split("missing these skills:")[-1].split(".")[0].split(",")]
+        plan = [{
+            "skill": s,
+            "roadmap": {"topics": [f"{s} basics", f"{s} patterns"], "miniProject": f"{s} demo",
+                        "duration": "2 weeks", "certification": "None"}
+        } for s in skills if s]
+        return json.dumps({"plan": plan})
+    if '"projects"' in prompt:
+        return json.dumps({"projects": [
+            {"title": "Portfolio API", "description": "A small API.", "techStack": ["Python"], "difficulty": "Beginner"}
+        ]})
+    if "JSON list of 5" in prompt:
+        return json.dumps([{
+            "question": f"Synthetic question {rng.getrandbits(40):x}?",
+            "answer": "A",
+            "options": ["A", "B", "C", "D"]
+        } for _ in range(5)])
+    if "multiple-choice" in prompt:
+        return json.dumps({"question": "What is a closure?", "answer": "A function with its scope",
+                           "options": ["A loop", "A function with its scope", "A class", "A module"]})
+    if "one per line" in prompt:
+        return "\n".join(f"How would you debug scenario {rng.getrandbits(32):x}?" for _ in range(10))
+    if "Evaluate this technical interview answer" in prompt:
+        return "Logic: Mostly correct.\nGrammar: Clear.\nCorrected: Be more specific.\nExpected: Trade-offs."
+    if "question" in prompt.lower():
+        return "How would you design a rate limiter for a public API?"
+    return "Stubbed model reply."
+
+
+def _remotive_jobs(n=50, seed=SEED):
+    rng = random.Random(seed)
+    words = ["React", "Python", "GenAI", "AWS", "Docker", "Node.js", "AI", "Kubernetes", "team", "remote"]
+    return {"jobs": [{
+        "company_name": f"Company {rng.randint(0, 15)}",
+        "url": f"https://remotive.example.com/{i}",
+        "description": " ".join(rng.choice(words) for _ in range(300)),
+    } for i in range(n)]}
+
+
+def install_http_stubs(model_latency=0.0):
+    """
+    Replace outbound calls made by the blueprints with canned, in-process responses:
+    Ollama /api/generate, opentdb, Wikipedia, Remotive and the Google News feed.
+    `model_latency` (seconds) is slept on each model call to emulate inference time.
+    """
+    import time
+
+    import feedparser
+    import requests
+
+    jobs = _remotive_jobs()
+
+    def fake_post(url, json=None, timeout=None, **kwargs):
+        if model_latency:
+            time.sleep(model_latency)
+        reply = model_reply((json or {}).get("prompt", ""))
+        if (json or {}).get("stream"):
+            return StubStreamResponse(reply)
+        return StubResponse({"response": reply, "done": True})
+
+    def fake_get(url, params=None, timeout=None, **kwargs):
+        if "opentdb" in url:
+            return StubResponse({"response_code": 0, "results": [{
+                "question": "What does CPU stand for?", "correct_answer": "Central Processing Unit",
+                "incorrect_answers": ["Central Process Unit", "Computer Personal Unit", "Core Processing Unit"]
+            }]})
+        if "wikipedia" in url:
+            if params and params.get("action") == "parse":
+                return StubResponse({"parse": {"sections": [{"line": f"Section {i}"} for i in range(15)]}})
+            return StubResponse({"query": {"search": [{"title": "Python (programming language)"}]}})
+        if "remotive" in url:
+            return StubResponse(jobs)
+        return StubResponse({}, status_code=404)
+
+    requests.post = fake_post
+    requests.get = fake_get
+    feedparser.parse = lambda url, *a, **kw: _Feed(10)
@@ -0,0 +1,144 @@
+"""
+Throughput sweep for the production launcher: starts benchmarks/fake_ollama.py
+and gunicorn (gunicorn.conf.py) for each workers x threads combination, drives
+a mixed workload over real HTTP from concurrent clients, and reports req/s and
+latency percentiles.
+
+    cd python_backend
+    python -m benchmarks.load --configs 1x1 1x8 2x8 4x8 2x16 --clients 32 --duration 20
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+from benchmarks import fixtures
+from benchmarks.run import percentile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def workload(base_url):
+    pdf = fixtures.make_pdf(fixtures.resume_lines(60))
+    jd = fixtures.job_description(12)
+    stories = fixtures.FAILURE_STORIES
+    return [
+        lambda s: s.post(f"{base_url}/career-readiness", files={"resume_file": ("r.pdf", pdf, "application/pdf")},
+                         data={"job_description": jd}, timeout=180),
+        lambda s: s.post(f"{base_url}/api/role", json={"role": "Software Developers, Applications"}, timeout=180),
+        lambda s: s.post(f"{base_url}/analyze-failure", json={"story": random.choice(stories)}, timeout=180),
+        lambda s: s.post(f"{base_url}/api/skill-gap/generate",
+                         json={"role": "Software Developers, Applications", "currentSkills": "Python"}, timeout=180),
+        lambda s: s.post(f"{base_url}/api/chat", json={"message": "How do I learn Docker?"}, timeout=180),
+    ]
+
+
+def wait_for(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up")
+
+
+def drive(base_url, clients, duration):
+    calls = workload(base_url)
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        session = requests.Session()
+        while time.perf_counter() < stop_at:
+            t0 = time.perf_counter()
+            try:
+                ok = rng.choice(calls)(session).status_code < 500
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - t0
+            with lock:
+                latencies.append(elapsed)
+                if not ok:
+                    errors[0] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "throughput_rps": round(len(latencies) / wall, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configs", nargs="+", default=["1x1", "1x8", "2x8", "4x8", "2x16"],
+                        help="WORKERSxTHREADS combinations to sweep")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--model-port", type=int, default=11436)
+    parser.add_argument("--model-latency", default="fixed:0.3")
+    parser.add_argument("--tokens-per-sec", default="50")
+    parser.add_argument("--output", help="write the sweep results as JSON")
+    args = parser.parse_args(argv)
+
+    model = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fake_ollama", "--port", str(args.model_port),
+         "--latency", args.model_latency, "--tokens-per-sec", args.tokens_per_sec],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL
+    )
+    results = {}
+    try:
+        wait_for(f"http://127.0.0.1:{args.model_port}/api/tags")
+        for config in args.configs:
+            workers, threads = config.lower().split("x")
+            env = dict(os.environ, WEB_CONCURRENCY=workers, GUNICORN_THREADS=threads,
+                       BIND=f"127.0.0.1:{args.port}", AI_RATE_LIMIT_PER_MINUTE="0",
+                       OLLAMA_URL=f"http://127.0.0.1:{args.model_port}/api/generate")
+            server = subprocess.Popen(
+                [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"],
+                cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+                wait_for(f"{base_url}/metrics")
+                stats = drive(base_url, args.clients, args.duration)
+            finally:
+                server.terminate()
+                server.wait(timeout=60)
+            results[config] = stats
+            print(f"{config:>8}  {stats['throughput_rps']:>8} req/s  p50 {stats['p50_ms']:>8} ms  "
+                  f"p99 {stats['p99_ms']:>8} ms  errors {stats['errors']}")
+    finally:
+        model.terminate()
+        model.wait(timeout=10)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
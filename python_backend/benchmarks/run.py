@@ -0,0 +1,197 @@
+"""
+Reproducible benchmarks for the Flask API hot paths.
+
+Runs entirely in-process: the Flask test client drives the routes, Mongo is
+mongomock, Ollama and the external HTTP APIs are stubbed (see fixtures.py),
+and the O*NET tables are replaced with synthetic full-size ones.
+
+    cd python_backend
+    python -m benchmarks.run                       # writes benchmarks/results/bench-<timestamp>.json
+    python -m benchmarks.run --compare benchmarks/results/baseline.json --fail-on-regression
+"""
+import argparse
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+from benchmarks import fixtures
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(HERE, "results")
+RESUME_SIZES = {"small": 40, "medium": 220, "large": 1100} # lines of resume text (~45 lines per page)
+
+
+def load_app(model_latency=0.0):
+    """Build the app against in-memory mongomock, then swap in synthetic data and HTTP stubs."""
+    sys.path.insert(0, os.path.dirname(HERE))
+    os.environ["MONGO_URI"] = "mongomock://"
+    os.environ["AI_RATE_LIMIT_PER_MINUTE"] = "0" # every case comes from one client
+    from app import create_app
+    from core import onet
+    from core.db import get_db
+    import blueprints.readiness as readiness
+
+    app = create_app()
+    onet.occupations, onet.tech_data, readiness.skills_df = fixtures.onet_tables()
+    fixtures.install_http_stubs(model_latency=model_latency)
+
+    # Keep /ask on the DB-bank path (>= 100 questions means no background seeding)
+    get_db()["role_questions"].insert_many([
+        {"role": "frontend", "question": f"Synthetic frontend question {i}?", "answer": "A",
+         "options": ["A", "B", "C", "D"], "date": datetime.datetime.utcnow()}
+        for i in range(120)
+    ])
+    return app
+
+
+def build_cases():
+    jd = fixtures.job_description(14)
+    pdfs = {size: fixtures.make_pdf(fixtures.resume_lines(n)) for size, n in RESUME_SIZES.items()}
+    stories = fixtures.FAILURE_STORIES
+
+    def readiness(size, cold=True):
+        pdf = pdfs[size]
+
+        def run(c, i):
+            # A trailing comment makes each upload distinct bytes, so every iteration misses the
+            # parse cache and measures PDF extraction; the _cached case re-posts the same file
+            body = pdf + b"%% run %d %d\n" % (os.getpid(), next(nonce)) if cold else pdf
+            return c.post(
+                "/career-readiness",
+                data={"resume_file": (io.BytesIO(body), "resume.pdf"), "job_description": jd},
+                content_type="multipart/form-data"
+            )
+        return run
+
+    nonce = itertools.count()
+    cases = {f"career_readiness_{size}": readiness(size) for size in RESUME_SIZES}
+    cases["career_readiness_cached"] = readiness("medium", cold=False)
+    jds = json.dumps([fixtures.job_description(14, seed=fixtures.SEED + n) for n in range(10)])
+    cases["readiness_compare_10"] = lambda c, i: c.post(
+        "/career-readiness/compare",
+        data={"resume_file": (io.BytesIO(pdfs["medium"]), "resume.pdf"), "job_descriptions": jds},
+        content_type="multipart/form-data"
+    )
+    cases.update({
+        "ask_db_bank": lambda c, i: c.post("/ask", json={"role": "Frontend Developer", "exclude": []}),
+        "skill_gap_generate": lambda c, i: c.post(
+            "/api/skill-gap/generate",
+            json={"role": "Software Developers, Applications", "currentSkills": "Python, SQL, Git"}
+        ),
+        "role_info": lambda c, i: c.post("/api/role", json={"role": "Data Scientists"}),
+        "recommend_roles": lambda c, i: c.post(
+            "/api/roles/recommend", json={"skills": "Python, SQL, React, Docker, AWS, Git"}
+        ),
+        "analyze_failure": lambda c, i: c.post("/analyze-failure", json={"story": stories[i % len(stories)]}),
+        "shocks": lambda c, i: c.get("/api/shocks"),
+    })
+    return cases
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def measure(client, request_fn, iterations, warmup):
+    for i in range(warmup):
+        request_fn(client, i)
+
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        response = request_fn(client, i)
+        latencies.append(time.perf_counter() - t0)
+        if response.status_code >= 400:
+            errors += 1
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "throughput_rps": round(iterations / elapsed, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print per-case p50/p99 deltas against a baseline run; return the names that regressed."""
+    regressions = []
+    print(f"\n{'case':28} {'p50 base':>10} {'p50 now':>10} {'p99 base':>10} {'p99 now':>10}")
+    for name, now in results["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            print(f"{name:28} {'-':>10} {now['p50_ms']:>10} {'-':>10} {now['p99_ms']:>10}")
+            continue
+        flag = ""
+        if base["p50_ms"] and now["p50_ms"] > base["p50_ms"] * (1 + threshold):
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:28} {base['p50_ms']:>10} {now['p50_ms']:>10} {base['p99_ms']:>10} {now['p99_ms']:>10}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--only", nargs="*", help="run only these case names")
+    parser.add_argument("--model-latency", type=float, default=0.0, help="seconds slept per stubbed model call")
+    parser.add_argument("--output", help="result JSON path (default: benchmarks/results/bench-<timestamp>.json)")
+    parser.add_argument("--compare", help="baseline result JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p50 slowdown ratio counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    client = load_app(model_latency=args.model_latency).test_client()
+
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "model_latency": args.model_latency,
+        },
+        "cases": {},
+    }
+    for name, request_fn in build_cases().items():
+        if args.only and name not in args.only:
+            continue
+        stats = measure(client, request_fn, args.iterations, args.warmup)
+        results["cases"][name] = stats
+        print(f"{name:28} {stats['throughput_rps']:>9} req/s  p50 {stats['p50_ms']:>9} ms  "
+              f"p99 {stats['p99_ms']:>9} ms  errors {stats['errors']}")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"bench-{datetime.datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""
+One blueprint per subsystem. Each module imports only its own dependencies
+and data (pandas/PyPDF2 for readiness, nltk for interview, feedparser for
+shocks, ...) and exposes a `bp` that app.create_app registers.
+"""
@@ -0,0 +1,183 @@
+"""Admin routes: collection browser and export, write-buffer stats, request profiles."""
+import base64
+import datetime
+import json
+import time
+
+from bson import ObjectId
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+
+from core.auth import require_admin
+from core.db import bson_default, db
+from core.params import limit_param
+from core.write_buffer import analytics_buffer
+
+bp = Blueprint("admin", __name__)
+
+
+# -----------------------------
+# ADMIN ROUTES
+# -----------------------------
+# Collection browsing is keyset-paginated (never skip/offset) and documents are
+# serialized by MongoJSONProvider, so pages cost one indexed range read.
+ADMIN_PAGE_DEFAULT = 50
+ADMIN_PAGE_MAX = 500
+ADMIN_SORT_FIELDS = ("_id", "date")
+ADMIN_HIDDEN_FIELDS = ("password",)
+COLLECTION_COUNT_TTL = 60 # seconds
+_collection_counts = {} # name -> (expires_at, count)
+
+def _valid_collection(name):
+    return bool(name) and not name.startswith("system.") and "$" not in name
+
+def estimated_count(name):
+    """Cached estimated_document_count (metadata-only, no collection scan)."""
+    now = time.time()
+    cached = _collection_counts.get(name)
+    if cached and cached[0] > now:
+        return cached[1]
+    count = db[name].estimated_document_count()
+    _collection_counts[name] = (now + COLLECTION_COUNT_TTL, count)
+    return count
+
+def _encode_cursor(doc, sort_field):
+    key = {"id": str(doc["_id"]), "oid": isinstance(doc["_id"], ObjectId)}
+    if sort_field != "_id":
+        key["v"] = bson_default(doc[sort_field]) if isinstance(doc.get(sort_field), datetime.datetime) else doc.get(sort_field)
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+
+def _decode_cursor(cursor, sort_field):
+    """Turn an opaque `after` cursor into the keyset condition for the next (descending) page."""
+    key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    last_id = ObjectId(key["id"]) if key.get("oid") else key["id"]
+    if sort_field == "_id":
+        return {"_id": {"$lt": last_id}}
+    value = key.get("v")
+    if sort_field == "date" and isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    return {"$or": [
+        {sort_field: {"$lt": value}},
+        {sort_field: value, "_id": {"$lt": last_id}}
+    ]}
+
+def _collection_query(args):
+    """
+    Build (filter, projection, sort_field) from query params:
+    fields=a,b  -> projection;  f.<field>=value -> equality filter;
+    since/until -> ISO date range on `date`;  sort=_id|date.
+    """
+    sort_field = args.get("sort", "_id")
+    if sort_field not in ADMIN_SORT_FIELDS:
+        raise ValueError(f"sort must be one of {', '.join(ADMIN_SORT_FIELDS)}")
+
+    query = {}
+    for key, value in args.items():
+        if key.startswith("f."):
+            field = key[2:]
+            if not field or field.startswith("$"):
+                raise ValueError(f"Invalid filter field: {field}")
+            query[field] = ObjectId(value) if field == "_id" and ObjectId.is_valid(value) else value
+    date_range = {}
+    if args.get("since"):
+        date_range["$gte"] = datetime.datetime.fromisoformat(args["since"])
+    if args.get("until"):
+        date_range["$lt"] = datetime.datetime.fromisoformat(args["until"])
+    if date_range:
+        query["date"] = date_range
+    if sort_field != "_id":
+        query.setdefault(sort_field, {})
+        if isinstance(query[sort_field], dict):
+            query[sort_field]["$exists"] = True
+
+    fields = [f for f in args.get("fields", "").split(",") if f and not f.startswith("$")]
+    if fields:
+        projection = {f: 1 for f in fields if f not in ADMIN_HIDDEN_FIELDS}
+        projection.setdefault(sort_field, 1)
+    else:
+        projection = {f: 0 for f in ADMIN_HIDDEN_FIELDS}
+    return query, projection, sort_field
+
+@bp.route('/api/write-buffer', methods=['GET'])
+@require_admin
+def get_write_buffer_stats():
+    return jsonify(analytics_buffer.snapshot())
+
+@bp.route('/api/profiles', methods=['GET'])
+@require_admin
+def list_profiles():
+    """Recent request profiles, newest first, without their stack payloads."""
+    query = {}
+    if request.args.get("route"):
+        query["route"] = request.args["route"]
+    limit = limit_param(request.args.get("limit"), default=ADMIN_PAGE_DEFAULT, maximum=ADMIN_PAGE_MAX)
+    docs = db["profiles"].find(query, {"folded": 0, "top": 0}).sort("_id", -1).limit(limit)
+    return jsonify(list(docs))
+
+@bp.route('/api/profiles/<profile_id>', methods=['GET'])
+@require_admin
+def get_profile(profile_id):
+    """One profile; ?format=folded returns the raw folded stacks for flame-graph tools."""
+    if not ObjectId.is_valid(profile_id):
+        return jsonify({"error": "Invalid id"}), 400
+    doc = db["profiles"].find_one({"_id": ObjectId(profile_id)})
+    if not doc:
+        return jsonify({"error": "Not found"}), 404
+    if request.args.get("format") == "folded":
+        return Response(doc.get("folded", ""), mimetype="text/plain")
+    return jsonify(doc)
+
+@bp.route('/api/collections', methods=['GET'])
+@require_admin
+def get_collections():
+    cols = db.list_collection_names()
+    if request.args.get("counts"):
+        return jsonify([{"name": c, "count": estimated_count(c)} for c in cols])
+    return jsonify(cols)
+
+@bp.route('/api/collection/<name>', methods=['GET'])
+@require_admin
+def get_collection_data(name):
+    """One page of documents, newest first. The next page's cursor is in the X-Next-Cursor header."""
+    if not _valid_collection(name):
+        return jsonify({"error": "Invalid collection"}), 400
+    try:
+        query, projection, sort_field = _collection_query(request.args)
+        limit = max(1, min(int(request.args.get("limit", ADMIN_PAGE_DEFAULT)), ADMIN_PAGE_MAX))
+        after = request.args.get("after")
+        if after:
+            query = {"$and": [query, _decode_cursor(after, sort_field)]}
+
+        sort = [("_id", -1)] if sort_field == "_id" else [(sort_field, -1), ("_id", -1)]
+        data = list(db[name].find(query, projection).sort(sort).limit(limit))
+
+        response = jsonify(data)
+        if len(data) == limit:
+            response.headers["X-Next-Cursor"] = _encode_cursor(data[-1], sort_field)
+        response.headers["X-Total-Estimate"] = str(estimated_count(name))
+        return response
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@bp.route('/api/collection/<name>/export', methods=['GET'])
+@require_admin
+def export_collection(name):
+    """Stream a whole (optionally filtered/projected) collection as NDJSON without buffering it."""
+    if not _valid_collection(name):
+        return jsonify({"error": "Invalid collection"}), 400
+    try:
+        query, projection, _ = _collection_query(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def generate():
+        cursor = db[name].find(query, projection).batch_size(1000)
+        for doc in cursor:
+            yield json.dumps(doc, default=bson_default) + "\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={name}.ndjson"}
+    )
@@ -0,0 +1,319 @@
+"""Skill-integrity quiz (/ask): DB question bank, curated fallback bank and background AI seeding."""
+import datetime
+import html
+import random
+import threading
+import time
+
+import requests
+from flask import Blueprint, jsonify, request
+
+from core.auth import request_email
+from core.breaker import breaker
+from core.cohorts import cohort_stats
+from core.config import OLLAMA_URL
+from core.dashboard import user_summaries
+from core.jsonstream import JsonObjectStream, ollama_tokens
+from core.db import db
+from core.locks import seeding_locks
+from core.metrics import metrics, span
+from core.ratelimit import model_slot, request_model_slot
+from core.write_buffer import analytics_buffer
+
+bp = Blueprint("assessment", __name__)
+
+questions_collection = db["role_questions"]
+
+model_breaker = breaker("model")
+opentdb_breaker = breaker("opentdb")
+
+def normalize_role(role_raw):
+    """Normalize raw role strings to consistent bank keys."""
+    r = role_raw.lower()
+    if "front" in r: return "frontend"
+    if "back" in r: return "backend"
+    if "data" in r: return "data science"
+    if "ai" in r or "ml" in r: return "ai/ml"
+    if "python" in r: return "python"
+    if "devops" in r: return "devops"
+    return r.strip()
+
+MAX_STALE_BATCHES = 3 # consecutive seeding batches without a new question before giving up
+
+def save_question(role_key, q_obj):
+    """Store one generated question if it is well-formed and new for the role; returns whether it was saved."""
+    if not isinstance(q_obj, dict) or not all(k in q_obj for k in ["question", "answer", "options"]):
+        return False
+    if not isinstance(q_obj["question"], str) or not q_obj["question"].strip() or not isinstance(q_obj["options"], list):
+        return False
+    if questions_collection.find_one({"role": role_key, "question": q_obj["question"]}):
+        return False
+    questions_collection.insert_one({
+        "question": q_obj["question"],
+        "answer": q_obj["answer"],
+        "options": q_obj["options"],
+        "role": role_key,
+        "date": datetime.datetime.utcnow()
+    })
+    return True
+
+def generate_questions_background(role_key):
+    """Background worker to fill the database with unique AI questions for a role using BATCH generation."""
+    try:
+        if not seeding_locks.acquire(role_key):
+            return
+        print(f"--- Turbo Batch Seeding Started for: {role_key} ---")
+        
+        target_count = 100
+        current_count = questions_collection.count_documents({"role": role_key})
+        
+        role_context = {
+            "frontend": "React, JavaScript ES6+, CSS Grid/Flexbox, Redux, Browser APIs, Web Performance",
+            "backend": "Node.js, Express, Python/Django, SQL/NoSQL, REST APIs, Microservices, System Design",
+            "data science": "Pandas, NumPy, Scikit-learn, Statistics, Data Visualization, SQL, Feature Engineering",
+            "ai/ml": "Deep Learning, Transformers, PyTorch/TensorFlow, LLMs, NLP, Computer Vision, Neural Networks"
+        }
+        context_str = role_context.get(role_key, "core technical concepts and industry practices")
+
+        stale_batches = 0
+        while current_count < target_count and stale_batches < MAX_STALE_BATCHES:
+            try:
+                # Request 5 questions at once for speed
+                prompt = f"""
+                Generate exactly 5 unique, high-quality multiple-choice technical interview questions for a professional '{role_key}' role.
+                Focus area: {context_str}.
+                
+                The output must be strictly a JSON list of 5 objects:
+                [
+                  {{
+                    "question": "Question text",
+                    "answer": "Correct answer",
+                    "options": ["A", "B", "C", "D"]
+                  }},
+                  ...
+                ]
+                No preamble, no JSON tags. Just the raw JSON list.
+                """
+                
+                payload = {
+                    "model": "phi",
+                    "prompt": prompt,
+                    "stream": True,
+                    "format": "json",
+                    "options": {"temperature": 0.8, "num_predict": 1200}
+                }
+                
+                # Questions are parsed and saved as the model streams them, so one
+                # malformed or truncated object doesn't cost the rest of the batch
+                added = 0
+                started = time.perf_counter()
+                with model_slot(), span("ollama"):
+                    resp = model_breaker.call(requests.post, OLLAMA_URL, json=payload, timeout=40, stream=True)
+                    with resp:
+                        if resp.status_code == 200:
+                            parser = JsonObjectStream()
+                            for token in ollama_tokens(resp):
+                                for q_obj in parser.feed(token):
+                                    if save_question(role_key, q_obj):
+                                        if not added:
+                                            metrics.observe_span("seeding.first_question", time.perf_counter() - started)
+                                        added += 1
+                            if parser.malformed:
+                                print(f"Skipped {parser.malformed} malformed objects from the model for {role_key}")
+                current_count += added
+                # A model that keeps repeating itself (or failing) would otherwise loop forever
+                stale_batches = 0 if added else stale_batches + 1
+                print(f"--- Role '{role_key}' Progress: {current_count}/{target_count} ---")
+            except Exception as e:
+                print(f"Seeding error for {role_key}: {e}")
+                break 
+                
+        print(f"--- Turbo Batch Seeding Finished for: {role_key} (Total: {current_count}) ---")
+        seeding_locks.release(role_key)
+    except Exception as e:
+        print(f"Critical seeder failure: {e}")
+        seeding_locks.release(role_key)
+
+# -----------------------------
+# SKILL INTEGRITY CHECK (Quiz)
+# -----------------------------
+# -----------------------------
+# ROLE-BASED MCQ BANK (Curated for Speed & Accuracy)
+# -----------------------------
+ROLE_MCQ_BANK = {
+    "frontend": [
+        {"question": "What is the primary benefit of the Virtual DOM in React?", "options": ["It directly updates the browser DOM for speed", "It minimizes expensive browser DOM manipulations by diffing a copy", "It replaces the need for CSS", "It handles server-side databases"], "answer": "It minimizes expensive browser DOM manipulations by diffing a copy"},
+        {"question": "In CSS, what is the 'Box Model' composed of?", "options": ["Margin, Border, Padding, Content", "Header, Footer, Main, Aside", "Color, Font, Size, Weight", "Select, Input, Button, Label"], "answer": "Margin, Border, Padding, Content"},
+        {"question": "Which hook is used to handle side effects in functional React components?", "options": ["useState", "useContext", "useEffect", "useReducer"], "answer": "useEffect"},
+        {"question": "What does the 'asynchronous' nature of JavaScript mean?", "options": ["Code executes line by line and waits for completion", "Multiple blocks of code can run at the exact same time on one thread", "The engine can start long-running tasks and continue executing other code while waiting", "It only works on multi-core processors"], "answer": "The engine can start long-running tasks and continue executing other code while waiting"},
+        {"question": "What is 'Closure' in JavaScript?", "options": ["A function combined with its lexical environment", "A way to close the browser window", "A private class method", "The end of a loop"], "answer": "A function combined with its lexical environment"},
+        {"question": "Which React prop is used to pass data to child components?", "options": ["state", "props", "ref", "context"], "answer": "props"},
+        {"question": "What does 'z-index' control in CSS?", "options": ["Horizontal position", "Vertical position", "Stack order of overlapping elements", "Opacity level"], "answer": "Stack order of overlapping elements"},
+        {"question": "What is the purpose of 'key' prop in React lists?", "options": ["To style the elements", "To uniquely identify items for efficient domestic re-rendering", "To sort the list automatically", "To encrypt the data"], "answer": "To uniquely identify items for efficient domestic re-rendering"}
+    ],
+    "backend": [
+        {"question": "What is the primary purpose of a 'Middleware' in Express.js?", "options": ["To store large binary files", "To act as a database", "To execute functions between the request and response cycle", "To create CSS layouts"], "answer": "To execute functions between the request and response cycle"},
+        {"question": "Which HTTP status code represents a 'Not Found' error?", "options": ["200", "400", "404", "500"], "answer": "404"},
+        {"question": "What is the difference between SQL and NoSQL databases?", "options": ["SQL is faster, NoSQL is more secure", "SQL uses tables/schemas, NoSQL is often document/key-value based", "SQL is for web, NoSQL is for mobile", "There is no difference"], "answer": "SQL uses tables/schemas, NoSQL is often document/key-value based"},
+        {"question": "What is 'REST' in the context of APIs?", "options": ["A data encryption standard", "An architectural style for network-based applications", "A programming language for servers", "A database management system"], "answer": "An architectural style for network-based applications"},
+        {"question": "What does 'JWT' stand for in authentication?", "options": ["Java Web Token", "JSON Web Token", "Joint Web Team", "Just With Text"], "answer": "JSON Web Token"},
+        {"question": "In Node.js, what is the 'Event Loop'?", "options": ["A loop that handles UI clicks", "A mechanism that allows Node.js to perform non-blocking I/O operations", "A way to iterate over database results", "A security feature for preventing loops"], "answer": "A mechanism that allows Node.js to perform non-blocking I/O operations"}
+    ],
+    "data science": [
+        {"question": "In Python, which library is primarily used for data manipulation and analysis using DataFrames?", "options": ["NumPy", "Pandas", "Matplotlib", "Scikit-learn"], "answer": "Pandas"},
+        {"question": "What is 'Overfitting' in Machine Learning?", "options": ["When a model performs well on training data but poorly on unseen data", "When a model is too simple to capture patterns", "When the training data is too small", "When the model takes too long to train"], "answer": "When a model performs well on training data but poorly on unseen data"},
+        {"question": "What does 'Correlation' measure between two variables?", "options": ["The cause and effect relationship", "The linear relationship strength and direction", "The average value of both", "The total sum of variables"], "answer": "The linear relationship strength and direction"},
+        {"question": "Which visualization is best for showing the distribution of a single numerical variable?", "options": ["Scatter plot", "Histogram", "Line chart", "Heatmap"], "answer": "Histogram"}
+    ],
+    "ai/ml": [
+        {"question": "What does 'Transformer' architecture primarily depend on in NLP?", "options": ["Recurrent connections", "Convolutional layers", "Attention mechanisms", "Random forests"], "answer": "Attention mechanisms"},
+        {"question": "Which activation function is most commonly used in hidden layers of Deep Neural Networks?", "options": ["Sigmoid", "Tanh", "ReLU", "Linear"], "answer": "ReLU"},
+        {"question": "What is the purpose of 'Backpropagation'?", "options": ["To generate synthetic data", "To calculate gradients and update weights in a neural network", "To visualize the model architecture", "To stop the training early"], "answer": "To calculate gradients and update weights in a neural network"}
+    ]
+}
+
+# Topics the assessment page reports (a detected subject, else the chosen role). Other keys
+# still count toward overall accuracy but don't get a cohort of their own.
+ASSESSMENT_TOPICS = {t.lower(): t for t in [
+    "Python", "Java", "JavaScript", "Linux/OS", "Web Tech", "Database",
+    "Frontend Developer", "Backend Developer", "Fullstack Developer", "Data Scientist", "AI/ML Engineer",
+    "DevOps Engineer", "Mobile App Developer", "Blockchain Engineer", "Product Manager", "QA Engineer",
+]}
+MAX_SUMMARY_TOPICS = 20
+
+def record_assessment_cohorts(summary):
+    """Fold a finished assessment ({topic: {"correct", "total"}}) into the overall and per-topic accuracy cohorts."""
+    if not isinstance(summary, dict):
+        return
+    correct = total = 0
+    for topic, item in list(summary.items())[:MAX_SUMMARY_TOPICS]:
+        try:
+            t_correct, t_total = float(item["correct"]), float(item["total"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not 0 < t_total <= 1000 or not str(topic).strip():
+            continue
+        t_correct = max(0.0, min(t_correct, t_total))
+        correct += t_correct
+        total += t_total
+        cohort_stats.record("assessment_topic", 100 * t_correct / t_total,
+                            {"topic": [ASSESSMENT_TOPICS.get(str(topic).strip().lower())]})
+    if total:
+        cohort_stats.record("assessment", 100 * correct / total, {"all": ["all"]})
+
+@bp.route('/ask', methods=['POST'])
+def ask_api():
+    try:
+        data_in = request.json or {}
+        
+        # 1. Save results if provided
+        user_email = request_email(data_in.get("email"))
+        if user_email and "summary" in data_in:
+             now = datetime.datetime.utcnow()
+             record_assessment_cohorts(data_in["summary"])
+             user_summaries.assessment_saved(user_email, data_in["summary"], now)
+             analytics_buffer.add("assessment_results", {
+                 "email": user_email,
+                 "summary": data_in["summary"],
+                 "date": now
+             })
+             return jsonify({"msg": "Saved"})
+
+        # 2. Identify & Normalize Role
+        role_input = data_in.get("role", "").strip()
+        role_key = normalize_role(role_input)
+        exclude_list = data_in.get("exclude", []) # List of question texts already seen
+        amount = data_in.get("amount", 1) # Support batching for "Mock Experience"
+        
+        results = []
+        
+        # --- STRATEGY A: COMPREHENSIVE DB BANK ---
+        if role_key:
+            db_count = questions_collection.count_documents({"role": role_key})
+            if db_count < 100 and model_breaker.available() and not seeding_locks.is_held(role_key):
+                threading.Thread(target=generate_questions_background, args=(role_key,), daemon=True).start()
+
+            if db_count > 0:
+                pipeline = [
+                    {"$match": {"role": role_key, "question": {"$nin": exclude_list}}},
+                    {"$sample": {"size": amount}}
+                ]
+                results = list(questions_collection.aggregate(pipeline))
+                if len(results) >= amount:
+                    return jsonify([{"question": q["question"], "answer": q["answer"], "options": q["options"]} for q in results] if amount > 1 else {
+                        "question": results[0]["question"],
+                        "answer": results[0]["answer"],
+                        "options": results[0]["options"]
+                    })
+            
+            # --- Map to Static Bank Fallback ---
+            if role_key in ROLE_MCQ_BANK:
+                available_bank = [q for q in ROLE_MCQ_BANK[role_key] if q["question"] not in exclude_list]
+                if len(available_bank) >= amount:
+                    selected = random.sample(available_bank, amount)
+                    return jsonify(selected if amount > 1 else selected[0])
+                elif available_bank:
+                    # If not enough available, take what we have
+                    return jsonify(available_bank if amount > 1 else available_bank[0])
+        
+        # --- STRATEGY B: AI GENERATION FOR NICHE ROLES (Priority 2) ---
+        if role_input:
+            try:
+                ollama_url = OLLAMA_URL
+                prompt = f"""
+                Generate a single multiple-choice technical interview question for a '{role_input}' role.
+                Avoid these topics: {', '.join(exclude_list[-3:])}
+                Strictly Technical. Use JSON format.
+                """
+                
+                payload = {
+                    "model": "phi",
+                    "prompt": prompt,
+                    "stream": False,
+                    "format": "json",
+                    "options": {"temperature": 0.7, "num_predict": 150}
+                }
+                
+                with request_model_slot(), span("ollama"): # ModelBusy falls through to strategy C
+                    resp = model_breaker.call(requests.post, ollama_url, json=payload, timeout=10)
+                if resp.status_code == 200:
+                    import json
+                    ai_data = resp.json().get("response", "")
+                    start = ai_data.find("{")
+                    end = ai_data.rfind("}") + 1
+                    if start != -1 and end != -1:
+                        return jsonify(json.loads(ai_data[start:end]))
+            except Exception as e:
+                print(f"AI Fallback Failed: {e}")
+
+        # --- STRATEGY C: PUBLIC API FALLBACK (General CS) ---
+        try:
+            api_url = "https://opentdb.com/api.php?amount=1&category=18&type=multiple"
+            with span("http.opentdb"):
+                response = opentdb_breaker.call(requests.get, api_url, timeout=5)
+            data = response.json()
+
+            if data['response_code'] == 0:
+                item = data['results'][0]
+                question = html.unescape(item['question'])
+                answer = html.unescape(item['correct_answer'])
+                options = [html.unescape(opt) for opt in item['incorrect_answers']]
+                options.append(answer)
+                random.shuffle(options)
+
+                return jsonify({
+                    "question": question,
+                    "answer": answer,
+                    "options": options
+                })
+        except:
+            pass
+        
+        # Final Final Fallback
+        return jsonify({
+            "question": "What is the time complexity of Binary Search?",
+            "answer": "O(log n)",
+            "options": ["O(n)", "O(log n)", "O(n^2)", "O(1)"]
+        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,177 @@
+"""Signup, login and the cached user profile."""
+import datetime
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import bcrypt
+import jwt
+from bson import ObjectId
+from flask import Blueprint, g, jsonify, request
+from pymongo import ReturnDocument
+
+from core.auth import require_auth
+from core.config import SECRET_KEY
+from core.dashboard import user_summaries
+from core.db import db
+
+bp = Blueprint("auth", __name__)
+
+users_collection = db["users"]
+
+@bp.route('/api/auth/signup', methods=['POST'])
+def signup():
+    data = request.json
+    name = data.get('name')
+    email = data.get('email')
+    password = data.get('password')
+
+    if users_collection is None:
+        return jsonify({"msg": "Database unavailable"}), 503
+
+    if not all([name, email, password]):
+        return jsonify({"msg": "Missing fields"}), 400
+
+    if users_collection.find_one({"email": email}):
+        return jsonify({"msg": "User already exists"}), 400
+
+    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+
+    user_id = users_collection.insert_one({
+        "name": name,
+        "email": email,
+        "password": hashed_password,
+        "created_at": datetime.datetime.utcnow(),
+        "profile": {} # Empty profile initially
+    }).inserted_id
+    user_summaries.profile_changed(email, {}, name=name)
+
+    token = jwt.encode({
+        "user_id": str(user_id),
+        "email": email,
+        "exp": datetime.datetime.utcnow() + datetime.timedelta(days=7)
+    }, SECRET_KEY, algorithm="HS256")
+
+    return jsonify({
+        "token": token,
+        "user": {"id": str(user_id), "name": name, "email": email}
+    })
+
+@bp.route('/api/auth/login', methods=['POST'])
+def login():
+    data = request.json
+    email = data.get('email')
+    password = data.get('password')
+    if users_collection is None:
+        return jsonify({"msg": "Database unavailable"}), 503
+
+    user = users_collection.find_one({"email": email})
+    if not user:
+        return jsonify({"msg": "Invalid credentials"}), 401
+
+    if bcrypt.checkpw(password.encode('utf-8'), user['password']):
+        token = jwt.encode({
+            "user_id": str(user['_id']),
+            "email": email,
+            "exp": datetime.datetime.utcnow() + datetime.timedelta(days=7)
+        }, SECRET_KEY, algorithm="HS256")
+        
+        return jsonify({
+            "token": token,
+            "user": {"id": str(user['_id']), "name": user['name'], "email": email}
+        })
+    
+    return jsonify({"msg": "Invalid credentials"}), 401
+
+# -----------------------------
+# PROFILE CACHE
+# -----------------------------
+# Profiles are read with a {"profile": 1} projection (never the password hash)
+# and cached per user_id together with their ETag. Writes go through
+# find_one_and_update and refresh the cache with the stored document.
+# Per-process cache: set PROFILE_CACHE_SIZE=0 when several workers serve the same users
+PROFILE_CACHE_SIZE = int(os.environ.get("PROFILE_CACHE_SIZE", "4096"))
+_profile_cache = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+def _profile_etag(profile):
+    body = json.dumps(profile, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(body).hexdigest()
+
+def _cache_profile(user_id, profile):
+    entry = (profile, _profile_etag(profile))
+    with _profile_cache_lock:
+        _profile_cache[user_id] = entry
+        _profile_cache.move_to_end(user_id)
+        while len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+    return entry
+
+def get_cached_profile(user_id):
+    """Return (profile, etag) for a user, reading only the profile field on a miss."""
+    with _profile_cache_lock:
+        entry = _profile_cache.get(user_id)
+        if entry is not None:
+            _profile_cache.move_to_end(user_id)
+            return entry
+    doc = users_collection.find_one({"_id": ObjectId(user_id)}, {"profile": 1})
+    return _cache_profile(user_id, (doc or {}).get("profile") or {})
+
+def invalidate_profile(user_id):
+    with _profile_cache_lock:
+        _profile_cache.pop(user_id, None)
+
+@bp.route('/api/user/profile', methods=['GET', 'POST', 'PATCH'])
+@require_auth
+def user_profile():
+    user_id = g.user['user_id']
+
+    if request.method == 'GET':
+        profile, etag = get_cached_profile(user_id)
+        response = jsonify(profile)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response.make_conditional(request)
+
+    profile_data = request.json or {}
+    if not isinstance(profile_data, dict):
+        return jsonify({"msg": "Profile must be an object"}), 400
+    if any(not k or "." in k or k.startswith("$") for k in profile_data):
+        return jsonify({"msg": "Invalid profile field name"}), 400
+
+    if request.method == 'POST':
+        # POST replaces the whole profile: fields left out of the object are dropped
+        update = {"$set": {"profile": profile_data}}
+    else:
+        # PATCH: only the posted fields are written, a null value removes the field
+        update = {}
+        to_set = {f"profile.{k}": v for k, v in profile_data.items() if v is not None}
+        to_unset = {f"profile.{k}": "" for k, v in profile_data.items() if v is None}
+        if to_set:
+            update["$set"] = to_set
+        if to_unset:
+            update["$unset"] = to_unset
+        if not update:
+            return jsonify({"msg": "Profile updated"})
+
+    try:
+        doc = users_collection.find_one_and_update(
+            {"_id": ObjectId(user_id)},
+            update,
+            projection={"profile": 1},
+            return_document=ReturnDocument.AFTER
+        )
+    except Exception:
+        invalidate_profile(user_id)
+        raise
+    if doc is None:
+        invalidate_profile(user_id)
+        return jsonify({"msg": "User not found"}), 404
+
+    _, etag = _cache_profile(user_id, doc.get("profile") or {})
+    user_summaries.profile_changed(g.user.get('email'), doc.get("profile") or {})
+    response = jsonify({"msg": "Profile updated"})
+    response.set_etag(etag)
+    return response
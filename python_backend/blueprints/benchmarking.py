@@ -0,0 +1,82 @@
+"""Cohort benchmarking: readiness, interview and assessment distributions from incremental cohort stats."""
+from flask import Blueprint, jsonify, request
+
+from core.auth import token_email
+from core.cohorts import MIN_COHORT_SIZE, cohort_stats, histogram_percentile
+from core.dashboard import user_summaries
+
+bp = Blueprint("benchmarking", __name__)
+
+def _names(value):
+    return [v.strip() for v in (value or "").split(",") if v.strip()][:20]
+
+def _percentile(dist, value):
+    if not dist or value is None or dist["count"] < MIN_COHORT_SIZE:
+        return None
+    return histogram_percentile(dist["histogram"], dist["count"], value)
+
+def _assessment_accuracy(summary):
+    correct = total = 0
+    for item in (summary or {}).values():
+        if isinstance(item, dict) and item.get("total"):
+            correct += item.get("correct", 0)
+            total += item["total"]
+    return 100 * correct / total if total else None
+
+@bp.route("/api/benchmarking", methods=["GET"])
+def benchmarking():
+    """
+    Cohort distributions (count, mean, std, histogram) for readiness scores
+    (overall, by target role, per-skill match rate), interview scores (overall
+    and by interview role) and assessment accuracy (overall and by topic),
+    plus the caller's own percentiles when they send a bearer token.
+    """
+    email = token_email() # the "you" block is private, so never for a raw email parameter
+    summary = user_summaries.get(email) if email else None
+    role = request.args.get("role") or ((summary or {}).get("profile") or {}).get("domain")
+    recent_interviews = ((summary or {}).get("interviews") or {}).get("recent") or []
+    interview_role = request.args.get("interviewRole") or (recent_interviews[-1]["role"] if recent_interviews else role)
+    skills = _names(request.args.get("skills"))
+    topics = _names(request.args.get("topics"))
+
+    wanted = [("readiness", "all", "all"), ("interview", "all", "all"), ("assessment", "all", "all")]
+    if role:
+        wanted.append(("readiness", "role", role))
+    if interview_role:
+        wanted.append(("interview", "role", interview_role))
+    wanted += [("skill_match", "skill", s) for s in skills] + [("assessment_topic", "topic", t) for t in topics]
+    dists = cohort_stats.get(wanted)
+
+    result = {
+        "minCohortSize": MIN_COHORT_SIZE,
+        "readiness": {
+            "overall": dists[("readiness", "all", "all")],
+            "role": dists.get(("readiness", "role", role)),
+        },
+        "skills": [dists[("skill_match", "skill", s)] or {"cohort": s, "count": 0} for s in skills],
+        "interviews": {
+            "overall": dists[("interview", "all", "all")],
+            "role": dists.get(("interview", "role", interview_role)),
+        },
+        "assessments": {
+            "overall": dists[("assessment", "all", "all")],
+            "topics": [dists[("assessment_topic", "topic", t)] or {"cohort": t, "count": 0} for t in topics],
+        },
+    }
+
+    if summary:
+        last_scan = ((summary.get("readiness") or {}).get("last") or {}).get("score")
+        last_interview = recent_interviews[-1] if recent_interviews else None
+        accuracy = _assessment_accuracy(((summary.get("assessments") or {}).get("last") or {}).get("summary"))
+        result["you"] = {
+            "readinessScore": last_scan,
+            "readinessPercentile": _percentile(result["readiness"]["role"] or result["readiness"]["overall"], last_scan),
+            "interviewScore": last_interview["total_score"] if last_interview else None,
+            "interviewPercentile": _percentile(
+                result["interviews"]["role"] or result["interviews"]["overall"],
+                last_interview.get("percent") if last_interview else None
+            ),
+            "assessmentAccuracy": round(accuracy, 2) if accuracy is not None else None,
+            "assessmentPercentile": _percentile(result["assessments"]["overall"], accuracy),
+        }
+    return jsonify(result)
@@ -0,0 +1,58 @@
+"""Career mentor chatbot, proxied to Ollama."""
+import requests
+from flask import Blueprint, jsonify, request
+
+from core.breaker import CircuitOpen, breaker
+from core.config import OLLAMA_URL
+from core.metrics import span
+from core.ratelimit import model_route
+
+bp = Blueprint("chat", __name__)
+
+model_breaker = breaker("model")
+
+# ---------------- AI CHATBOT (Ollama Proxy) ---------------- #
+
+@bp.route("/api/chat", methods=["POST"])
+@model_route
+def chat_ai():
+    try:
+        data = request.json
+        user_message = data.get("message", "")
+        
+        if not user_message:
+            return jsonify({"reply": "Please ask something."})
+
+        # Proxy to local Ollama instance
+        ollama_url = OLLAMA_URL
+        payload = {
+            "model": "phi", # Ensure user has this model or make it configurable
+            "prompt": f"""
+You are a professional career mentor and coding assistant.
+
+User Question:
+{user_message}
+
+Rules:
+- Give clear and helpful answer
+- Use simple English
+- Be professional
+- If technical question, explain properly
+            """,
+            "stream": False,
+            "options": {"num_predict": 200}
+        }
+        
+        try:
+            with span("ollama"):
+                response = model_breaker.call(requests.post, ollama_url, json=payload, timeout=120)
+            response_json = response.json()
+            return jsonify({"reply": response_json.get("response", "")})
+        except (requests.exceptions.ConnectionError, CircuitOpen):
+            return jsonify({
+                "reply": "AI server is not running. Please start Ollama locally using: ollama run phi"
+            })
+
+    except Exception as e:
+        print(f"Chatbot error: {e}")
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,13 @@
+"""Aggregated dashboard: one round-trip, served from the materialized user summary."""
+from flask import Blueprint, g, jsonify
+
+from core.auth import require_auth
+from core.dashboard import dashboard_view, user_summaries
+
+bp = Blueprint("dashboard", __name__)
+
+@bp.route("/api/dashboard", methods=["GET"])
+@require_auth
+def dashboard():
+    # Profile and activity are private: identity comes from the token only
+    return jsonify(dashboard_view(user_summaries.get(g.user["email"])))
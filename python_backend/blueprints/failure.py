@@ -0,0 +1,251 @@
+"""Failure intelligence engine: rule-based diagnosis of rejection stories."""
+import datetime
+import hashlib
+import json
+
+from flask import Blueprint, jsonify, request
+
+from core.auth import request_email, require_admin
+from core.dashboard import user_summaries
+from core.db import db
+from core.write_buffer import analytics_buffer
+
+bp = Blueprint("failure", __name__)
+
+
+# -----------------------------
+# FAILURE INTELLIGENCE ENGINE
+# -----------------------------
+# Diagnosis is data-driven: FAILURE_KEYWORDS names keyword groups, and
+# FAILURE_RULES / SENTIMENT_RULES are evaluated top to bottom (first match
+# wins) against the set of groups found in the story. All keywords are
+# compiled once into a trie that is walked from every word start, so a
+# single pass over the story returns every group hit. Keywords match at
+# the start of a word ("reject" hits "rejected", "hr" no longer hits "three").
+FAILURE_KEYWORDS = {
+    "interview": ["interview", "call", "meeting", "hr", "screen", "round", "coding", "whiteboard", "live", "assessment", "test", "challenge", "explained", "nervous", "froze", "anxiety"],
+    "anxiety": ["nervous", "anxiety", "froze", "scared", "blank", "panic", "shaking"],
+    "technical": ["code", "coding", "technical", "system design", "whiteboard", "algorithm", "datastructure", "live", "syntax"],
+    "resume": ["resume", "cv", "application", "applied", "ats", "apply", "submitted"],
+    "resume_depth": ["content", "short", "empty"],
+    "market": ["ghosted", "no reply", "ignored", "silence", "reject", "callbacks", "response"],
+    "skill_gap": ["skill", "stack", "learn", "experience", "qualified", "requirements", "knowledge"],
+    "negative": ["depressed", "sad", "hate", "quit", "useless", "stupid"],
+    "positive": ["hope", "learn", "better", "next", "improve"],
+}
+
+FAILURE_RULES = [
+    {
+        "when": ["interview", "anxiety"],
+        "type": "Interview",
+        "diagnosis": "Performance Anxiety / Nerves",
+        "actionPlan": [
+            "Practice 'Mock Interviews' to desensitize the fear response.",
+            "Use breathing techniques (4-7-8 method) before checking in.",
+            "Focus on 'thinking out loud' even if you are stuck, rather than staying silent."
+        ]
+    },
+    {
+        "when": ["interview", "technical"],
+        "type": "Interview",
+        "diagnosis": "Technical Proficiency Gap",
+        "actionPlan": [
+            "Practice 1 LeetCode Medium problem daily under a timer.",
+            "Review 'System Design' concepts (Scalability, CAP Theorem).",
+            "Do a mock technical interview on Pramp or with a peer."
+        ]
+    },
+    {
+        "when": ["interview"],
+        "type": "Interview",
+        "diagnosis": "Communication / Behavioral Gap",
+        "actionPlan": [
+            "Prepare 5 'STAR' method stories (Situation, Task, Action, Result).",
+            "Research the company's core values to align your answers.",
+            "Practice speaking slowly and clearly using the Pyramid Principle."
+        ]
+    },
+    {
+        "when": ["resume", "resume_depth"],
+        "type": "Resume",
+        "diagnosis": "Lack of Resume Depth",
+        "actionPlan": [
+            "Expand your resume to at least 500 words.",
+            "Use the 'XYZ' formula for bullet points (Accomplished [X] as measured by [Y] doing [Z]).",
+            "Run your resume through an ATS scanner."
+        ]
+    },
+    {
+        "when": ["resume"],
+        "type": "Resume",
+        "diagnosis": "Resume Optimization Issue",
+        "actionPlan": [
+            "Quantify your achievements with metrics (%, $, time saved).",
+            "Tailor keywords to the specific job description.",
+            "Ensure your formatting is ATS-friendly (single column, standard fonts)."
+        ]
+    },
+    {
+        "when": ["market"],
+        "type": "Market",
+        "diagnosis": "Low Response Rate / Market Fit",
+        "actionPlan": [
+            "Reach out directly to hiring managers on LinkedIn/Email.",
+            "Apply within the first 24 hours of a job posting.",
+            "Get a referral from an employee (boosts chances by 10x)."
+        ]
+    },
+    {
+        "when": ["skill_gap"],
+        "type": "Skill Gap",
+        "diagnosis": "Perceived Skill or Experience Gap",
+        "actionPlan": [
+            "Build a portfolio project using the required tech stack.",
+            "Contribute to Open Source to prove real-world skills.",
+            "Obtain a certification to validate your knowledge."
+        ]
+    },
+]
+
+DEFAULT_FAILURE_RESULT = {
+    "type": "General",
+    "diagnosis": "General Career Setback",
+    "actionPlan": ["Reflect on your career goals.", "Network with peers in your industry."]
+}
+
+SENTIMENT_RULES = [
+    {"when": ["negative"], "sentiment": "Negative"},
+    {"when": ["positive"], "sentiment": "Positive"},
+]
+
+class KeywordMatcher:
+    """Trie over keyword -> group names, matched from every word start in one pass."""
+
+    _END = "\0"
+
+    def __init__(self, groups):
+        self.root = {}
+        for group, words in groups.items():
+            for word in words:
+                node = self.root
+                for ch in word.lower():
+                    node = node.setdefault(ch, {})
+                node.setdefault(self._END, set()).add(group)
+
+    def groups(self, text):
+        """Return the set of group names whose keywords occur in `text`."""
+        text = " ".join(text.lower().split())
+        hits = set()
+        n = len(text)
+        prev_alnum = False
+        for i, ch in enumerate(text):
+            is_alnum = ch.isalnum()
+            if is_alnum and not prev_alnum:
+                # Walk by index (no slice copy), stopping as soon as the trie runs out
+                node = self.root
+                for j in range(i, n):
+                    node = node.get(text[j])
+                    if node is None:
+                        break
+                    if self._END in node:
+                        hits |= node[self._END]
+            prev_alnum = is_alnum
+        return hits
+
+FAILURE_MATCHER = KeywordMatcher(FAILURE_KEYWORDS)
+FAILURE_RULES_VERSION = hashlib.sha1(
+    json.dumps([FAILURE_KEYWORDS, FAILURE_RULES, SENTIMENT_RULES], sort_keys=True).encode("utf-8")
+).hexdigest()[:12]
+
+def classify_failure(story):
+    """Run the compiled rule table over a story and return the diagnosis payload."""
+    hits = FAILURE_MATCHER.groups(story)
+    rule = next((r for r in FAILURE_RULES if hits.issuperset(r["when"])), DEFAULT_FAILURE_RESULT)
+    sentiment = next((r["sentiment"] for r in SENTIMENT_RULES if hits.issuperset(r["when"])), "Neutral")
+    return {
+        "diagnosis": rule["diagnosis"],
+        "type": rule["type"],
+        "sentiment": sentiment,
+        "actionPlan": list(rule["actionPlan"])
+    }
+
+@bp.route("/analyze-failure", methods=["POST"])
+def analyze_failure():
+    try:
+        data = request.json
+        story = data.get("story", "")
+        
+        if not story or len(story) < 10:
+            return jsonify({"error": "Story too short"}), 400
+
+        result = classify_failure(story)
+
+        # Save to DB
+        # Identity comes from the bearer token, or the legacy 'email' payload field
+        user_email = request_email(data.get("email"))
+        if user_email:
+             now = datetime.datetime.utcnow()
+             user_summaries.failure_analyzed(user_email, result, now)
+             analytics_buffer.add("failure_stories", {
+                 "email": user_email,
+                 "story": story,
+                 "result": result,
+                 "rules_version": FAILURE_RULES_VERSION,
+                 "date": now
+             })
+
+        return jsonify(result)
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@bp.route("/api/failures/reclassify", methods=["POST"])
+@require_admin
+def reclassify_failures():
+    """Re-run the current rule table over stored failure_stories classified by an older version."""
+    try:
+        # The rule table has only a handful of distinct outcomes, so ids are grouped by
+        # outcome and each group is written with a single update_many per batch.
+        batch_size = 500
+        collection = db["failure_stories"]
+        scanned = 0
+        updated = 0
+        pending = {} # outcome key -> (result, [ids])
+        unchanged_ids = []
+
+        def flush():
+            for result, ids in pending.values():
+                collection.update_many(
+                    {"_id": {"$in": ids}},
+                    {"$set": {"result": result, "rules_version": FAILURE_RULES_VERSION}}
+                )
+            if unchanged_ids:
+                collection.update_many(
+                    {"_id": {"$in": unchanged_ids}},
+                    {"$set": {"rules_version": FAILURE_RULES_VERSION}}
+                )
+            pending.clear()
+            unchanged_ids.clear()
+
+        cursor = collection.find(
+            {"rules_version": {"$ne": FAILURE_RULES_VERSION}},
+            {"story": 1, "result": 1}
+        ).batch_size(batch_size)
+
+        for doc in cursor:
+            scanned += 1
+            result = classify_failure(doc.get("story", ""))
+            if result == doc.get("result"):
+                unchanged_ids.append(doc["_id"])
+            else:
+                key = (result["diagnosis"], result["sentiment"])
+                pending.setdefault(key, (result, []))[1].append(doc["_id"])
+                updated += 1
+            if scanned % batch_size == 0:
+                flush()
+        flush()
+
+        return jsonify({"rules_version": FAILURE_RULES_VERSION, "scanned": scanned, "updated": updated})
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,32 @@
+"""Job-description corpus: similar JDs and how other users scored on a JD."""
+from flask import Blueprint, jsonify, request
+
+from core.auth import token_email
+from core.jdindex import jd_index
+from core.params import limit_param
+
+bp = Blueprint("jobs", __name__)
+
+@bp.route("/api/jd/similar", methods=["POST"])
+def similar_to_text():
+    data = request.json or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "Body must be an object"}), 400
+    text = data.get("job_description", "")
+    if not isinstance(text, str) or not text.strip():
+        return jsonify({"error": "Job description is required"}), 400
+    return jsonify({"similar": jd_index.similar(text=text, limit=limit_param(data.get("limit")))})
+
+@bp.route("/api/jd/<jd_id>/similar", methods=["GET"])
+def similar_to_jd(jd_id):
+    similar = jd_index.similar(jd_id=jd_id, limit=limit_param(request.args.get("limit")))
+    if similar is None:
+        return jsonify({"error": "Job description not found"}), 404
+    return jsonify({"jd_id": jd_id, "similar": similar})
+
+@bp.route("/api/jd/<jd_id>/scores", methods=["GET"])
+def jd_scores(jd_id):
+    summary = jd_index.score_summary(jd_id, token_email()) # yourScore only for the token's user
+    if summary is None:
+        return jsonify({"error": "Job description not found"}), 404
+    return jsonify(summary)
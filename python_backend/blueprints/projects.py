@@ -0,0 +1,127 @@
+"""Portfolio project generator."""
+import datetime
+
+import requests
+from flask import Blueprint, jsonify, request
+
+from core.auth import request_email, token_email
+from core.breaker import CircuitOpen, breaker
+from core.config import OLLAMA_URL
+from core.dashboard import user_summaries
+from core.metrics import span
+from core.ratelimit import model_route
+from core.resume import resumes
+from core.write_buffer import analytics_buffer
+
+bp = Blueprint("projects", __name__)
+
+model_breaker = breaker("model")
+
+# -----------------------------
+# PROJECT GENERATOR
+# -----------------------------
+@bp.route("/api/projects/generate", methods=["POST"])
+@model_route
+def generate_projects():
+    try:
+        data = request.json
+        role = data.get("role", "")
+        current_skills = data.get("currentSkills", "")
+        missing_skills = data.get("missingSkills", "")
+        user_email = request_email(data.get("email"))
+
+        # No skills given: prefill from the referenced (or the signed-in user's latest) parsed resume
+        if not current_skills:
+            parsed = resumes.for_request(data.get("resumeId"), token_email())
+            if parsed:
+                current_skills = ", ".join(parsed["skills"])
+
+        # Use Ollama to generate projects
+        prompt = f"""
+        Generate 3 unique, impressive project ideas for a {role} to build their portfolio.
+        User has these skills: {current_skills}.
+        User wants to learn: {missing_skills}.
+        
+        For each project provide:
+        - Title
+        - Description (2 sentences)
+        - Tech Stack (list)
+        - Difficulty (Beginner/Intermediate/Advanced)
+        
+        Return ONLY valid JSON in this format:
+        {{
+            "projects": [
+                {{
+                    "title": "...",
+                    "description": "...",
+                    "techStack": ["..."],
+                    "difficulty": "..."
+                }}
+            ]
+        }}
+        """
+
+        ollama_url = OLLAMA_URL
+        payload = {
+            "model": "phi", 
+            "prompt": prompt,
+            "stream": False,
+            "format": "json", # Force JSON mode if supported or parse manually
+            "options": {"num_predict": 1000}
+        }
+
+        try:
+            try:
+                with span("ollama"):
+                    response = model_breaker.call(requests.post, ollama_url, json=payload, timeout=60)
+                ai_text = response.json().get("response", "")
+            except (CircuitOpen, requests.RequestException):
+                ai_text = "" # model unreachable: go straight to the template projects below
+            
+            # Simple cleanup to ensure we get JSON
+            # In a real app, use a robust parser or stricter prompting
+            import json
+            try:
+                # Find the first { and last }
+                start = ai_text.find('{')
+                end = ai_text.rfind('}') + 1
+                json_str = ai_text[start:end]
+                project_data = json.loads(json_str)
+            except:
+                 # Fallback mock data if AI fails to return proper JSON
+                 project_data = {
+                     "projects": [
+                         {
+                             "title": f"AI-Powered {role} Dashboard",
+                             "description": "Build a dashboard that visualizes data using the requested tech stack.",
+                             "techStack": ["React", "Python", "MongoDB"],
+                             "difficulty": "Intermediate"
+                         },
+                         {
+                             "title": f"Real-time {role} Collaboration Tool",
+                             "description": "A tool for teams to collaborate in real-time.",
+                             "techStack": ["Socket.io", "Node.js", "Redis"],
+                             "difficulty": "Advanced"
+                         }
+                     ]
+                 }
+
+            # Persist
+            if user_email:
+                now = datetime.datetime.utcnow()
+                user_summaries.projects_generated(user_email, role, project_data.get("projects", []), now)
+                analytics_buffer.add("generated_projects", {
+                    "email": user_email,
+                    "role": role,
+                    "projects": project_data.get("projects", []),
+                     "date": now
+                })
+
+            return jsonify(project_data)
+
+        except Exception as e:
+            print(f"Ollama Error: {e}")
+            return jsonify({"error": "AI Generation failed"}), 500
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,287 @@
+"""Career readiness scan: resume PDF vs job description, scored against the O*NET skills list."""
+import datetime
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from flask import Blueprint, g, jsonify, request
+
+from core.auth import request_email, require_auth, token_email
+from core.cohorts import cohort_stats, role_cohort
+from core.dashboard import user_summaries
+from core.history import readiness_history
+from core.jdindex import jd_hash, jd_index
+from core.config import BASE_DIR
+from core.metrics import span
+from core.resume import resumes
+from core.write_buffer import analytics_buffer
+
+bp = Blueprint("readiness", __name__)
+
+MAX_COMPARE_JDS = int(os.environ.get("MAX_COMPARE_JDS", "20"))
+
+# -----------------------------
+# CLEAN TEXT
+# -----------------------------
+def clean_text(text):
+    text = str(text).lower()
+    text = re.sub(r'[^a-z0-9 ]', ' ', text)
+    return text
+
+# -----------------------------
+# LOAD O*NET SKILLS
+# -----------------------------
+# Initialize skills_df as global but load safely
+skills_df = None
+
+def load_skills():
+    global skills_df
+    try:
+        data_path = os.path.join(BASE_DIR, "data", "Skills.txt")
+        
+        skills_df = pd.read_csv(
+            data_path,
+            sep="\t",
+            low_memory=False
+        )
+        skills_df = skills_df[skills_df["Scale ID"] == "IM"]
+        skills_df = skills_df[["Element Name", "Data Value"]]
+        skills_df = skills_df.groupby("Element Name").mean().reset_index()
+        print(f"Loaded {len(skills_df)} skills from Skills.txt")
+    except Exception as e:
+        print(f"Error loading skills: {e}")
+        # Fallback empty dataframe to prevent crash
+        skills_df = pd.DataFrame(columns=["Element Name", "Data Value"])
+
+# Load on startup
+load_skills()
+
+# -----------------------------
+# SKILL MATCH CHECK
+# -----------------------------
+def skill_matches(skill, text):
+    # Basic word matching - can be improved with NLP
+    words = skill.lower().split()
+    text = text.lower()
+    
+    # Exact phrase match first
+    if skill.lower() in text:
+        return True
+    
+    # Check if all words in multi-word skill exist (loose match)
+    # Only if skill has >1 word
+    if len(words) > 1:
+        return all(word in text for word in words)
+        
+    return False
+
+class SkillMatcher:
+    """skill_matches() over the whole skills list, with each skill's phrase and words prepared once."""
+
+    def __init__(self, skills):
+        self.entries = [(skill, skill.lower(), skill.lower().split()) for skill in skills]
+
+    def matches(self, text):
+        """Skills (in list order) that skill_matches() would accept for `text`."""
+        text = text.lower()
+        return [
+            skill for skill, phrase, words in self.entries
+            if phrase in text or (len(words) > 1 and all(word in text for word in words))
+        ]
+
+_matcher = None
+
+def skill_matcher():
+    """The matcher over skills_df, rebuilt if skills_df is reloaded or replaced."""
+    global _matcher
+    if _matcher is None or _matcher[0] is not skills_df:
+        names = skills_df["Element Name"].tolist() if skills_df is not None and not skills_df.empty else []
+        _matcher = (skills_df, SkillMatcher(names))
+    return _matcher[1]
+
+# -----------------------------
+# PEER BENCHMARKING
+# -----------------------------
+# Real cohorts (the user's target role, else everyone) once they are big
+# enough; until then a synthetic peer distribution stands in.
+PEER_SCORES = np.clip(np.random.RandomState(42).normal(loc=55, scale=15, size=1000), 0, 100)
+
+def peer_percentile(readiness_score, role=None):
+    for dimension, name in ([("role", role)] if role else []) + [("all", "all")]:
+        percentile = cohort_stats.percentile("readiness", dimension, name, readiness_score)
+        if percentile is not None:
+            return percentile
+    return round((np.sum(PEER_SCORES < readiness_score) / len(PEER_SCORES)) * 100, 2)
+
+def record_cohorts(result, role=None):
+    """Fold a scan into the readiness cohorts and the per-skill match rates."""
+    cohort_stats.record("readiness", result["readiness_score"], {"all": ["all"], "role": [role_cohort(role)]})
+    matched = set(result["matched_skills"])
+    cohort_stats.record("skill_match", 100, {"skill": matched})
+    cohort_stats.record("skill_match", 0, {"skill": [s for s in result["required_skills"] if s not in matched]})
+
+def score_readiness(resume_skills, job_description, role=None):
+    """
+    Readiness of a resume (given as the set of matcher skills it mentions)
+    for one job description: required skills come from the JD, matched ones
+    are those the resume also mentions.
+    """
+    jd_text = clean_text(job_description)
+
+    # Identify required skills from JD using O*NET list. If none are found
+    # (maybe JD is short or uses different terms) the O*NET list is still the
+    # source of truth for "Skills".
+    required_skills = skill_matcher().matches(jd_text)
+    matched_skills = [skill for skill in required_skills if skill in resume_skills]
+
+    total_required = len(required_skills)
+    total_matched = len(matched_skills)
+
+    # If JD was provided but no skills matched our DB the score is ambiguous; default to 0
+    readiness_score = 0
+    if total_required > 0:
+        readiness_score = round((total_matched / total_required) * 100, 2)
+
+    return {
+        "readiness_score": readiness_score,
+        "peer_percentile": peer_percentile(readiness_score, role),
+        "required_skills_count": total_required,
+        "matched_skills_count": total_matched,
+        "required_skills": required_skills[:15], # Top 15
+        "matched_skills": matched_skills[:15]
+    }
+
+def resume_from_request(source):
+    """
+    (parsed resume, None) from an uploaded resume_file or a resume_id field,
+    or (None, error response). A new upload is parsed once per distinct file.
+    """
+    if 'resume_file' in request.files:
+        return resumes.parse(request.files["resume_file"].read()), None
+    if source.get("resume_id"):
+        parsed = resumes.get(source["resume_id"])
+        if parsed is None:
+            return None, (jsonify({"error": "Resume not found, please upload it again"}), 404)
+        return parsed, None
+    return None, (jsonify({"error": "No resume file uploaded"}), 400)
+
+# -----------------------------
+# PERSISTENCE
+# -----------------------------
+def persist_scan(user_email, resume_id, scans):
+    """
+    Record [(job description, result, role)] scans of one resume. Only the
+    JD id (a hash) is computed here; the JD index, cohorts, history,
+    dashboard summary and scan log are all written off the request path by
+    the write-behind flusher, the history update queued ahead of its scan.
+    """
+    now = datetime.datetime.utcnow()
+    if token_email(): # never repoint a latest resume for a raw, unverified email
+        analytics_buffer.defer(resumes.set_latest, token_email(), resume_id)
+    for job_description, result, role in scans:
+        if job_description.strip():
+            result["jd_id"] = jd_hash(job_description)
+            analytics_buffer.defer(jd_index.record_scan, job_description, result["readiness_score"], user_email)
+            record_cohorts(result, role)
+        if user_email:
+            payload = {"resume_id": resume_id, **result}
+            analytics_buffer.defer(readiness_history.record, user_email, payload, now)
+            analytics_buffer.defer(user_summaries.readiness_scanned, user_email, payload, now)
+            analytics_buffer.add("readiness_scans", {
+                "email": user_email,
+                "job_description": job_description[:500], # Full text lives in job_descriptions (jd_id)
+                "result": payload,
+                "date": now
+            })
+
+# -----------------------------
+# MAIN ROUTE
+# -----------------------------
+@bp.route("/career-readiness", methods=["POST"])
+def career_readiness():
+    try:
+        parsed, error = resume_from_request(request.form)
+        if error:
+            return error
+
+        job_description = request.form.get("job_description", "")
+        # Identity comes from the bearer token, or the legacy 'email' form field
+        user_email = request_email(request.form.get("email"))
+        role = request.form.get("role") or user_summaries.target_role(user_email)
+
+        with span("skill_match"):
+            resume_skills = set(skill_matcher().matches(clean_text(parsed["text"])))
+            result = score_readiness(resume_skills, job_description, role)
+
+        result_payload = {"resume_id": parsed["_id"], **result}
+        persist_scan(user_email, parsed["_id"], [(job_description, result_payload, role)])
+        return jsonify(result_payload)
+
+    except Exception as e:
+        return request_failed(e)
+
+@bp.route("/career-readiness/compare", methods=["POST"])
+def compare_readiness():
+    """
+    One resume against several job descriptions: the resume is parsed and
+    matched once, each JD is scored against that match, and the rows come back
+    ranked by readiness. `job_descriptions` is a JSON list (form field or
+    JSON body) of strings or {"title", "description", "role"} objects.
+    """
+    try:
+        source = request.form if request.files or request.form else (request.get_json(silent=True) or {})
+        jds = source.get("job_descriptions") or []
+        if isinstance(jds, str):
+            try:
+                jds = json.loads(jds)
+            except ValueError:
+                return jsonify({"error": "job_descriptions must be a JSON list"}), 400
+        if not isinstance(jds, list) or not jds:
+            return jsonify({"error": "At least one job description is required"}), 400
+        if len(jds) > MAX_COMPARE_JDS:
+            return jsonify({"error": f"At most {MAX_COMPARE_JDS} job descriptions per comparison"}), 400
+        jds = [jd if isinstance(jd, dict) else {"description": str(jd)} for jd in jds]
+
+        parsed, error = resume_from_request(source)
+        if error:
+            return error
+
+        user_email = request_email(source.get("email"))
+        default_role = source.get("role") or user_summaries.target_role(user_email)
+        roles = [jd.get("role") or default_role for jd in jds]
+
+        with span("skill_match"):
+            resume_skills = frozenset(skill_matcher().matches(clean_text(parsed["text"])))
+            # Scoring is pure-Python matching, so threads would only contend for the GIL
+            results = [score_readiness(resume_skills, str(jd.get("description", "")), role) for jd, role in zip(jds, roles)]
+
+        persist_scan(user_email, parsed["_id"], [
+            (str(jd.get("description", "")), result, role) for jd, role, result in zip(jds, roles, results)
+        ])
+
+        rows = [
+            {"index": i, "title": jd.get("title") or f"Job {i + 1}", **result}
+            for i, (jd, result) in enumerate(zip(jds, results))
+        ]
+        rows.sort(key=lambda row: (-row["readiness_score"], row["index"]))
+
+        return jsonify({"resume_id": parsed["_id"], "comparisons": rows})
+
+    except Exception as e:
+        return request_failed(e)
+
+@bp.route("/api/readiness/history", methods=["GET"])
+@require_auth
+def readiness_history_view():
+    """The caller's recent readiness scores, trend and most often matched/missing skills."""
+    return jsonify(readiness_history.summary(g.user["email"]))
+
+def request_failed(e):
+    import traceback
+    error_msg = traceback.format_exc()
+    print(f"Error processing request: {error_msg}")
+    with open("server_error.log", "a") as f:
+        f.write(f"[{datetime.datetime.utcnow().isoformat()}] {request.path}\n{error_msg}\n")
+    return jsonify({"error": str(e)}), 500
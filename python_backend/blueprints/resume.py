@@ -0,0 +1,46 @@
+"""Resume parsing: structured, cached parses reused by readiness, skill gap and projects."""
+from flask import Blueprint, g, jsonify, request
+
+from core.auth import require_auth, token_email
+from core.resume import resumes
+
+bp = Blueprint("resume", __name__)
+
+def resume_summary(parsed):
+    """The parse as returned to clients (the extracted text stays server-side)."""
+    return {
+        "resume_id": parsed["_id"],
+        "sections": parsed["sections"],
+        "skills": parsed["skills"],
+        "mentions": parsed["mentions"],
+        "years_experience": parsed["years_experience"],
+    }
+
+@bp.route("/api/resume/parse", methods=["POST"])
+def parse_resume():
+    if 'resume_file' not in request.files:
+        return jsonify({"error": "No resume file uploaded"}), 400
+    try:
+        parsed = resumes.parse(request.files["resume_file"].read())
+    except Exception as e:
+        print(f"Error parsing resume: {e}")
+        return jsonify({"error": "Could not read the resume PDF"}), 400
+
+    # The latest-resume pointer is private: only a token holder may move their own
+    user_email = token_email()
+    if user_email:
+        resumes.set_latest(user_email, parsed["_id"])
+    return jsonify(resume_summary(parsed))
+
+@bp.route("/api/resume/latest", methods=["GET"])
+@require_auth
+def latest_resume():
+    parsed = resumes.latest(g.user["email"])
+    return jsonify(resume_summary(parsed) if parsed else None)
+
+@bp.route("/api/resume/<resume_id>", methods=["GET"])
+def get_resume(resume_id):
+    parsed = resumes.get(resume_id)
+    if parsed is None:
+        return jsonify({"error": "Resume not found"}), 404
+    return jsonify(resume_summary(parsed))
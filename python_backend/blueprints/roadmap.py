@@ -0,0 +1,151 @@
+"""Role and topic roadmaps from O*NET technology skills and Wikipedia."""
+import requests
+from flask import Blueprint, jsonify, request
+
+from core import onet
+from core.breaker import CircuitOpen, breaker
+from core.metrics import span
+from core.params import limit_param
+from core.rolematrix import occupation_matrix
+
+bp = Blueprint("roadmap", __name__)
+
+WIKI_API = "https://en.wikipedia.org/w/api.php"
+headers = {"User-Agent": "RoadmapGenerator/1.0"}
+wikipedia_breaker = breaker("wikipedia")
+occupation_matrix() # build the matrix and neighbor table at import so a preloading server shares them
+
+# ---------------- ROLE BASED ---------------- #
+
+@bp.route("/api/roles", methods=["GET"])
+def get_roles():
+    titles = onet.occupations["Title"].dropna().unique().tolist()
+    titles.sort()
+    return jsonify(titles)
+
+
+@bp.route("/api/role", methods=["POST"])
+def role_info():
+    role_input = request.json.get("role", "").strip()
+    matched = onet.occupations[onet.occupations["Title"] == role_input]
+
+    if matched.empty:
+        return jsonify({"error": "Role not found"}), 404
+
+    occupation_code = matched.iloc[0]["O*NET-SOC Code"]
+    role_skills = onet.tech_data[onet.tech_data["O*NET-SOC Code"] == occupation_code]
+
+    skills_list = (
+        role_skills["Example"]
+        .dropna()
+        .unique()
+        .tolist()
+    )[:15]
+
+    resources = [
+        {
+            "skill": skill,
+            "documentation": f"https://www.google.com/search?q={skill}+official+documentation",
+            "video": f"https://www.youtube.com/results?search_query={skill}+full+course"
+        }
+        for skill in skills_list
+    ]
+
+    return jsonify({
+        "role": role_input,
+        "resources": resources
+    })
+
+
+@bp.route("/api/roles/recommend", methods=["POST"])
+def recommend_roles():
+    """O*NET roles ranked by how well their technology skills overlap the given skills."""
+    data = request.json or {}
+    skills = data.get("skills", "")
+    if isinstance(skills, str):
+        skills = [s.strip() for s in skills.split(",") if s.strip()]
+    if not skills:
+        return jsonify({"error": "Skills are required"}), 400
+    limit = limit_param(data.get("limit"))
+
+    with span("role_matrix.rank"):
+        roles = occupation_matrix().rank(skills, limit=limit)
+    return jsonify({"skills": skills, "roles": roles})
+
+
+@bp.route("/api/role/similar", methods=["GET"])
+def similar_roles():
+    role_input = request.args.get("role", "").strip()
+    limit = limit_param(request.args.get("limit"))
+    similar = occupation_matrix().similar_roles(role_input, limit=limit)
+    if similar is None:
+        return jsonify({"error": "Role not found"}), 404
+    return jsonify({"role": role_input, "similar": similar})
+
+
+# ---------------- TOPIC BASED ---------------- #
+
+@bp.route("/api/topic", methods=["POST"])
+def topic_roadmap():
+    topic = request.json.get("topic", "").strip()
+
+    if not topic:
+        return jsonify({"error": "Topic required"}), 400
+
+    search_params = {
+        "action": "query",
+        "list": "search",
+        "srsearch": f"{topic} programming",
+        "format": "json"
+    }
+
+    try:
+        with span("http.wikipedia"):
+            search_response = wikipedia_breaker.call(requests.get, WIKI_API, params=search_params, headers=headers, timeout=10)
+        search_data = search_response.json()
+
+        if not search_data.get("query", {}).get("search"):
+            return jsonify({"error": "Topic not found"}), 404
+
+        page_title = search_data["query"]["search"][0]["title"]
+
+        parse_params = {
+            "action": "parse",
+            "page": page_title,
+            "format": "json",
+            "prop": "sections"
+        }
+
+        with span("http.wikipedia"):
+            parse_response = wikipedia_breaker.call(requests.get, WIKI_API, params=parse_params, headers=headers, timeout=10)
+        parse_data = parse_response.json()
+
+        sections = parse_data.get("parse", {}).get("sections", [])
+
+        children = []
+        for sec in sections[:12]:
+            title = sec.get("line")
+            if title.lower() not in ["references", "external links", "see also"]:
+                children.append({"title": title})
+
+        structure = {
+            "title": page_title,
+            "children": children
+        }
+
+        return jsonify({
+            "topic": topic,
+            "documentation": f"https://www.google.com/search?q={topic}+official+documentation",
+            "video": f"https://www.youtube.com/results?search_query={topic}+full+course",
+            "structure": structure
+        })
+        return jsonify({
+            "topic": topic,
+            "documentation": f"https://www.google.com/search?q={topic}+official+documentation",
+            "video": f"https://www.youtube.com/results?search_query={topic}+full+course",
+            "structure": structure
+        })
+    except CircuitOpen:
+        return jsonify({"error": "Wikipedia is unavailable right now, please try again later"}), 503
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
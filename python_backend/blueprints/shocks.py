@@ -0,0 +1,133 @@
+"""Career shock alerts: layoff news and job-market trends."""
+import feedparser
+import requests
+from flask import Blueprint, jsonify
+
+from core.breaker import breaker
+from core.metrics import span
+from core.skills import SkillIndex
+
+bp = Blueprint("shocks", __name__)
+
+google_news_breaker = breaker("google_news")
+remotive_breaker = breaker("remotive")
+
+# Skills tracked by the job-trend counters
+TREND_SKILLS = ["React", "Python", "GenAI", "AWS", "Docker", "Node.js", "AI", "Kubernetes"]
+TREND_INDEX = SkillIndex(TREND_SKILLS)
+TREND_SKILL_IDS = {s: TREND_INDEX.canonical(s) for s in TREND_SKILLS}
+
+def parse_feed(url):
+    """feedparser reports network errors via `bozo` instead of raising; raise so the breaker sees them."""
+    feed = feedparser.parse(url)
+    if getattr(feed, "bozo", False) and not feed.entries:
+        raise RuntimeError(f"Feed unavailable: {getattr(feed, 'bozo_exception', 'unknown error')}")
+    return feed
+
+# ---------------- CAREER SHOCK ALERTS ENGINE ---------------- #
+
+# 1. Fetch Layoff News (Google News RSS)
+def fetch_layoff_news():
+    try:
+        # Google News RSS for "layoffs tech"
+        rss_url = "https://news.google.com/rss/search?q=layoffs+tech+when:7d&hl=en-US&gl=US&ceid=US:en"
+        with span("http.google_news"):
+            feed = google_news_breaker.call(parse_feed, rss_url)
+        
+        alerts = []
+        for entry in feed.entries[:10]:
+            alerts.append({
+                "type": "Layoff Shock",
+                "message": f"🚨 {entry.title}",
+                "url": entry.link,
+                "date": entry.published
+            })
+        return alerts
+    except Exception as e:
+        print(f"Error fetching layoff news: {e}")
+        return []
+
+# 2. Fetch Jobs (Remotive API) & Analyze Trends
+def fetch_and_analyze_jobs():
+    try:
+        # Remotive API for software dev jobs
+        url = "https://remotive.com/api/remote-jobs?category=software-dev&limit=50"
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
+        with span("http.remotive"):
+            response = remotive_breaker.call(requests.get, url, headers=headers, timeout=10)
+        jobs = response.json().get("jobs", [])
+        
+        alerts = []
+        
+        skill_counts = {s: 0 for s in TREND_SKILLS}
+        company_hiring = {}
+        company_urls = {}
+        
+        for job in jobs:
+            desc = job.get("description", "")
+            company = job.get("company_name")
+            
+            # Count Skills (whole-word, alias-aware: "k8s" counts for Kubernetes, "maintain" no longer for AI)
+            mentioned = TREND_INDEX.find_in_text(desc)
+            for skill, cid in TREND_SKILL_IDS.items():
+                if cid in mentioned:
+                    skill_counts[skill] += 1
+            
+            # Track Hiring
+            if company:
+                company_hiring[company] = company_hiring.get(company, 0) + 1
+                if company not in company_urls:
+                    company_urls[company] = job.get("url")
+
+        # Generate Alerts
+        
+        # A. Emerging Skills (> 2 mentions in sample)
+        for skill, count in skill_counts.items():
+            if count > 2:
+                alerts.append({
+                    "type": "Emerging Skill",
+                    "message": f"🚀 {skill} appears in {count} recent job listings",
+                    "count": count, 
+                    "url": f"https://remotive.com/remote-jobs/software-dev?search={skill}"
+                })
+        
+        # B. Hiring Surge (> 1 role in sample)
+        # Sort by count desc
+        sorted_companies = sorted(company_hiring.items(), key=lambda x: x[1], reverse=True)[:5]
+        for company, count in sorted_companies:
+            if count > 1:
+                alerts.append({
+                    "type": "Hiring Surge",
+                    "message": f"📢 {company} is hiring ({count} open roles)",
+                    "count": count,
+                    "url": company_urls.get(company)
+                })
+        
+        # C. General Trend
+        alerts.append({
+            "type": "Hiring Trend",
+            "message": f"📈 Analyzed {len(jobs)} recent remote software jobs for trends",
+            "count": len(jobs)
+        })
+        
+        return alerts
+
+    except Exception as e:
+        print(f"Error fetching/analyzing jobs: {e}")
+        return []
+
+@bp.route("/api/shocks", methods=["GET"])
+def get_shocks():
+    try:
+        print("Gathering Career Shock Alerts...")
+        # Run in parallel ideally, but sequential is fine for MVP
+        layoff_alerts = fetch_layoff_news()
+        job_alerts = fetch_and_analyze_jobs()
+        
+        all_alerts = layoff_alerts + job_alerts
+        return jsonify(all_alerts)
+    except Exception as e:
+        print(f"Error generating shocks: {e}")
+        return jsonify({"error": str(e)}), 500
@@ -0,0 +1,273 @@
+"""Skill gap engine: missing skills for a target role and a closure roadmap."""
+import datetime
+import json
+
+import requests
+from flask import Blueprint, jsonify, request
+
+from core import onet
+from core.auth import request_email, token_email
+from core.breaker import breaker
+from core.config import OLLAMA_URL
+from core.dashboard import user_summaries
+from core.db import db
+from core.metrics import span
+from core.ratelimit import ModelBusy, request_model_slot
+from core.resume import resumes
+from core.skillgraph import skill_graph
+from core.skills import onet_skill_index
+
+bp = Blueprint("skill_gap", __name__)
+
+skill_gaps_collection = db["skill_gaps"]
+
+model_breaker = breaker("model")
+skill_graph() # build the skill index and graph at import so a preloading server shares them
+
+# ---------------- SKILL GAP ENGINE ---------------- #
+
+@bp.route("/api/skill-gap/generate", methods=["POST"])
+def generate_skill_gap():
+    try:
+        data = request.json
+        target_role = data.get("role", "").strip()
+        current_skills_input = data.get("currentSkills", "")
+
+        if not target_role:
+            return jsonify({"error": "Target role is required"}), 400
+
+        # No skills typed in: prefill from the referenced (or the signed-in user's latest) parsed resume
+        if not current_skills_input.strip():
+            parsed = resumes.for_request(data.get("resumeId"), token_email())
+            if parsed:
+                current_skills_input = ", ".join(parsed["skills"])
+
+        # Parse current skills
+        current_skills_list = [
+            s.strip().lower() for s in current_skills_input.split(",") if s.strip()
+        ]
+
+        # 1. Finding required skills for the role from O*NET data
+        matched_role = onet.occupations[onet.occupations["Title"].str.contains(target_role, case=False, regex=False)]
+        
+        required_skills = []
+        if not matched_role.empty:
+            occupation_code = matched_role.iloc[0]["O*NET-SOC Code"]
+            role_skills_df = onet.tech_data[onet.tech_data["O*NET-SOC Code"] == occupation_code]
+            # Get top 20 example skills
+            required_skills = (
+                role_skills_df["Example"]
+                .dropna()
+                .unique()
+                .tolist()
+            )[:20]
+        else:
+            # Fallback if specific O*NET role not found: return generic dev skills or empty
+            # Extended fallback list
+            role_lower = target_role.lower()
+            if any(x in role_lower for x in ["developer", "engineer", "programmer", "coder", "architect"]):
+                required_skills = ["Python", "JavaScript", "SQL", "Git", "Rest API", "React", "Docker", "AWS", "System Design", "CI/CD"]
+            elif any(x in role_lower for x in ["data", "analyst", "scientist", "ai", "ml"]):
+                required_skills = ["Python", "SQL", "Pandas", "Machine Learning", "Data Visualization", "Statistics", "Tableau", "Big Data"]
+            elif any(x in role_lower for x in ["manager", "lead", "director", "exec"]):
+                required_skills = ["Project Management", "Agile", "Communication", "Leadership", "Strategic Planning", "Stakeholder Management"]
+            else:
+                 # Ultimate fallback - don't error out, just give general tech skills
+                 required_skills = ["Computer Literacy", "Problem Solving", "Communication", "Time Management", "Project Management"]
+                 # Optionally append the role name to the error message if we really want to signal it
+                 # return jsonify({"error": f"Role '{target_role}' not found. Try 'Software Developer' or 'Data Scientist'."}), 404
+
+        # 2. Identify Missing Skills: both sides map to canonical skill ids ("JS" == "JavaScript")
+        missing_skills = onet_skill_index().missing(required_skills, current_skills_list)
+
+        # Limit to top 10 missing to avoid overwhelming, then put prerequisites first
+        missing_skills = skill_graph().order_skills(missing_skills[:10])
+
+        # --- PREDEFINED ROADMAPS (To speed up common roles) ---
+        PREDEFINED_ROADMAPS = {
+            "frontend": {
+                "skills": ["React", "JavaScript", "HTML/CSS", "Git", "Testing"],
+                "plan": [
+                    {"skill": "React", "completed": False, "roadmap": {"topics": ["Hooks & Context", "State Management", "Performance"], "miniProject": "Task Dashboard", "duration": "3 weeks", "certification": "Meta Frontend Dev"}},
+                    {"skill": "JavaScript", "completed": False, "roadmap": {"topics": ["ES6+", "Async/Await", "DOM"], "miniProject": "Weather App", "duration": "2 weeks", "certification": "JSE Certified"}},
+                    {"skill": "CSS", "completed": False, "roadmap": {"topics": ["Flexbox/Grid", "Tailwind", "Responsive"], "miniProject": "Landing Page Clone", "duration": "2 weeks", "certification": "None"}},
+                    {"skill": "Git", "completed": False, "roadmap": {"topics": ["Branching", "PRs", "Conflicts"], "miniProject": "Open Source Contrib", "duration": "1 week", "certification": "None"}}
+                ]
+            },
+            "full stack": {
+                "skills": ["React", "Node.js", "MongoDB", "Express", "API Design"],
+                "plan": [
+                    {"skill": "React", "completed": False, "roadmap": {"topics": ["Advanced Hooks", "Patterns", "Optimization"], "miniProject": "E-commerce Site", "duration": "3 weeks", "certification": "Meta Frontend"}},
+                    {"skill": "Node.js", "completed": False, "roadmap": {"topics": ["Event Loop", "Streams", "Scalability"], "miniProject": "CLI Tool", "duration": "2 weeks", "certification": "OpenJS Node Services"}},
+                    {"skill": "MongoDB", "completed": False, "roadmap": {"topics": ["Aggregation", "Indexing", "Schema Design"], "miniProject": "Blog Backend", "duration": "2 weeks", "certification": "MongoDB Associate"}},
+                    {"skill": "API Design", "completed": False, "roadmap": {"topics": ["REST", "Auth/JWT", "Security"], "miniProject": "Secure Task API", "duration": "1 week", "certification": "None"}}
+                ]
+            },
+            "devops": {
+                 "skills": ["Docker", "Kubernetes", "CI/CD", "AWS", "Linux"],
+                 "plan": [
+                    {"skill": "Docker", "completed": False, "roadmap": {"topics": ["Containers", "Dockerfiles", "Compose"], "miniProject": "MERN Stack Containerization", "duration": "2 weeks", "certification": "Docker Certified"}},
+                    {"skill": "Kubernetes", "completed": False, "roadmap": {"topics": ["Pods", "Deployments", "Helm"], "miniProject": "Microservice Cluster", "duration": "3 weeks", "certification": "CKA (Kubernetes Admin)"}},
+                    {"skill": "CI/CD", "completed": False, "roadmap": {"topics": ["GitHub Actions", "Pipelines", "Testing"], "miniProject": "Web App Pipeline", "duration": "2 weeks", "certification": "None"}},
+                    {"skill": "AWS", "completed": False, "roadmap": {"topics": ["EC2/S3", "IAM", "VPC"], "miniProject": "Static Site Hosting", "duration": "2 weeks", "certification": "AWS Cloud Practitioner"}}
+                 ]
+            }
+        }
+        
+        target_lower = target_role.lower()
+        matched_predefined = None
+        for key in PREDEFINED_ROADMAPS:
+             if key in target_lower:
+                 matched_predefined = PREDEFINED_ROADMAPS[key]
+                 break
+
+        # 3. Generate Closure Plan (Roadmap)
+        closure_plan = []
+        
+        if matched_predefined:
+            print(f"Using PREDEFINED roadmap for {target_role}")
+            closure_plan = matched_predefined["plan"]
+            # Optimization: Update missing skills to match plan for UI consistency
+            missing_skills = matched_predefined["skills"]
+        else:
+            # 3. Generate Closure Plan (Dynamic AI Roadmap)
+            # Try to get AI response first
+            try:
+                if not missing_skills:
+                    pass
+                else:
+                    ollama_url = OLLAMA_URL
+                    prompt = f"""
+                    Act as a senior technical mentor. Create a learning roadmap for a '{target_role}' who is missing these skills: {', '.join(missing_skills)}.
+                    
+                    For EACH missing skill, provide a structured plan in strict JSON format.
+                    The output must be a JSON object with a key "plan" containing a list of objects.
+                    
+                    Format:
+                    {{
+                        "plan": [
+                            {{
+                                "skill": "Skill Name",
+                                "roadmap": {{
+                                    "topics": ["Topic 1", "Topic 2", "Topic 3"],
+                                    "miniProject": "Description of a practical project",
+                                    "duration": "Time to learn (e.g. 2 weeks)",
+                                    "certification": "Recommended certification or 'None'"
+                                }}
+                            }}
+                        ]
+                    }}
+                    
+                    Do not include any text outside the JSON.
+                    """
+                    
+                    headers = {"Content-Type": "application/json"}
+                    payload = {
+                        "model": "phi", # Lightweight model
+                        "prompt": prompt,
+                        "stream": False,
+                        "format": "json", # Force JSON mode if supported or just prompt engineering
+                        "options": {"temperature": 0.3}
+                    }
+                    
+                    print("Requesting AI roadmap...")
+                    with request_model_slot(), span("ollama"):
+                        response = model_breaker.call(requests.post, ollama_url, json=payload, timeout=45)
+                    
+                    if response.status_code == 200:
+                        ai_text = response.json().get("response", "")
+                        # Clean up json if needed (sometimes models chatter)
+                        # Find first { and last }
+                        start = ai_text.find("{")
+                        end = ai_text.rfind("}") + 1
+                        if start != -1 and end != -1:
+                            json_str = ai_text[start:end]
+                            data = json.loads(json_str)
+                            if "plan" in data and isinstance(data["plan"], list):
+                                # Map to our format (add 'completed' flag)
+                                for item in data["plan"]:
+                                    item["completed"] = False
+                                closure_plan = data["plan"]
+                                print(f"AI Roadmap generated with {len(closure_plan)} items.")
+                            else:
+                                print("AI response format incorrect, using fallback.")
+                        else:
+                             print("Could not find JSON in AI response.")
+                    else:
+                        print(f"Ollama error: {response.status_code}")
+
+            except ModelBusy as busy:
+                return busy.response()
+            except Exception as e:
+                print(f"AI Roadmap Generation failed: {e}. Falling back to template.")
+
+        # Fallback if AI failed or returned empty
+        if not closure_plan and missing_skills:
+            print("Using static fallback roadmap.")
+            for skill in missing_skills:
+                closure_plan.append({
+                    "skill": skill,
+                    "completed": False, 
+                    "roadmap": {
+                        "topics": [
+                            f"{skill} Fundamentals",
+                            f"Advanced {skill} Concepts",
+                            f"{skill} Best Practices"
+                        ],
+                        "miniProject": f"Build a simple application using {skill}",
+                        "duration": f"{skill_graph().skill_weeks(skill)} weeks",
+                        "certification": f"{skill} Certified Associate (Optional)"
+                    }
+                })
+
+        # Order the plan (whichever source it came from) by the prerequisite graph
+        closure_plan, schedule = skill_graph().order_plan(closure_plan)
+
+        result = {
+            "role": target_role,
+            "missingSkills": missing_skills,
+            "closurePlan": closure_plan,
+            "schedule": schedule
+        }
+
+        # Save to DB if the caller is identified (bearer token, or legacy 'email' body param)
+        user_email = request_email(request.json.get("email"))
+        if user_email:
+             updated_at = datetime.datetime.utcnow()
+             skill_gaps_collection.update_one(
+                 {"email": user_email, "role": target_role},
+                 {"$set": {"result": result, "updated_at": updated_at}},
+                 upsert=True
+             )
+             user_summaries.roadmap_saved(user_email, result, updated_at)
+
+        return jsonify(result)
+
+    except Exception as e:
+        print(f"Error in skill gap generation: {e}")
+        return jsonify({"error": str(e)}), 500
+
+@bp.route('/api/skill-gap/roadmap', methods=['GET'])
+def get_roadmap():
+    email = request_email(request.args.get('email'))
+    if not email:
+        return jsonify(None) # Return nothing if no email
+    
+    # Find most recent or specific active roadmap
+    # For now, we just find one. You might want to sort by date.
+    data = skill_gaps_collection.find_one({"email": email}, sort=[("updated_at", -1)])
+    
+    if data and "result" in data:
+        # Convert ObjectId if nested (though result usually isn't)
+        return jsonify(data["result"])
+    return jsonify(None)
+
+@bp.route('/api/skill-gap/roadmap', methods=['DELETE'])
+def delete_roadmap():
+    email = request_email(request.args.get('email'))
+    if not email:
+        return jsonify({"msg": "Email required"}), 400
+    
+    skill_gaps_collection.delete_many({"email": email})
+    user_summaries.roadmap_cleared(email)
+    return jsonify({"msg": "Roadmap cleared"})
@@ -0,0 +1,8 @@
+"""
+Shared infrastructure for the blueprints: configuration, the Mongo
+connection, metrics, auth, the request profiler, the write-behind buffer and
+the cross-worker seeding locks, plus the data shared by several subsystems
+(O*NET tables, skill normalization, parsed resumes, the job-description
+corpus). Each module imports only what it needs, so a subset of the API
+never pays for nltk or feedparser.
+"""
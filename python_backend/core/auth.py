@@ -0,0 +1,103 @@
+"""
+Bearer-token identity. Tokens are verified once per request in
+before_request. Verified claims are cached (LRU, keyed by the token's
+SHA-256) until the token's own `exp`, so repeat requests skip jwt.decode and
+never need a DB lookup for identity.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+import jwt
+from flask import g, jsonify, request
+
+from core.config import SECRET_KEY
+
+TOKEN_CACHE_SIZE = 2048
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+def verify_token(token):
+    """Return the decoded claims for a bearer token, or None if it is invalid or expired."""
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            exp, claims = cached
+            if exp > now:
+                _token_cache.move_to_end(key)
+                return claims
+            del _token_cache[key]
+
+    try:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    except jwt.PyJWTError:
+        return None
+    if "user_id" not in claims:
+        return None
+
+    exp = claims.get("exp", now + 300)
+    with _token_cache_lock:
+        _token_cache[key] = (exp, claims)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return claims
+
+def load_current_user():
+    """Attach the verified token claims (user_id, email) to flask.g.user."""
+    g.user = None
+    g.auth_error = False
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token.strip():
+        g.user = verify_token(token.strip())
+        g.auth_error = g.user is None
+
+def require_auth(f):
+    """Reject the request with 401 unless a valid bearer token was supplied."""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if g.get("user") is None:
+            msg = "Invalid token" if g.get("auth_error") else "Missing token"
+            return jsonify({"msg": msg}), 401
+        return f(*args, **kwargs)
+    return wrapper
+
+def request_email(fallback=None):
+    """
+    Identity for the current request: the token's email, else the legacy raw
+    `email` field. A token that was sent but failed to verify yields None
+    rather than falling back to the caller-supplied email.
+    """
+    if g.get("user"):
+        return g.user.get("email")
+    if g.get("auth_error"):
+        return None
+    return fallback
+
+def token_email():
+    """The verified token's email, or None; for private reads and pointers, which never trust a raw `email` field."""
+    return g.user.get("email") if g.get("user") else None
+
+# Admins are configured by email (comma-separated ADMIN_EMAILS) and must present a valid token
+ADMIN_EMAILS = {e.strip().lower() for e in os.environ.get("ADMIN_EMAILS", "").split(",") if e.strip()}
+
+def is_admin():
+    return bool(g.get("user")) and g.user.get("email", "").lower() in ADMIN_EMAILS
+
+def require_admin(f):
+    """Reject the request with 401/403 unless the bearer token belongs to an admin."""
+    @wraps(f)
+    @require_auth
+    def wrapper(*args, **kwargs):
+        if not is_admin():
+            return jsonify({"msg": "Admin only"}), 403
+        return f(*args, **kwargs)
+    return wrapper
+
+def init_app(app):
+    app.before_request(load_current_user)
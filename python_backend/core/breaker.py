@@ -0,0 +1,116 @@
+"""
+Circuit breakers for upstream services (the model server, opentdb,
+Wikipedia, Remotive, Google News). After BREAKER_FAILURE_THRESHOLD
+consecutive failures a breaker opens and calls fail immediately with
+CircuitOpen, which the routes already treat like any other upstream error:
+they fall through to their static fallbacks. After BREAKER_RESET_TIMEOUT
+seconds one probe call is let through (half-open); its outcome closes the
+breaker or opens it again. State is per process and exported on /metrics.
+"""
+import os
+import threading
+import time
+
+from core.metrics import metrics
+
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.environ.get("BREAKER_RESET_TIMEOUT", "30"))
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+class CircuitOpen(Exception):
+    def __init__(self, name):
+        super().__init__(f"circuit '{name}' is open")
+        self.name = name
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    def available(self):
+        """Whether a call would currently be attempted (without claiming the half-open probe)."""
+        with self._lock:
+            if self.state == OPEN:
+                return time.monotonic() - self.opened_at >= self.reset_timeout
+            return not (self.state == HALF_OPEN and self._probing)
+
+    def _allow(self):
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.stats["rejected"] += 1
+            return False
+
+    def _record(self, ok):
+        with self._lock:
+            self._probing = False
+            if ok:
+                self.stats["successes"] += 1
+                self.failures = 0
+                self.state = CLOSED
+                return
+            self.stats["failures"] += 1
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.stats["opened"] += 1
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) through the breaker. An exception or a 5xx
+        response counts as a failure (the response is still returned).
+        Raises CircuitOpen without calling fn while the breaker is open.
+        """
+        if not self._allow():
+            raise CircuitOpen(self.name)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record(False)
+            raise
+        self._record(getattr(result, "status_code", 200) < 500)
+        return result
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def breaker(name):
+    """The process-wide breaker for an upstream, created on first use."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+def _breaker_metrics():
+    with _breakers_lock:
+        current = list(_breakers.values())
+    lines = ["# HELP circuit_breaker_state Upstream breaker state (0 closed, 1 half-open, 2 open).", "# TYPE circuit_breaker_state gauge"]
+    for b in current:
+        lines.append(f'circuit_breaker_state{{upstream="{b.name}"}} {_STATE_VALUES[b.state]}')
+    lines += ["# HELP circuit_breaker_calls_total Upstream calls by breaker outcome.", "# TYPE circuit_breaker_calls_total counter"]
+    for b in current:
+        for outcome in ("successes", "failures", "rejected"):
+            lines.append(f'circuit_breaker_calls_total{{upstream="{b.name}",outcome="{outcome}"}} {b.stats[outcome]}')
+    lines += ["# TYPE circuit_breaker_opened_total counter"]
+    for b in current:
+        lines.append(f'circuit_breaker_opened_total{{upstream="{b.name}"}} {b.stats["opened"]}')
+    return lines
+
+metrics.collectors.append(_breaker_metrics)
@@ -0,0 +1,167 @@
+"""
+Cohort benchmarking by incremental aggregation. `cohort_stats` has one small
+document per cohort, keyed "<metric>:<dimension>:<cohort>" (e.g.
+"readiness:role:data scientist"), holding a running count, sum, sum of
+squares and 10-point histogram buckets over a 0-100 scale. Readiness scans,
+finished interviews and saved assessments record into them; increments are
+coalesced in memory and written off the request path by the write-behind
+flusher, one $inc upsert per touched cohort. Cohort names come from fixed
+sets (O*NET titles and the app's role and topic lists), so client input
+cannot create cohorts without bound.
+"""
+import math
+import os
+import threading
+import time
+
+from core import onet
+from core.db import db
+from core.history import skill_field
+from core.metrics import metrics
+from core.write_buffer import analytics_buffer
+
+BUCKETS = 10
+MIN_COHORT_SIZE = int(os.environ.get("MIN_COHORT_SIZE", "20")) # below this, percentiles aren't reported
+CACHE_SECONDS = 5.0
+MAX_COHORT_NAME = 120
+
+# Target roles offered by the profile form; O*NET occupation titles are accepted as well
+PROFILE_ROLES = ("Software Engineer", "Data Scientist", "Product Manager", "Designer", "Marketing")
+
+def cohort_key(value):
+    return skill_field(" ".join(str(value).lower().split())) or "unknown"
+
+def _bucket(value):
+    return min(int(value // (100 / BUCKETS)), BUCKETS - 1)
+
+_roles = None
+
+def role_cohort(role):
+    """The canonical name of a known target role (case-insensitive), or None."""
+    global _roles
+    if _roles is None or _roles[0] is not onet.occupations:
+        titles = onet.occupations["Title"].dropna().unique().tolist() if "Title" in onet.occupations else []
+        _roles = (onet.occupations, {t.lower(): t for t in list(titles) + list(PROFILE_ROLES)})
+    return _roles[1].get(" ".join(str(role or "").split()).lower())
+
+class CohortStats:
+    def __init__(self, collection):
+        self.collection = collection
+        self._cache = {}
+        self._pending = {} # doc id -> coalesced $inc, written by flush()
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self.stats = {"recorded": 0, "written": 0, "failed": 0}
+
+    def record(self, metric, value, cohorts, raw=None):
+        """
+        Fold one observation (`value` on a 0-100 scale, optional `raw` value
+        such as an interview total) into every cohort it belongs to.
+        `cohorts` maps dimension -> cohort names, e.g.
+        {"all": ["all"], "role": ["Data Scientist"]}; callers pass names from
+        a known set. The write happens on the next write-behind flush.
+        """
+        value = max(0.0, min(100.0, float(value)))
+        fields = {"count": 1, "sum": value, "sum_sq": value * value, f"b.{_bucket(value)}": 1}
+        if raw is not None:
+            fields["raw_sum"] = raw
+        with self._lock:
+            for dimension, names in cohorts.items():
+                for key in {cohort_key(n) for n in names if n and len(str(n)) <= MAX_COHORT_NAME}:
+                    inc = self._pending.setdefault(f"{metric}:{dimension}:{key}", {})
+                    for field, amount in fields.items():
+                        inc[field] = inc.get(field, 0) + amount
+                    self.stats["recorded"] += 1
+            schedule = bool(self._pending) and not self._scheduled
+            if schedule:
+                self._scheduled = True
+        if schedule and not analytics_buffer.defer(self.flush):
+            with self._lock:
+                self._scheduled = False # buffer full; the next record() tries again
+
+    def flush(self):
+        """Write the coalesced increments, one upsert per cohort."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+        for doc_id, inc in pending.items():
+            try:
+                self.collection.update_one({"_id": doc_id}, {"$inc": inc}, upsert=True)
+                self.stats["written"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f"Cohort stats update failed for {doc_id}: {e}")
+            with self._lock:
+                self._cache.pop(doc_id, None)
+
+    def get(self, requests):
+        """
+        Distributions for [(metric, dimension, cohort name)] in one query;
+        returns {(metric, dimension, name): distribution or None}. Results are
+        cached briefly (this process's own writes drop their entries), which
+        is plenty for benchmark pages.
+        """
+        now = time.monotonic()
+        wanted = {(m, d, n): f"{m}:{d}:{cohort_key(n)}" for m, d, n in requests}
+        with self._lock:
+            cached = {r: self._cache[k] for r, k in wanted.items() if k in self._cache and self._cache[k][0] > now}
+        missing = {r: k for r, k in wanted.items() if r not in cached}
+        results = {r: stats for r, (_, stats) in cached.items()}
+        if missing:
+            docs = {doc["_id"]: doc for doc in self.collection.find({"_id": {"$in": list(set(missing.values()))}})}
+            with self._lock:
+                for r, doc_id in missing.items():
+                    stats = docs.get(doc_id)
+                    self._cache[doc_id] = (now + CACHE_SECONDS, stats)
+                    results[r] = stats
+        return {r: distribution(r[2], stats) if stats else None for r, stats in results.items()}
+
+    def percentile(self, metric, dimension, name, value):
+        """Share of the cohort scoring below `value` (interpolated within buckets), or None for a small cohort."""
+        dist = self.get([(metric, dimension, name)])[(metric, dimension, name)]
+        if not dist or dist["count"] < MIN_COHORT_SIZE:
+            return None
+        return histogram_percentile(dist["histogram"], dist["count"], value)
+
+def histogram_percentile(histogram, count, value):
+    width = 100 / BUCKETS
+    below = 0.0
+    for i, bucket in enumerate(histogram):
+        low = i * width
+        if value >= low + width and i < BUCKETS - 1:
+            below += bucket["count"]
+        else:
+            below += bucket["count"] * max(0.0, min(1.0, (value - low) / width))
+            break
+    return round(below / count * 100, 2)
+
+def distribution(name, stats):
+    count = stats.get("count", 0)
+    mean = stats.get("sum", 0) / count if count else 0.0
+    variance = max(0.0, stats.get("sum_sq", 0) / count - mean * mean) if count else 0.0
+    buckets = stats.get("b", {})
+    histogram = [
+        {"range": [i * 100 // BUCKETS, (i + 1) * 100 // BUCKETS], "count": buckets.get(str(i), 0)}
+        for i in range(BUCKETS)
+    ]
+    dist = {
+        "cohort": name,
+        "count": count,
+        "mean": round(mean, 2),
+        "std": round(math.sqrt(variance), 2),
+        "histogram": histogram,
+    }
+    if "raw_sum" in stats and count:
+        dist["rawMean"] = round(stats["raw_sum"] / count, 2)
+    return dist
+
+cohort_stats = CohortStats(db["cohort_stats"])
+
+def _cohort_metrics():
+    lines = ["# HELP cohort_stats_updates_total Cohort observations recorded and cohort documents written.",
+             "# TYPE cohort_stats_updates_total counter"]
+    for outcome, value in cohort_stats.stats.items():
+        lines.append(f'cohort_stats_updates_total{{outcome="{outcome}"}} {value}')
+    return lines
+
+metrics.collectors.append(_cohort_metrics)
@@ -0,0 +1,12 @@
+"""Process-wide settings, each overridable from the environment."""
+import os
+
+# mongomock:// selects the in-memory database outright (benchmarks, throwaway runs)
+MONGO_URI = os.environ.get("MONGO_URI", "mongodb://localhost:27017/")
+DB_NAME = os.environ.get("DB_NAME", "career_genome")
+SECRET_KEY = os.environ.get("SECRET_KEY", "supersecretkey") # Change for production
+# Point at benchmarks/fake_ollama.py (or a remote model host) for load testing
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434/api/generate")
+
+# Root of python_backend/, where the O*NET data files live
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
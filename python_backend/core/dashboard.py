@@ -0,0 +1,214 @@
+"""
+Materialized per-user dashboard. `user_summaries` holds one document per
+user (keyed by email) with everything the dashboard shows: profile, latest
+skill-gap roadmap, readiness, interview, project, assessment and failure
+summaries. The routes that write those records call the hooks below in the
+same request (readiness scans queue theirs on the write-behind flusher, so
+they land within about a second), and /api/dashboard is a single _id read. A
+user's first dashboard read rebuilds the document from the source
+collections, which also covers activity from before the summaries existed.
+"""
+import datetime
+import threading
+import time
+
+from pymongo.errors import DuplicateKeyError
+
+from core.db import db, ensure_index
+from core.write_buffer import analytics_buffer
+
+RECENT_ITEMS = 5
+TARGET_ROLE_TTL = 60.0 # seconds a user's profile role is reused without a read
+
+# Source collections read when (re)building a summary, newest record first
+SOURCES = ["readiness_scans", "interviews", "generated_projects", "assessment_results", "failure_stories"]
+
+def _readiness_point(result, date):
+    return {"score": result.get("readiness_score", 0), "jd_id": result.get("jd_id"), "date": date}
+
+def _interview_point(doc):
+    point = {"role": doc.get("role"), "total_score": doc.get("total_score", 0), "date": doc.get("date")}
+    if doc.get("scores"):
+        point["percent"] = round(100 * point["total_score"] / (10 * len(doc["scores"])), 2) # 10 points per answer
+    return point
+
+class UserSummaries:
+    def __init__(self, database):
+        self.database = database
+        self.collection = database["user_summaries"]
+        self._roles = {} # email -> (expires, role)
+        self._roles_lock = threading.Lock()
+        for name in SOURCES:
+            ensure_index(self.database[name], [("email", 1), ("date", -1)])
+
+    def _write(self, email, update):
+        if email:
+            self.collection.update_one({"_id": email}, update, upsert=True)
+
+    # --- write-through hooks (called by the routes that write the source records) ---
+
+    def profile_changed(self, email, profile, name=None):
+        fields = {"profile": profile or {}}
+        if name is not None:
+            fields["name"] = name
+        self._write(email, {"$set": fields})
+        with self._roles_lock:
+            self._roles.pop(email, None)
+
+    def roadmap_saved(self, email, result, updated_at):
+        self._write(email, {"$set": {"roadmap": {**result, "updated_at": updated_at}}})
+
+    def roadmap_cleared(self, email):
+        self._write(email, {"$unset": {"roadmap": ""}})
+
+    def readiness_scanned(self, email, result, date):
+        score = result.get("readiness_score", 0)
+        self._write(email, {
+            "$inc": {"readiness.scans": 1, "readiness.score_sum": score},
+            "$max": {"readiness.best": score},
+            "$set": {"readiness.last": _readiness_point(result, date)},
+        })
+
+    def interview_finished(self, email, doc):
+        total = doc.get("total_score", 0)
+        self._write(email, {
+            "$inc": {"interviews.count": 1, "interviews.score_sum": total},
+            "$max": {"interviews.best": total},
+            "$push": {"interviews.recent": {"$each": [_interview_point(doc)], "$slice": -RECENT_ITEMS}},
+        })
+
+    def projects_generated(self, email, role, projects, date):
+        self._write(email, {
+            "$inc": {"projects.count": 1},
+            "$set": {"projects.latest": {"role": role, "projects": projects, "date": date}},
+        })
+
+    def assessment_saved(self, email, summary, date):
+        self._write(email, {
+            "$inc": {"assessments.count": 1},
+            "$set": {"assessments.last": {"summary": summary, "date": date}},
+        })
+
+    def failure_analyzed(self, email, result, date):
+        self._write(email, {
+            "$inc": {"failures.count": 1},
+            "$set": {"failures.last": {"type": result.get("type"), "diagnosis": result.get("diagnosis"), "date": date}},
+        })
+
+    # --- reads ---
+
+    def target_role(self, email):
+        """The role the user picked in their profile, if any (cached briefly per process)."""
+        if not email:
+            return None
+        now = time.monotonic()
+        with self._roles_lock:
+            cached = self._roles.get(email)
+        if cached and cached[0] > now:
+            return cached[1]
+        doc = self.collection.find_one({"_id": email}, {"profile.domain": 1})
+        role = ((doc or {}).get("profile") or {}).get("domain")
+        with self._roles_lock:
+            if len(self._roles) >= 10000:
+                self._roles.clear()
+            self._roles[email] = (now + TARGET_ROLE_TTL, role)
+        return role
+
+    def _rebuild(self, email):
+        """The summary document built from the source collections."""
+        analytics_buffer.flush() # so records still queued in this process are included
+        db = self.database
+        doc = {"_id": email, "built_at": datetime.datetime.utcnow()}
+
+        user = db["users"].find_one({"email": email}, {"name": 1, "profile": 1})
+        if user:
+            doc["name"] = user.get("name")
+            doc["profile"] = user.get("profile") or {}
+
+        roadmap = db["skill_gaps"].find_one({"email": email}, sort=[("updated_at", -1)])
+        if roadmap and "result" in roadmap:
+            doc["roadmap"] = {**roadmap["result"], "updated_at": roadmap.get("updated_at")}
+
+        def newest(name, limit=1, projection=None):
+            return list(db[name].find({"email": email}, projection).sort("date", -1).limit(limit))
+
+        scans = list(db["readiness_scans"].find({"email": email}, {"result": 1, "date": 1}))
+        if scans:
+            scores = [(s.get("result") or {}).get("readiness_score", 0) for s in scans]
+            last = max(scans, key=lambda s: s.get("date") or datetime.datetime.min)
+            doc["readiness"] = {"scans": len(scans), "score_sum": sum(scores), "best": max(scores),
+                                "last": _readiness_point(last.get("result") or {}, last.get("date"))}
+
+        interviews = list(db["interviews"].find({"email": email}, {"role": 1, "total_score": 1, "scores": 1, "date": 1}))
+        if interviews:
+            totals = [i.get("total_score", 0) for i in interviews]
+            interviews.sort(key=lambda i: i.get("date") or datetime.datetime.min)
+            doc["interviews"] = {"count": len(interviews), "score_sum": sum(totals), "best": max(totals),
+                                 "recent": [_interview_point(i) for i in interviews[-RECENT_ITEMS:]]}
+
+        projects = newest("generated_projects")
+        if projects:
+            p = projects[0]
+            doc["projects"] = {"count": db["generated_projects"].count_documents({"email": email}),
+                               "latest": {"role": p.get("role"), "projects": p.get("projects", []), "date": p.get("date")}}
+
+        assessments = newest("assessment_results")
+        if assessments:
+            doc["assessments"] = {"count": db["assessment_results"].count_documents({"email": email}),
+                                  "last": {"summary": assessments[0].get("summary"), "date": assessments[0].get("date")}}
+
+        failures = newest("failure_stories", projection={"result": 1, "date": 1})
+        if failures:
+            result = failures[0].get("result") or {}
+            doc["failures"] = {"count": db["failure_stories"].count_documents({"email": email}),
+                               "last": {"type": result.get("type"), "diagnosis": result.get("diagnosis"),
+                                        "date": failures[0].get("date")}}
+        return doc
+
+    def get(self, email):
+        """The user's summary document, rebuilt from the sources on first use."""
+        doc = self.collection.find_one({"_id": email})
+        if doc and doc.get("built_at"):
+            return doc
+        doc = self._rebuild(email)
+        try:
+            # Replace a hooks-only partial document; if another request rebuilt it first, read theirs
+            self.collection.replace_one({"_id": email, "built_at": {"$exists": False}}, doc, upsert=True)
+        except DuplicateKeyError:
+            return self.collection.find_one({"_id": email}) or doc
+        return doc
+
+def _average(section, total_field, count_field):
+    count = section.get(count_field, 0)
+    return round(section.get(total_field, 0) / count, 2) if count else None
+
+def dashboard_view(doc):
+    """The API shape of a summary document."""
+    readiness = doc.get("readiness") or {}
+    interviews = doc.get("interviews") or {}
+    projects = doc.get("projects") or {}
+    assessments = doc.get("assessments") or {}
+    failures = doc.get("failures") or {}
+    return {
+        "email": doc["_id"],
+        "name": doc.get("name"),
+        "profile": doc.get("profile") or {},
+        "roadmap": doc.get("roadmap"),
+        "readiness": {
+            "scans": readiness.get("scans", 0),
+            "averageScore": _average(readiness, "score_sum", "scans"),
+            "bestScore": readiness.get("best"),
+            "last": readiness.get("last"),
+        },
+        "interviews": {
+            "count": interviews.get("count", 0),
+            "averageScore": _average(interviews, "score_sum", "count"),
+            "bestScore": interviews.get("best"),
+            "recent": list(reversed(interviews.get("recent", []))),
+        },
+        "projects": {"count": projects.get("count", 0), "latest": projects.get("latest")},
+        "assessments": {"count": assessments.get("count", 0), "last": assessments.get("last")},
+        "failures": {"count": failures.get("count", 0), "last": failures.get("last")},
+    }
+
+user_summaries = UserSummaries(db)
@@ -0,0 +1,124 @@
+"""
+The shared MongoDB connection. The client is created on first use in each
+process (a forked worker builds its own rather than inheriting the parent's),
+so importing this module never touches the network; if the server is
+unreachable the app falls back to an in-memory mongomock database. Modules
+bind collections through `db`, whose handles resolve against the current
+process's client, and register their indexes with ensure_index(), which
+creates them once that client exists.
+"""
+import datetime
+import os
+import threading
+
+from bson import ObjectId
+from flask.json.provider import DefaultJSONProvider
+from pymongo import MongoClient
+
+from core.config import DB_NAME, MONGO_URI
+from core.metrics import MongoCommandTimer
+
+def bson_default(o):
+    """JSON fallback for Mongo types: ObjectId -> str, datetimes -> ISO 8601, binary elided."""
+    if isinstance(o, ObjectId):
+        return str(o)
+    if isinstance(o, (datetime.datetime, datetime.date)):
+        return o.isoformat()
+    if isinstance(o, bytes):
+        return f"<binary {len(o)} bytes>"
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+class MongoJSONProvider(DefaultJSONProvider):
+    default = staticmethod(bson_default)
+
+_client = None
+_db = None
+_pid = None
+_connect_lock = threading.Lock()
+_indexes = [] # (collection, keys, kwargs) created on each process's first connection
+
+def _connect():
+    if MONGO_URI.startswith("mongomock://"):
+        import mongomock
+        print("Using In-Memory Database (mongomock). Data will NOT persist after restart.")
+        return mongomock.MongoClient()
+    try:
+        client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=2000, event_listeners=[MongoCommandTimer()])
+        # verify connection early
+        client.admin.command('ping')
+        print("MongoDB Connected!")
+        return client
+    except Exception as e:
+        print(f"MongoDB Connection Error: {e}")
+        print("Falling back to In-Memory Database (mongomock). Data will NOT persist after restart.")
+        import mongomock
+        return mongomock.MongoClient()
+
+def get_client():
+    global _client, _db, _pid
+    connected = False
+    if _pid != os.getpid():
+        with _connect_lock:
+            if _pid != os.getpid():
+                # A client inherited across fork must not be used (or closed) by the child
+                client = _connect()
+                _db = client[DB_NAME]
+                _client = client
+                _pid = os.getpid()
+                connected = True
+    if connected:
+        for collection, keys, kwargs in list(_indexes):
+            _create_index(collection, keys, kwargs)
+    return _client
+
+def get_db():
+    get_client()
+    return _db
+
+def is_mock():
+    """True when running on the per-process mongomock fallback."""
+    return type(get_client()).__module__.startswith("mongomock")
+
+def _create_index(collection, keys, kwargs):
+    try:
+        collection.create_index(keys, **kwargs)
+    except Exception as e:
+        print(f"Could not create {collection.name} index: {e}")
+
+def ensure_index(collection, keys, **kwargs):
+    """Create an index now if this process is connected, else once it connects."""
+    _indexes.append((collection, keys, kwargs))
+    if _pid == os.getpid():
+        _create_index(collection, keys, kwargs)
+
+class LazyCollection:
+    """A collection handle that resolves against the current process's client when used."""
+
+    def __init__(self, name):
+        self.name = name
+        self._resolved = (None, None) # (client, collection)
+
+    def _collection(self):
+        client, collection = self._resolved
+        if client is not _client or _pid != os.getpid():
+            get_client()
+            collection = _db[self.name]
+            self._resolved = (_client, collection)
+        return collection
+
+    def __getattr__(self, attr):
+        return getattr(self._collection(), attr)
+
+    def __getitem__(self, name):
+        return self._collection()[name]
+
+class LazyDatabase:
+    """Like get_db(), but connects only when a collection is actually used."""
+
+    def __getitem__(self, name):
+        return LazyCollection(name)
+
+    def __getattr__(self, attr):
+        return getattr(get_db(), attr)
+
+db = LazyDatabase()
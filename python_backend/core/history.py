@@ -0,0 +1,135 @@
+"""
+Per-user readiness history. Each user has one summary document in
+`readiness_history` (keyed by email) that every scan updates in place:
+running count/sum/best/worst, the last HISTORY_POINTS scores, and
+matched/missing counts per skill. The history endpoint is then one _id read
+instead of a scan over `readiness_scans`. A user's first scan after this
+was introduced backfills the document from their stored scans.
+"""
+import datetime
+
+from pymongo.errors import DuplicateKeyError
+
+from core.db import db, ensure_index
+from core.write_buffer import analytics_buffer
+
+HISTORY_POINTS = 50
+
+def skill_field(skill):
+    """Skill names as Mongo field names ('.' and '$' are not allowed in them)."""
+    return skill.replace(".", "．").replace("$", "＄")
+
+def skill_name(field):
+    return field.replace("．", ".").replace("＄", "$")
+
+def scan_point(result, date):
+    return {
+        "score": result.get("readiness_score", 0),
+        "date": date,
+        "jd_id": result.get("jd_id"),
+        "matched": result.get("matched_skills_count", 0),
+        "required": result.get("required_skills_count", 0),
+    }
+
+def _skill_counts(result):
+    matched = set(result.get("matched_skills") or [])
+    missing = [s for s in result.get("required_skills") or [] if s not in matched]
+    return ({skill_field(s): 1 for s in matched}, {skill_field(s): 1 for s in missing})
+
+class ReadinessHistory:
+    def __init__(self, collection, scans):
+        self.collection = collection
+        self.scans = scans
+        ensure_index(self.scans, [("email", 1), ("date", 1)])
+
+    def _update(self, result, date):
+        score = result.get("readiness_score", 0)
+        matched, missing = _skill_counts(result)
+        inc = {"scans": 1, "score_sum": score}
+        inc.update({f"matched.{k}": v for k, v in matched.items()})
+        inc.update({f"missing.{k}": v for k, v in missing.items()})
+        return {
+            "$inc": inc,
+            "$max": {"best": score, "last_date": date},
+            "$min": {"worst": score, "first_date": date},
+            "$push": {"series": {"$each": [scan_point(result, date)], "$slice": -HISTORY_POINTS}},
+        }
+
+    def _backfill(self, email):
+        """A summary document built from the user's stored readiness_scans."""
+        # So scans still queued in this process are included (a no-op when this runs on the flusher,
+        # where every earlier scan has already been written)
+        analytics_buffer.flush()
+        doc = {"_id": email, "scans": 0, "score_sum": 0, "matched": {}, "missing": {}, "series": []}
+        for scan in self.scans.find({"email": email}, {"result": 1, "date": 1}).sort("date", 1):
+            result, date = scan.get("result") or {}, scan.get("date")
+            score = result.get("readiness_score", 0)
+            doc["scans"] += 1
+            doc["score_sum"] += score
+            doc["best"] = max(doc.get("best", score), score)
+            doc["worst"] = min(doc.get("worst", score), score)
+            doc.setdefault("first_date", date)
+            doc["last_date"] = date
+            matched, missing = _skill_counts(result)
+            for k in matched:
+                doc["matched"][k] = doc["matched"].get(k, 0) + 1
+            for k in missing:
+                doc["missing"][k] = doc["missing"].get(k, 0) + 1
+            doc["series"].append(scan_point(result, date))
+        doc["series"] = doc["series"][-HISTORY_POINTS:]
+        return doc
+
+    def record(self, email, result, date=None):
+        """
+        Fold one scan result into the user's summary. Queue it (analytics_buffer.defer)
+        before the scan itself is queued to readiness_scans, so a backfill never counts it twice.
+        """
+        date = date or datetime.datetime.utcnow()
+        update = self._update(result, date)
+        if self.collection.update_one({"_id": email}, update).matched_count:
+            return
+        try:
+            self.collection.insert_one(self._backfill(email))
+        except DuplicateKeyError:
+            pass # a concurrent scan created it first
+        self.collection.update_one({"_id": email}, update)
+
+    def summary(self, email, top=10):
+        doc = self.collection.find_one({"_id": email})
+        if not doc:
+            return {"scans": 0, "series": [], "averageScore": None, "bestScore": None, "worstScore": None,
+                    "trend": None, "topMatchedSkills": [], "topMissingSkills": []}
+        series = doc.get("series", [])
+        matched, missing = doc.get("matched", {}), doc.get("missing", {})
+
+        def frequencies(counts):
+            rows = []
+            for field, count in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:top]:
+                seen = matched.get(field, 0) + missing.get(field, 0)
+                rows.append({"skill": skill_name(field), "count": count, "rate": round(count / seen, 2)})
+            return rows
+
+        return {
+            "scans": doc["scans"],
+            "series": [{"score": p["score"], "date": p["date"], "jd_id": p.get("jd_id")} for p in series],
+            "averageScore": round(doc["score_sum"] / doc["scans"], 2) if doc["scans"] else None,
+            "bestScore": doc.get("best"),
+            "worstScore": doc.get("worst"),
+            "firstScan": doc.get("first_date"),
+            "lastScan": doc.get("last_date"),
+            "trend": _slope([p["score"] for p in series]),
+            "topMatchedSkills": frequencies(matched),
+            "topMissingSkills": frequencies(missing),
+        }
+
+def _slope(scores):
+    """Least-squares change in score per scan over the recent series (None with fewer than two scans)."""
+    n = len(scores)
+    if n < 2:
+        return None
+    mean_x, mean_y = (n - 1) / 2, sum(scores) / n
+    num = sum((i - mean_x) * (y - mean_y) for i, y in enumerate(scores))
+    den = sum((i - mean_x) ** 2 for i in range(n))
+    return round(num / den, 2)
+
+readiness_history = ReadinessHistory(db["readiness_history"], db["readiness_scans"])
@@ -0,0 +1,183 @@
+"""
+Corpus of the job descriptions users scan. Each distinct JD (by hash of its
+whitespace-normalized text) is stored once, in full, in `job_descriptions`
+with its index keys: canonical skill ids ("s:<id>") and content terms
+("t:<term>"). A multikey index on `keys` is the inverted index, and
+`jd_terms` keeps each key's document frequency, so "similar JDs" is an
+indexed lookup on the query's rarest keys plus IDF-weighted Jaccard scoring
+of the candidates. Scores are aggregated on the JD document (count, sum, histogram buckets) and
+per user in `jd_scores`, so "what did others score on this JD" reads one
+document. Everything is updated incrementally as scans come in.
+"""
+import datetime
+import hashlib
+import math
+
+from pymongo.errors import BulkWriteError
+
+from core.db import db, ensure_index
+from core.skills import onet_skill_index, tokenize
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could do does
+doing during each etc for from had has have having he her here hers him his how i if in into is it
+its just may me more most must my no nor not of off on once only or other our out over own per
+same she should so some such than that the their them then there these they this those through to
+too under until up us very was we were what when where which while who whom why will with within
+would you your yours able across ability based candidate candidates company experience ideal
+including job looking new plus preferred required requirements responsibilities role skills
+strong team work working years year hiring
+""".split())
+
+MAX_TERMS = 40 # content terms indexed per JD (most frequent first)
+QUERY_KEYS = 12 # rarest query keys used to fetch candidates
+MAX_CANDIDATES = 500
+SCORE_BUCKETS = 10 # histogram buckets of width 10 over 0..100
+CORPUS_KEY = "__corpus__" # jd_terms entry whose df is the number of JDs
+
+def normalize_jd(text):
+    return " ".join(str(text).split())
+
+def jd_hash(text):
+    return hashlib.sha256(normalize_jd(text).lower().encode("utf-8")).hexdigest()
+
+def index_keys(text):
+    """Skill-id and term keys for a JD, skills first."""
+    skills = sorted(onet_skill_index().find_in_text(text))
+    counts = {}
+    for token in tokenize(text):
+        if len(token) > 2 and token not in STOP_WORDS and not token.isdigit():
+            counts[token] = counts.get(token, 0) + 1
+    terms = sorted(counts, key=lambda t: (-counts[t], t))[:MAX_TERMS]
+    return [f"s:{s}" for s in skills] + [f"t:{t}" for t in terms]
+
+def score_bucket(score):
+    return min(int(score // (100 / SCORE_BUCKETS)), SCORE_BUCKETS - 1)
+
+class JobDescriptionIndex:
+    def __init__(self, jds, terms, scores):
+        self.jds = jds
+        self.terms = terms # key -> number of JDs containing it
+        self.scores = scores # latest score per (jd, user)
+        ensure_index(self.jds, "keys")
+        ensure_index(self.scores, [("jd_id", 1), ("email", 1)], unique=True)
+
+    def add(self, text):
+        """Store a JD (once per distinct text) and return its id."""
+        jd_id = jd_hash(text)
+        if self.jds.find_one({"_id": jd_id}, {"_id": 1}):
+            return jd_id
+        keys = index_keys(text)
+        result = self.jds.update_one(
+            {"_id": jd_id},
+            {"$setOnInsert": {"text": normalize_jd(text), "keys": keys, "scans": 0, "score_sum": 0.0,
+                              "created_at": datetime.datetime.utcnow()}},
+            upsert=True
+        )
+        # Only the writer that actually inserted the JD counts its keys
+        if result.upserted_id is not None:
+            self._count_keys(keys + [CORPUS_KEY])
+        return jd_id
+
+    def _count_keys(self, keys):
+        """Increment the document frequency of every key: one update for known keys, one insert for new ones."""
+        known = {doc["_id"] for doc in self.terms.find({"_id": {"$in": keys}}, {"_id": 1})}
+        if known:
+            self.terms.update_many({"_id": {"$in": list(known)}}, {"$inc": {"df": 1}})
+        new = [k for k in keys if k not in known]
+        if not new:
+            return
+        try:
+            self.terms.insert_many([{"_id": k, "df": 1} for k in new], ordered=False)
+        except BulkWriteError as e:
+            # Another worker added some of these keys since the lookup; count ours on top of theirs
+            taken = [err["op"]["_id"] for err in e.details.get("writeErrors", []) if err.get("code") == 11000]
+            if taken:
+                self.terms.update_many({"_id": {"$in": taken}}, {"$inc": {"df": 1}})
+
+    def record_scan(self, text, score, email=None):
+        """Index the scanned JD and fold one readiness score into its aggregates; returns the JD id."""
+        jd_id = self.add(text)
+        self.jds.update_one({"_id": jd_id}, {"$inc": {
+            "scans": 1, "score_sum": float(score), f"score_buckets.{score_bucket(score)}": 1
+        }})
+        if email:
+            self.scores.update_one(
+                {"jd_id": jd_id, "email": email},
+                {"$set": {"score": float(score), "date": datetime.datetime.utcnow()}},
+                upsert=True
+            )
+        return jd_id
+
+    def _idf(self, keys):
+        corpus = (self.terms.find_one({"_id": CORPUS_KEY}) or {}).get("df", 0)
+        df = {doc["_id"]: doc["df"] for doc in self.terms.find({"_id": {"$in": list(keys)}})}
+        return {k: math.log((1 + corpus) / (1 + df.get(k, 0))) + 1 for k in keys}, df
+
+    def similar(self, text=None, jd_id=None, limit=10):
+        """
+        JDs sharing the most (IDF-weighted) skills and terms with a JD given by
+        text or id, as [{"jd_id", "score", "sharedSkills", "preview", "scans", "meanScore"}].
+        Returns None for an unknown jd_id.
+        """
+        if jd_id is not None:
+            doc = self.jds.find_one({"_id": jd_id}, {"keys": 1})
+            if doc is None:
+                return None
+            keys = doc["keys"]
+        else:
+            jd_id = jd_hash(text)
+            keys = index_keys(text)
+        if not keys:
+            return []
+
+        idf, df = self._idf(keys)
+        # Fetch candidates through the rarest keys only; common keys still count when scoring
+        probe = sorted((k for k in keys if df.get(k)), key=lambda k: df[k])[:QUERY_KEYS]
+        if not probe:
+            return []
+        query_weight = sum(idf.values())
+        unseen_weight = query_weight / len(idf) # candidate keys outside the query are weighted at the mean IDF
+        candidates = self.jds.find(
+            {"keys": {"$in": probe}, "_id": {"$ne": jd_id}},
+            {"keys": 1, "text": 1, "scans": 1, "score_sum": 1}
+        ).limit(MAX_CANDIDATES)
+
+        ranked = []
+        for doc in candidates:
+            shared = [k for k in doc["keys"] if k in idf]
+            overlap = sum(idf[k] for k in shared)
+            union = query_weight + (len(doc["keys"]) - len(shared)) * unseen_weight
+            ranked.append((overlap / union, doc, shared))
+        ranked.sort(key=lambda r: (-r[0], r[1]["_id"]))
+
+        return [{
+            "jd_id": doc["_id"],
+            "score": round(score, 4),
+            "sharedSkills": [onet_skill_index().name(k[2:]) for k in shared if k.startswith("s:")],
+            "preview": doc["text"][:200],
+            "scans": doc.get("scans", 0),
+            "meanScore": round(doc["score_sum"] / doc["scans"], 2) if doc.get("scans") else None,
+        } for score, doc, shared in ranked[:limit]]
+
+    def score_summary(self, jd_id, email=None):
+        """Aggregated readiness scores on one JD (plus the caller's own latest score), or None."""
+        doc = self.jds.find_one({"_id": jd_id}, {"scans": 1, "score_sum": 1, "score_buckets": 1})
+        if doc is None:
+            return None
+        buckets = doc.get("score_buckets") or {}
+        histogram = [
+            {"range": [i * 100 // SCORE_BUCKETS, (i + 1) * 100 // SCORE_BUCKETS], "count": buckets.get(str(i), 0)}
+            for i in range(SCORE_BUCKETS)
+        ]
+        own = self.scores.find_one({"jd_id": jd_id, "email": email}) if email else None
+        return {
+            "jd_id": jd_id,
+            "scans": doc.get("scans", 0),
+            "users": self.scores.count_documents({"jd_id": jd_id}),
+            "meanScore": round(doc["score_sum"] / doc["scans"], 2) if doc.get("scans") else None,
+            "histogram": histogram,
+            "yourScore": own["score"] if own else None,
+        }
+
+jd_index = JobDescriptionIndex(db["job_descriptions"], db["jd_terms"], db["jd_scores"])
@@ -0,0 +1,68 @@
+"""
+Incremental JSON object extraction from a streamed model completion. Small
+models wrap, truncate or slightly mangle the JSON they are asked for, and
+parsing only the finished completion loses the whole batch to one bad
+object. JsonObjectStream scans tokens as they arrive, tracking brace depth
+outside strings, and returns each object as soon as its closing brace does,
+whether it sits in a list, inside a wrapper object or between chatter.
+Objects that don't parse are skipped and scanning carries on.
+"""
+import json
+
+class JsonObjectStream:
+    def __init__(self):
+        self._text = "" # the current top-level object so far
+        self._starts = [] # offsets in _text of the open '{'s
+        self._in_string = False
+        self._escaped = False
+        self.malformed = 0 # closed objects that failed to parse
+
+    def feed(self, text):
+        """The objects completed by `text`, innermost first."""
+        found = []
+        base = len(self._text)
+        self._text += text
+        for i in range(base, len(self._text)):
+            ch = self._text[i]
+            if not self._starts:
+                if ch == "{": # anything between top-level objects is ignored
+                    self._starts.append(i)
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._starts.append(i)
+            elif ch == "}":
+                start = self._starts.pop()
+                try:
+                    found.append(json.loads(self._text[start:i + 1]))
+                except ValueError:
+                    self.malformed += 1
+
+        # Keep only the open top-level object
+        cut = self._starts[0] if self._starts else len(self._text)
+        self._text = self._text[cut:]
+        self._starts = [s - cut for s in self._starts]
+        return found
+
+def ollama_tokens(response):
+    """The text pieces of a streamed (NDJSON) Ollama /api/generate response."""
+    for line in response.iter_lines():
+        if not line:
+            continue
+        try:
+            chunk = json.loads(line)
+        except ValueError:
+            continue
+        if chunk.get("error"):
+            raise RuntimeError(f"Model error: {chunk['error']}")
+        yield chunk.get("response", "")
+        if chunk.get("done"):
+            break
@@ -0,0 +1,43 @@
+"""Mongo-backed leases shared by the assessment and smart-interview seeders."""
+import datetime
+import os
+import socket
+
+from pymongo.errors import DuplicateKeyError
+
+from core.db import db, ensure_index
+
+class SeedingLocks:
+    """
+    Cross-worker leases for background seeders, one Mongo document per key.
+    A lease is taken by upserting over a missing or expired document; a live
+    lease makes the upsert collide on _id, so only one process seeds a role.
+    """
+
+    def __init__(self, collection, ttl=600):
+        self.collection = collection
+        self.ttl = ttl
+        ensure_index(self.collection, "expires_at", expireAfterSeconds=0)
+
+    def acquire(self, key):
+        now = datetime.datetime.utcnow()
+        try:
+            self.collection.update_one(
+                {"_id": key, "expires_at": {"$lt": now}},
+                {"$set": {"expires_at": now + datetime.timedelta(seconds=self.ttl), "owner": f"{socket.gethostname()}:{os.getpid()}"}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def is_held(self, key):
+        return self.collection.count_documents(
+            {"_id": key, "expires_at": {"$gt": datetime.datetime.utcnow()}}, limit=1
+        ) > 0
+
+    def release(self, key):
+        self.collection.delete_one({"_id": key})
+
+# Track roles currently being seeded (across all workers) to avoid duplicate threads
+seeding_locks = SeedingLocks(db["seeding_locks"])
@@ -0,0 +1,159 @@
+"""
+Per-route latency histograms, status counters and named sub-span timings
+(pdf_extract, skill_match, mongo.<command>, ollama, http.<service>), kept
+in-process and rendered in Prometheus text format at /metrics.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import Response, g, request
+from pymongo import monitoring
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1) # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {} # (route, method) -> Histogram
+        self.statuses = {} # (route, method, status) -> count
+        self.spans = {} # span name -> Histogram
+        self.collectors = [] # callables returning extra exposition lines
+
+    def observe_request(self, route, method, status, seconds):
+        with self._lock:
+            hist = self.requests.get((route, method))
+            if hist is None:
+                hist = self.requests[(route, method)] = Histogram()
+            hist.observe(seconds)
+            key = (route, method, status)
+            self.statuses[key] = self.statuses.get(key, 0) + 1
+
+    def observe_span(self, name, seconds):
+        with self._lock:
+            hist = self.spans.get(name)
+            if hist is None:
+                hist = self.spans[name] = Histogram()
+            hist.observe(seconds)
+
+    @staticmethod
+    def _labels(**labels):
+        def escape(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return ",".join(f'{k}="{escape(v)}"' for k, v in labels.items())
+
+    def _histogram_lines(self, name, counts, total, count, **labels):
+        base = self._labels(**labels)
+        cumulative = 0
+        lines = []
+        for bound, bucket_count in zip(LATENCY_BUCKETS + ("+Inf",), counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{base},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{base}}} {total:.6f}")
+        lines.append(f"{name}_count{{{base}}} {count}")
+        return lines
+
+    def render(self):
+        with self._lock:
+            request_hists = [(k, list(h.counts), h.sum, h.count) for k, h in self.requests.items()]
+            span_hists = [(k, list(h.counts), h.sum, h.count) for k, h in self.spans.items()]
+            statuses = dict(self.statuses)
+
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (route, method), counts, total, count in request_hists:
+            lines += self._histogram_lines("http_request_duration_seconds", counts, total, count, route=route, method=method)
+
+        lines += ["# HELP http_requests_total Responses by route and status.", "# TYPE http_requests_total counter"]
+        for (route, method, status), count in statuses.items():
+            lines.append(f"http_requests_total{{{self._labels(route=route, method=method, status=status)}}} {count}")
+
+        lines += ["# HELP span_duration_seconds Time spent in named request stages.", "# TYPE span_duration_seconds histogram"]
+        for name, counts, total, count in span_hists:
+            lines += self._histogram_lines("span_duration_seconds", counts, total, count, span=name)
+
+        for collector in self.collectors:
+            try:
+                lines += collector()
+            except Exception as e:
+                print(f"Metrics collector error: {e}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+@contextmanager
+def span(name):
+    """Time a block and record it under `name` in span_duration_seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe_span(name, time.perf_counter() - start)
+
+def timed(name):
+    """Decorator form of span()."""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return f(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """Feeds the driver's own command durations into span_duration_seconds as mongo.<command>."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        metrics.observe_span(f"mongo.{event.command_name}", event.duration_micros / 1e6)
+
+    def failed(self, event):
+        metrics.observe_span(f"mongo.{event.command_name}", event.duration_micros / 1e6)
+
+def _record_request(status):
+    start = g.pop("request_start", None)
+    if start is None:
+        return
+    route = request.url_rule.rule if request.url_rule else "<unmatched>"
+    metrics.observe_request(route, request.method, status, time.perf_counter() - start)
+
+def init_app(app):
+    """Register the request timing hooks and the /metrics route on `app`."""
+
+    @app.before_request
+    def start_request_timer():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        _record_request(response.status_code)
+        return response
+
+    @app.teardown_request
+    def record_failed_request(exc):
+        # after_request is skipped for unhandled exceptions; count those as 500s
+        if exc is not None:
+            _record_request(500)
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics_endpoint():
+        return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,29 @@
+"""
+O*NET occupation and technology-skill tables, shared by the roadmap and
+skill-gap blueprints. Loaded once at import; a preloading server shares
+them copy-on-write across workers.
+"""
+import os
+
+import pandas as pd
+
+from core.config import BASE_DIR
+
+try:
+    occupations = pd.read_csv(
+        os.path.join(BASE_DIR, "Occupation Data.txt"),
+        sep="\t",
+        dtype=str
+    )
+    tech_data = pd.read_csv(
+        os.path.join(BASE_DIR, "Technology Skills.txt"),
+        sep="\t",
+        dtype=str
+    )
+    occupations.columns = occupations.columns.str.strip()
+    tech_data.columns = tech_data.columns.str.strip()
+    print("O*NET Data Loaded Successfully")
+except Exception as e:
+    print(f"Error loading O*NET data: {e}")
+    occupations = pd.DataFrame(columns=["Title", "O*NET-SOC Code"])
+    tech_data = pd.DataFrame(columns=["O*NET-SOC Code", "Example"])
@@ -0,0 +1,8 @@
+"""Tolerant parsing of common query/body parameters."""
+
+def limit_param(value, default=10, maximum=50):
+    """A result-count parameter clamped to 1..maximum; missing or non-numeric values give `default`."""
+    try:
+        return max(1, min(int(value), maximum))
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,118 @@
+"""
+Admins can profile a single request with `X-Profile: sample|cprofile` (or
+?_profile=...). PROFILE_SAMPLE_RATE additionally profiles that fraction of
+all requests with the stack sampler. Results go to the `profiles`
+collection: the sampler stores folded stacks ("a;b;c <count>" lines, ready
+for flamegraph.pl / speedscope), cProfile stores its top functions.
+"""
+import cProfile
+import datetime
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+
+from flask import g, request
+
+from core.auth import is_admin, request_email
+from core.write_buffer import analytics_buffer
+
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL = float(os.environ.get("PROFILE_INTERVAL", "0.005")) # seconds between stack samples
+PROFILE_MODES = ("sample", "cprofile")
+
+class StackSampler:
+    """Samples one thread's Python stack from a helper thread and aggregates folded stacks."""
+
+    def __init__(self, thread_id, interval=PROFILE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return "\n".join(f"{stack} {count}" for stack, count in sorted(self.counts.items()))
+
+def _requested_profile_mode():
+    requested = (request.headers.get("X-Profile") or request.args.get("_profile") or "").lower()
+    if requested:
+        if is_admin():
+            return requested if requested in PROFILE_MODES else "sample"
+        return None
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return "sample"
+    return None
+
+def start_request_profiler():
+    mode = _requested_profile_mode()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == "sample":
+        profiler = StackSampler(threading.get_ident())
+        profiler.start()
+    else:
+        return
+    g.profiler = (mode, profiler, time.perf_counter())
+
+def finish_request_profiler(response):
+    active = g.pop("profiler", None)
+    if active is None:
+        return response
+    mode, profiler, started = active
+    doc = {
+        "mode": mode,
+        "route": request.url_rule.rule if request.url_rule else "<unmatched>",
+        "method": request.method,
+        "path": request.path,
+        "status": response.status_code,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        "email": request_email(),
+        "date": datetime.datetime.utcnow()
+    }
+    if mode == "cprofile":
+        profiler.disable()
+        stats = pstats.Stats(profiler).sort_stats("cumulative")
+        doc["top"] = [
+            {
+                "function": f"{func[2]} ({os.path.basename(func[0])}:{func[1]})",
+                "ncalls": nc,
+                "tottime": round(tt, 6),
+                "cumtime": round(ct, 6)
+            }
+            for func, (cc, nc, tt, ct, callers) in sorted(stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:50]
+        ]
+    else:
+        doc["folded"] = profiler.stop()
+        doc["samples"] = profiler.samples
+    analytics_buffer.add("profiles", doc)
+    response.headers["X-Profiled"] = mode
+    return response
+
+def init_app(app):
+    """Register the profiler hooks; must run after auth.init_app so g.user is set."""
+    app.before_request(start_request_profiler)
+    app.after_request(finish_request_profiler)
@@ -0,0 +1,361 @@
+"""
+Protection for the model-backed routes, which can each hold the local model
+for up to 120s.
+
+Two layers, applied by the @model_route decorator:
+
+- A token bucket per caller (user_id from the bearer token, else client IP):
+  AI_RATE_LIMIT_PER_MINUTE tokens refill per minute up to AI_RATE_LIMIT_BURST.
+  An empty bucket answers 429 with Retry-After. RATE_LIMIT_STORE=mongo shares
+  the buckets across workers; the default in-memory store is per process.
+  AI_RATE_LIMIT_PER_MINUTE=0 disables the limiter (benchmarks, load tests).
+- An admission controller capping concurrent model calls at
+  MODEL_MAX_IN_FLIGHT. Up to MODEL_QUEUE_MAX more requests per process wait
+  at most MODEL_QUEUE_TIMEOUT seconds for a slot; everything beyond that is
+  shed with 503 instead of parking another thread on the model. With
+  RATE_LIMIT_STORE=mongo the slots are shared by all workers, so the cap is
+  for the whole deployment; otherwise it is per process.
+
+Routes that only sometimes reach the model (a question bank miss, a role
+without a predefined roadmap) wrap just the model call in
+request_model_slot() instead of using the decorator. The question seeders
+take their slots through model_slot(), so background generation counts
+against the same cap as the requests it competes with.
+"""
+import datetime
+import math
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import g, jsonify, request
+from pymongo.errors import DuplicateKeyError
+
+from core.db import db, ensure_index
+from core.metrics import metrics
+
+AI_RATE_LIMIT_PER_MINUTE = float(os.environ.get("AI_RATE_LIMIT_PER_MINUTE", "20"))
+AI_RATE_LIMIT_BURST = int(os.environ.get("AI_RATE_LIMIT_BURST", "5"))
+MODEL_MAX_IN_FLIGHT = int(os.environ.get("MODEL_MAX_IN_FLIGHT", "8"))
+MODEL_QUEUE_MAX = int(os.environ.get("MODEL_QUEUE_MAX", "16"))
+MODEL_QUEUE_TIMEOUT = float(os.environ.get("MODEL_QUEUE_TIMEOUT", "5"))
+MODEL_BACKGROUND_WAIT = float(os.environ.get("MODEL_BACKGROUND_WAIT", "60"))
+MODEL_SLOT_LEASE = float(os.environ.get("MODEL_SLOT_LEASE", "150")) # the longest a model call may hold a slot
+RATE_LIMIT_MAX_KEYS = 100000
+
+def _refill(tokens, updated_at, now, rate, burst):
+    return min(burst, tokens + max(0.0, now - updated_at) * rate)
+
+class MemoryBucketStore:
+    """Per-process buckets; least recently used callers are evicted (a fresh bucket is full anyway)."""
+
+    def __init__(self, max_keys=RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict() # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst):
+        """Take one token; returns (allowed, tokens_left)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = _refill(tokens, updated_at, now, rate, burst)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, tokens
+
+class MongoBucketStore:
+    """
+    Buckets shared by all workers, one document per key. Updates are
+    compare-and-set on the previous (tokens, updated_at) pair, so concurrent
+    takes from different workers never both spend the same token.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, collection):
+        self.collection = collection
+        ensure_index(self.collection, "expires_at", expireAfterSeconds=0)
+
+    def take(self, key, rate, burst):
+        for _ in range(self.MAX_ATTEMPTS):
+            now = time.time()
+            # A bucket left alone until it is full again is equivalent to no bucket
+            expires_at = datetime.datetime.utcfromtimestamp(now + burst / rate)
+            doc = self.collection.find_one({"_id": key})
+            if doc is None:
+                try:
+                    self.collection.insert_one({"_id": key, "tokens": burst - 1, "updated_at": now, "expires_at": expires_at})
+                    return True, burst - 1
+                except DuplicateKeyError:
+                    continue
+            tokens = _refill(doc["tokens"], doc["updated_at"], now, rate, burst)
+            if tokens < 1:
+                return False, tokens # nothing to write: the stored pair still refills to the same value
+            result = self.collection.update_one(
+                {"_id": key, "tokens": doc["tokens"], "updated_at": doc["updated_at"]},
+                {"$set": {"tokens": tokens - 1, "updated_at": now, "expires_at": expires_at}}
+            )
+            if result.matched_count:
+                return True, tokens - 1
+        return False, 0.0 # lost every race: this key is being hammered
+
+class RateLimiter:
+    def __init__(self, store, per_minute, burst):
+        self.store = store
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.rejected = 0
+
+    @property
+    def enabled(self):
+        return self.rate > 0 and self.burst > 0
+
+    def check(self, key):
+        """Returns (allowed, retry_after_seconds). Store failures fail open."""
+        if not self.enabled:
+            return True, 0
+        try:
+            allowed, tokens = self.store.take(key, self.rate, self.burst)
+        except Exception as e:
+            print(f"Rate limit store error: {e}")
+            return True, 0
+        if allowed:
+            return True, 0
+        self.rejected += 1
+        return False, max(1, math.ceil((1 - tokens) / self.rate))
+
+class MemorySlotStore:
+    """Per-process admission slots: a plain counter."""
+
+    POLL_INTERVAL = 0.05 # local releases also wake waiters directly
+
+    def __init__(self, size):
+        self.size = size
+        self.taken = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        """A slot token, or None when all slots are taken."""
+        with self._lock:
+            if self.taken >= self.size:
+                return None
+            self.taken += 1
+            return True
+
+    def release(self, slot):
+        with self._lock:
+            self.taken -= 1
+
+class MongoSlotStore:
+    """
+    Admission slots shared by all workers: one document per slot, claimed by
+    an atomic find_one_and_update on a free or lapsed slot. A claim is a
+    lease, so a worker that dies holding slots only keeps them for `lease`
+    seconds; releases only free the slot if the lease is still theirs.
+    """
+
+    POLL_INTERVAL = 0.1 # releases in other workers are only seen by polling
+
+    def __init__(self, collection, size, lease):
+        self.collection = collection
+        self.slot_ids = [f"model:{i}" for i in range(size)]
+        self.lease = lease
+        self._ready = False
+
+    def _ensure_slots(self):
+        if self._ready:
+            return
+        for slot_id in self.slot_ids:
+            self.collection.update_one(
+                {"_id": slot_id}, {"$setOnInsert": {"holder": None, "expires_at": datetime.datetime.utcfromtimestamp(0)}}, upsert=True
+            )
+        self._ready = True
+
+    def take(self):
+        self._ensure_slots()
+        now = datetime.datetime.utcnow()
+        holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        doc = self.collection.find_one_and_update(
+            {"_id": {"$in": self.slot_ids}, "$or": [{"holder": None}, {"expires_at": {"$lt": now}}]},
+            {"$set": {"holder": holder, "expires_at": now + datetime.timedelta(seconds=self.lease)}},
+            projection={"_id": 1}
+        )
+        return (doc["_id"], holder) if doc else None
+
+    def release(self, slot):
+        slot_id, holder = slot
+        self.collection.update_one({"_id": slot_id, "holder": holder}, {"$set": {"holder": None}})
+
+_UNTRACKED = object() # admitted without a slot because the store failed
+
+class AdmissionController:
+    """
+    Caps concurrent model calls at the store's slot count, with a short
+    bounded wait queue. in_flight, waiting and stats are this process's own.
+    """
+
+    def __init__(self, store, max_queue=MODEL_QUEUE_MAX, queue_timeout=MODEL_QUEUE_TIMEOUT):
+        self.store = store
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+        self.stats = {"admitted": 0, "queued": 0, "shed": 0}
+
+    def _take(self):
+        try:
+            return self.store.take()
+        except Exception as e:
+            print(f"Admission store error: {e}")
+            return _UNTRACKED # fail open, like the rate limiter
+
+    def acquire(self, timeout=None, background=False):
+        """
+        A slot to pass to release(), or None when shed. Waits up to `timeout`
+        (default queue_timeout) for a slot; background callers (the seeders)
+        hold no request thread, so they don't count against max_queue.
+        """
+        timeout = self.queue_timeout if timeout is None else timeout
+        slot = self._take()
+        if slot is None:
+            with self._cond:
+                if timeout <= 0 or (not background and self.waiting >= self.max_queue):
+                    self.stats["shed"] += 1
+                    return None
+                self.waiting += 1
+                self.stats["queued"] += 1
+            deadline = time.monotonic() + timeout
+            try:
+                while slot is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    with self._cond:
+                        self._cond.wait(min(remaining, self.store.POLL_INTERVAL))
+                    slot = self._take()
+            finally:
+                with self._cond:
+                    self.waiting -= 1
+            if slot is None:
+                with self._cond:
+                    self.stats["shed"] += 1
+                return None
+        with self._cond:
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+        return slot
+
+    def release(self, slot):
+        if slot is not _UNTRACKED:
+            try:
+                self.store.release(slot)
+            except Exception as e:
+                print(f"Admission store error: {e}") # the lease frees it eventually
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+class ModelBusy(RuntimeError):
+    """No model capacity for this call; response() is the 429/503 a request handler should return."""
+
+    def __init__(self, msg="AI server is busy, please try again shortly", status=503, retry_after=1):
+        super().__init__(msg)
+        self.status = status
+        self.retry_after = retry_after
+
+    def response(self):
+        return _reject(self.status, str(self), self.retry_after)
+
+if os.environ.get("RATE_LIMIT_STORE", "memory").lower() == "mongo":
+    _bucket_store = MongoBucketStore(db["rate_limits"])
+    _slot_store = MongoSlotStore(db["model_slots"], MODEL_MAX_IN_FLIGHT, MODEL_SLOT_LEASE)
+else:
+    _bucket_store = MemoryBucketStore()
+    _slot_store = MemorySlotStore(MODEL_MAX_IN_FLIGHT)
+
+ai_rate_limiter = RateLimiter(_bucket_store, AI_RATE_LIMIT_PER_MINUTE, AI_RATE_LIMIT_BURST)
+model_admission = AdmissionController(_slot_store)
+
+def client_key():
+    """Rate limit identity: the token's user_id, else the client address."""
+    if g.get("user"):
+        return f"user:{g.user['user_id']}"
+    return f"ip:{request.remote_addr}"
+
+def _reject(status, msg, retry_after):
+    response = jsonify({"error": msg})
+    response.status_code = status
+    response.headers["Retry-After"] = str(retry_after)
+    return response
+
+def _admit_request():
+    """Rate-limit the caller and take an admission slot with the request queue's bounds; raises ModelBusy."""
+    allowed, retry_after = ai_rate_limiter.check(client_key())
+    if not allowed:
+        raise ModelBusy("Too many AI requests, please slow down", 429, retry_after)
+    slot = model_admission.acquire()
+    if slot is None:
+        raise ModelBusy(retry_after=max(1, math.ceil(model_admission.queue_timeout)))
+    return slot
+
+def model_route(f):
+    """For routes that always call the model: rate-limit, then hold an admission slot for the whole request."""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        try:
+            slot = _admit_request()
+        except ModelBusy as busy:
+            return busy.response()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            model_admission.release(slot)
+    return wrapper
+
+@contextmanager
+def request_model_slot():
+    """
+    model_route for just the model call of a route that can often answer
+    without one: rate-limits and admits like the decorator, raising ModelBusy.
+    """
+    slot = _admit_request()
+    try:
+        yield
+    finally:
+        model_admission.release(slot)
+
+@contextmanager
+def model_slot(timeout=MODEL_BACKGROUND_WAIT):
+    """Hold an admission slot around a background (seeder) model call; raises ModelBusy if none frees up in time."""
+    slot = model_admission.acquire(timeout, background=True)
+    if slot is None:
+        raise ModelBusy("No model slot free")
+    try:
+        yield
+    finally:
+        model_admission.release(slot)
+
+def _admission_metrics():
+    lines = ["# HELP model_admission_total Model-bound requests by admission outcome.", "# TYPE model_admission_total counter"]
+    for outcome, count in dict(model_admission.stats).items():
+        lines.append(f'model_admission_total{{outcome="{outcome}"}} {count}')
+    lines += [
+        "# TYPE model_admission_in_flight gauge", f"model_admission_in_flight {model_admission.in_flight}",
+        "# TYPE model_admission_waiting gauge", f"model_admission_waiting {model_admission.waiting}",
+        "# TYPE rate_limit_rejections_total counter", f"rate_limit_rejections_total {ai_rate_limiter.rejected}",
+    ]
+    return lines
+
+metrics.collectors.append(_admission_metrics)
@@ -0,0 +1,204 @@
+"""
+Structured resume parsing, done once per distinct resume. A PDF is reduced to
+its text, section spans (experience, education, skills, ...), skill mentions
+with character offsets, and an estimate of years of experience. The result is
+stored in `resume_parses` under the SHA-256 of the file bytes (with a small
+in-process LRU in front), so readiness scoring, skill-gap prefill and project
+generation all reuse one parse instead of re-extracting the PDF.
+"""
+import datetime
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+
+from PyPDF2 import PdfReader
+
+from core.db import db
+from core.metrics import metrics, span, timed
+from core.skills import onet_skill_index
+
+# Bump when the parse output changes so stale cached parses are redone
+PARSER_VERSION = 1
+
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "objective", "about me", "career objective"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "internships", "internship"],
+    "education": ["education", "academic background", "qualifications"],
+    "skills": ["skills", "technical skills", "core skills", "key skills", "technologies", "tech stack"],
+    "projects": ["projects", "personal projects", "academic projects"],
+    "certifications": ["certifications", "certificates", "licenses", "courses"],
+    "achievements": ["achievements", "awards", "honors", "accomplishments"],
+    "publications": ["publications", "research"],
+    "languages": ["languages"],
+    "interests": ["interests", "hobbies"],
+}
+_HEADING_OF = {h: section for section, headings in SECTION_HEADINGS.items() for h in headings}
+_HEADING_RE = re.compile(r"^[ \t]*([A-Za-z][A-Za-z &/]{1,40}?)[ \t]*:?[ \t]*$", re.MULTILINE)
+
+_MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+_MONTH = r"(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+)?"
+_RANGE_RE = re.compile(
+    _MONTH + r"((?:19|20)\d{2})\s*(?:-|–|—|to)\s*(?:" + _MONTH + r"((?:19|20)\d{2})|(present|current|now|date))",
+    re.IGNORECASE
+)
+_YEARS_RE = re.compile(r"(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years|yrs)(?:\s+of)?\s+(?:\w+\s+)?experience", re.IGNORECASE)
+
+@timed("pdf_extract")
+def extract_text_from_pdf(file):
+    reader = PdfReader(file)
+    text = ""
+    for page in reader.pages:
+        content = page.extract_text()
+        if content:
+            text += content
+    return text
+
+def find_sections(text):
+    """[{"name", "start", "end"}] for each recognised heading line; text before the first heading is not a section."""
+    heads = []
+    for m in _HEADING_RE.finditer(text):
+        section = _HEADING_OF.get(" ".join(m.group(1).lower().split()))
+        if section:
+            heads.append((section, m.start(), m.end()))
+    return [
+        {"name": name, "start": body_start, "end": heads[i + 1][1] if i + 1 < len(heads) else len(text)}
+        for i, (name, _, body_start) in enumerate(heads)
+    ]
+
+def years_of_experience(text, sections):
+    """
+    Years covered by the date ranges in the experience section (overlapping
+    jobs counted once), falling back to the largest "N years of experience"
+    claim when there are no ranges.
+    """
+    scope = [text[s["start"]:s["end"]] for s in sections if s["name"] == "experience"] or [text]
+    today = datetime.date.today()
+    intervals = []
+    for chunk in scope:
+        for m in _RANGE_RE.finditer(chunk):
+            start_month, start_year, end_month, end_year, ongoing = m.groups()
+            start = int(start_year) * 12 + _MONTHS.get((start_month or "jan").lower(), 1) - 1
+            if ongoing:
+                end = today.year * 12 + today.month
+            else:
+                end = int(end_year) * 12 + (_MONTHS[end_month.lower()] if end_month else 12)
+            if end > start:
+                intervals.append((start, end))
+    if intervals:
+        months = 0
+        current_start, current_end = None, None
+        for start, end in sorted(intervals):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    months += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        months += current_end - current_start
+        return round(months / 12, 1)
+    claims = [float(m.group(1)) for m in _YEARS_RE.finditer(text)]
+    return max(claims) if claims else 0.0
+
+def parse_resume_text(text):
+    """The structured parse of already-extracted resume text."""
+    index = onet_skill_index()
+    sections = find_sections(text)
+    mentions = [
+        {"skill": index.name(cid), "id": cid, "start": start, "end": end}
+        for cid, start, end in index.find_spans(text)
+    ]
+    seen = set()
+    skills = [m["skill"] for m in mentions if not (m["id"] in seen or seen.add(m["id"]))]
+    return {
+        "text": text,
+        "sections": sections,
+        "mentions": mentions,
+        "skills": skills,
+        "years_experience": years_of_experience(text, sections),
+    }
+
+class ResumeStore:
+    """Parsed resumes by content hash: an in-process LRU over the `resume_parses` collection."""
+
+    def __init__(self, collection, latest_collection, max_cached=128):
+        self.collection = collection
+        self.latest_collection = latest_collection # email -> the user's last uploaded resume
+        self.max_cached = max_cached
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory": 0, "db": 0, "miss": 0}
+
+    def _remember(self, resume_id, doc):
+        with self._lock:
+            self._cache[resume_id] = doc
+            self._cache.move_to_end(resume_id)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+    def get(self, resume_id):
+        """A previously parsed resume, or None."""
+        with self._lock:
+            doc = self._cache.get(resume_id)
+            if doc is not None:
+                self._cache.move_to_end(resume_id)
+                self.stats["memory"] += 1
+                return doc
+        doc = self.collection.find_one({"_id": resume_id, "version": PARSER_VERSION})
+        if doc is None:
+            return None
+        self.stats["db"] += 1
+        self._remember(resume_id, doc)
+        return doc
+
+    def parse(self, data):
+        """The parse of a resume PDF given as bytes, from cache when the same file was seen before."""
+        resume_id = hashlib.sha256(data).hexdigest()
+        doc = self.get(resume_id)
+        if doc is not None:
+            return doc
+        self.stats["miss"] += 1
+        text = extract_text_from_pdf(io.BytesIO(data))
+        with span("resume_parse"):
+            doc = {"_id": resume_id, "version": PARSER_VERSION, **parse_resume_text(text),
+                   "created_at": datetime.datetime.utcnow()}
+        try:
+            self.collection.replace_one({"_id": resume_id}, doc, upsert=True)
+        except Exception as e:
+            print(f"Could not store resume parse: {e}")
+        self._remember(resume_id, doc)
+        return doc
+
+    def set_latest(self, email, resume_id):
+        """Remember the last resume a user uploaded, for features that prefill from it."""
+        self.latest_collection.update_one(
+            {"_id": email},
+            {"$set": {"resume_id": resume_id, "updated_at": datetime.datetime.utcnow()}},
+            upsert=True
+        )
+
+    def latest(self, email):
+        """The parse of a user's most recently uploaded resume, or None."""
+        ref = self.latest_collection.find_one({"_id": email})
+        return self.get(ref["resume_id"]) if ref else None
+
+    def for_request(self, resume_id=None, email=None):
+        """An explicitly referenced resume if given, else the user's latest one."""
+        if resume_id:
+            return self.get(resume_id)
+        if email:
+            return self.latest(email)
+        return None
+
+resumes = ResumeStore(db["resume_parses"], db["user_resumes"])
+
+def _resume_metrics():
+    lines = ["# HELP resume_parse_lookups_total Resume parse lookups by where they were answered.", "# TYPE resume_parse_lookups_total counter"]
+    for result, count in dict(resumes.stats).items():
+        lines.append(f'resume_parse_lookups_total{{result="{result}"}} {count}')
+    return lines
+
+metrics.collectors.append(_resume_metrics)
@@ -0,0 +1,136 @@
+"""
+Occupation similarity over O*NET technology skills. The occupation x skill
+incidence matrix is compiled once into CSR arrays (indptr/indices over
+canonical skill columns), so ranking every occupation against a user's
+skills is one sparse matrix-vector product, and each occupation's top-k
+most similar occupations (cosine over shared skills) is precomputed into a
+neighbor table at build time.
+"""
+import numpy as np
+
+from core.skills import onet_skill_index
+
+NEIGHBORS_PER_ROLE = 10
+
+class OccupationMatrix:
+    def __init__(self, occupations, tech_data, index, k=NEIGHBORS_PER_ROLE):
+        self.index = index
+        titles = occupations.dropna(subset=["O*NET-SOC Code", "Title"]).drop_duplicates("O*NET-SOC Code")
+        self.codes = titles["O*NET-SOC Code"].tolist()
+        self.titles = titles["Title"].tolist()
+        self.row_of_title = {t: i for i, t in reversed(list(enumerate(self.titles)))}
+        row_of_code = {c: i for i, c in enumerate(self.codes)}
+
+        # One column per canonical skill id, so "AWS" and "Amazon Web Services" rows share a column
+        pairs = tech_data[["O*NET-SOC Code", "Example"]].dropna()
+        examples = pairs["Example"].unique().tolist()
+        canonical = {e: index.canonical(e) for e in examples}
+        self.col_of = {}
+        for cid in canonical.values():
+            self.col_of.setdefault(cid, len(self.col_of))
+        rows = pairs["O*NET-SOC Code"].map(row_of_code)
+        keep = rows.notna().to_numpy()
+        rows = rows.to_numpy()[keep].astype(np.int64)
+        cols = pairs["Example"].map(lambda e: self.col_of[canonical[e]]).to_numpy()[keep].astype(np.int64)
+
+        n, m = len(self.codes), len(self.col_of)
+        flat = np.unique(rows * max(m, 1) + cols) # sorted by row then column, duplicates dropped
+        rows, cols = flat // max(m, 1), flat % max(m, 1)
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(rows, minlength=n), out=self.indptr[1:])
+        self.indices = cols.astype(np.int32)
+        self.row_nnz = np.diff(self.indptr)
+        self.col_names = [None] * m
+        for e in examples:
+            col = self.col_of[canonical[e]]
+            if self.col_names[col] is None:
+                self.col_names[col] = index.name(canonical[e])
+
+        self.neighbors = self._neighbor_table(rows, cols, n, m, k)
+
+    def _neighbor_table(self, rows, cols, n, m, k):
+        """Top-k occupations by cosine similarity for every occupation, via the CSC transpose."""
+        order = np.argsort(cols, kind="stable")
+        col_ptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=m), out=col_ptr[1:])
+        col_rows = rows[order]
+        norms = np.sqrt(self.row_nnz.astype(np.float64))
+
+        table = []
+        for i in range(n):
+            skill_cols = self.indices[self.indptr[i]:self.indptr[i + 1]]
+            if not len(skill_cols):
+                table.append(())
+                continue
+            others = np.concatenate([col_rows[col_ptr[c]:col_ptr[c + 1]] for c in skill_cols])
+            shared = np.bincount(others, minlength=n).astype(np.float64)
+            shared[i] = 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cosine = np.where(shared > 0, shared / (norms[i] * norms), 0.0)
+            top = self._top(cosine, k)
+            table.append(tuple((int(j), float(cosine[j]), int(shared[j])) for j in top if cosine[j] > 0))
+        return table
+
+    @staticmethod
+    def _top(scores, k):
+        if len(scores) > k:
+            candidates = np.argpartition(-scores, k)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    def rank(self, skills, limit=10):
+        """
+        Occupations ordered by cosine similarity to a list of skill names, as
+        dicts with overlap counts and the matched skills. One CSR mat-vec.
+        """
+        user_ids = self.index.canonical_set(skills)
+        x = np.zeros(len(self.col_of), dtype=np.int32)
+        for cid in user_ids:
+            col = self.col_of.get(cid)
+            if col is not None:
+                x[col] = 1
+        csum = np.zeros(len(self.indices) + 1, dtype=np.int64)
+        np.cumsum(x[self.indices], out=csum[1:])
+        overlap = csum[self.indptr[1:]] - csum[self.indptr[:-1]]
+        if not user_ids or not overlap.any():
+            return []
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.where(overlap > 0, overlap / np.sqrt(self.row_nnz * float(len(user_ids))), 0.0)
+        results = []
+        for i in self._top(score, limit):
+            if overlap[i] == 0:
+                break
+            row = self.indices[self.indptr[i]:self.indptr[i + 1]]
+            results.append({
+                "role": self.titles[i],
+                "code": self.codes[i],
+                "score": round(float(score[i]), 4),
+                "overlap": int(overlap[i]),
+                "coverage": round(float(overlap[i] / self.row_nnz[i]), 4),
+                "matchedSkills": [self.col_names[c] for c in row[x[row] == 1]],
+            })
+        return results
+
+    def similar_roles(self, title, limit=NEIGHBORS_PER_ROLE):
+        """Precomputed nearest occupations to one O*NET title, or None for an unknown title."""
+        row = self.row_of_title.get(title)
+        if row is None:
+            return None
+        return [
+            {"role": self.titles[j], "code": self.codes[j], "score": round(score, 4), "sharedSkills": shared}
+            for j, score, shared in self.neighbors[row][:limit]
+        ]
+
+_matrix = None
+
+def occupation_matrix():
+    """The matrix over the current O*NET tables, rebuilt if core.onet's tables are replaced."""
+    global _matrix
+    from core import onet
+    index = onet_skill_index()
+    key = (onet.occupations, onet.tech_data, index)
+    if _matrix is None or any(a is not b for a, b in zip(_matrix[0], key)):
+        _matrix = (key, OccupationMatrix(onet.occupations, onet.tech_data, index))
+    return _matrix[1]
@@ -0,0 +1,169 @@
+"""
+Skill prerequisite graph for ordering closure plans. SKILL_PREREQUISITES is
+compiled once into CSR adjacency arrays (offsets/targets over integer node
+ids) plus one ancestor bitset per node, so ordering any set of missing
+skills is a small topological sort over bitset tests, and the schedule
+(start week per skill, critical path, total effort) for a given missing set
+is cached.
+"""
+import heapq
+from array import array
+from functools import lru_cache
+
+from core.skills import onet_skill_index
+
+# skill -> skills to learn first (names resolve through the skill alias index)
+SKILL_PREREQUISITES = {
+    "TypeScript": ["JavaScript"],
+    "React": ["JavaScript", "HTML", "CSS"],
+    "Vue.js": ["JavaScript", "HTML", "CSS"],
+    "Angular": ["TypeScript", "HTML", "CSS"],
+    "Node.js": ["JavaScript"],
+    "Express": ["Node.js"],
+    "REST API": ["HTTP"],
+    "System Design": ["REST API", "SQL"],
+    "PostgreSQL": ["SQL"],
+    "Docker": ["Linux"],
+    "Kubernetes": ["Docker"],
+    "CI/CD": ["Git", "Docker"],
+    "Amazon Web Services": ["Linux"],
+    "Microsoft Azure": ["Linux"],
+    "Google Cloud Platform": ["Linux"],
+    "Pandas": ["Python"],
+    "NumPy": ["Python"],
+    "Statistics": [],
+    "Machine Learning": ["Python", "Statistics", "NumPy"],
+    "Scikit-learn": ["Machine Learning", "Pandas"],
+    "Deep Learning": ["Machine Learning"],
+    "TensorFlow": ["Deep Learning"],
+    "PyTorch": ["Deep Learning"],
+    "Natural Language Processing": ["Deep Learning"],
+    "Generative AI": ["Natural Language Processing"],
+    "Data Visualization": ["Pandas"],
+    "Tableau": ["Data Visualization"],
+    "Big Data": ["SQL", "Python"],
+}
+
+# Typical weeks to become productive; anything unlisted takes DEFAULT_SKILL_WEEKS
+SKILL_WEEKS = {
+    "HTML": 1, "CSS": 2, "Git": 1, "HTTP": 1, "SQL": 2, "Linux": 2,
+    "JavaScript": 3, "TypeScript": 2, "Python": 3, "React": 3, "Angular": 4,
+    "Node.js": 2, "Docker": 2, "Kubernetes": 3, "CI/CD": 2, "Amazon Web Services": 3,
+    "Machine Learning": 6, "Deep Learning": 6, "Statistics": 3, "System Design": 4,
+}
+DEFAULT_SKILL_WEEKS = 2
+
+class SkillGraph:
+    def __init__(self, index, prerequisites=SKILL_PREREQUISITES, weeks=SKILL_WEEKS):
+        self.index = index
+        self.node_of = {} # canonical skill id -> node
+        for skill, prereqs in prerequisites.items():
+            for name in [skill] + prereqs:
+                self.node_of.setdefault(index.canonical(name), len(self.node_of))
+        n = len(self.node_of)
+
+        edges = [[] for _ in range(n)] # node -> prerequisite nodes
+        for skill, prereqs in prerequisites.items():
+            node = self.node_of[index.canonical(skill)]
+            edges[node].extend(self.node_of[index.canonical(p)] for p in prereqs)
+        self.offsets = array("i", [0])
+        self.targets = array("i")
+        for prereq_nodes in edges:
+            self.targets.extend(prereq_nodes)
+            self.offsets.append(len(self.targets))
+
+        self.weeks = array("i", [DEFAULT_SKILL_WEEKS] * n)
+        for name, w in weeks.items():
+            cid = index.canonical(name)
+            if cid in self.node_of:
+                self.weeks[self.node_of[cid]] = w
+
+        # Ancestor bitsets, filled in topological order (Kahn); a cycle is a data error
+        self.ancestors = [0] * n
+        dependents = [[] for _ in range(n)]
+        indegree = array("i", [0] * n)
+        for node in range(n):
+            for prereq in self.targets[self.offsets[node]:self.offsets[node + 1]]:
+                dependents[prereq].append(node)
+                indegree[node] += 1
+        ready = [node for node in range(n) if indegree[node] == 0]
+        done = 0
+        while ready:
+            node = ready.pop()
+            done += 1
+            for prereq in self.targets[self.offsets[node]:self.offsets[node + 1]]:
+                self.ancestors[node] |= self.ancestors[prereq] | (1 << prereq)
+            for dep in dependents[node]:
+                indegree[dep] -= 1
+                if indegree[dep] == 0:
+                    ready.append(dep)
+        if done != n:
+            raise ValueError("SKILL_PREREQUISITES contains a cycle")
+
+        self.schedule = lru_cache(maxsize=4096)(self._schedule)
+
+    def skill_weeks(self, name):
+        node = self.node_of.get(self.index.canonical(name))
+        return self.weeks[node] if node is not None else DEFAULT_SKILL_WEEKS
+
+    def _schedule(self, canonical_ids):
+        """
+        Order a tuple of canonical skill ids prerequisites-first (ties keep the
+        given order) and place each on a timeline. Returns (positions in
+        learning order, start week per position, critical path weeks, total weeks).
+        """
+        nodes = [self.node_of.get(cid) for cid in canonical_ids]
+        k = len(nodes)
+        preds = [[j for j in range(k) if nodes[i] is not None and nodes[j] is not None
+                  and self.ancestors[nodes[i]] >> nodes[j] & 1] for i in range(k)]
+        dependents = [[] for _ in range(k)]
+        for i, ps in enumerate(preds):
+            for j in ps:
+                dependents[j].append(i)
+        indegree = [len(ps) for ps in preds]
+        heap = [i for i in range(k) if indegree[i] == 0]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            i = heapq.heappop(heap)
+            order.append(i)
+            for d in dependents[i]:
+                indegree[d] -= 1
+                if indegree[d] == 0:
+                    heapq.heappush(heap, d)
+
+        weeks = [self.weeks[n] if n is not None else DEFAULT_SKILL_WEEKS for n in nodes]
+        start = [0] * k
+        finish = [0] * k
+        for i in order:
+            start[i] = max((finish[j] for j in preds[i]), default=0)
+            finish[i] = start[i] + weeks[i]
+        return tuple(order), tuple(start), max(finish, default=0), sum(weeks)
+
+    def order_plan(self, plan):
+        """
+        Reorder closure-plan items ({"skill", ...}) prerequisites first and
+        stamp each with startWeek. Returns (items, schedule summary).
+        """
+        key = tuple(self.index.canonical(item.get("skill", "")) for item in plan)
+        order, start, critical_path, total = self.schedule(key)
+        ordered = []
+        for i in order:
+            item = plan[i]
+            item["startWeek"] = start[i]
+            ordered.append(item)
+        return ordered, {"criticalPathWeeks": critical_path, "totalWeeks": total}
+
+    def order_skills(self, names):
+        order, _, _, _ = self.schedule(tuple(self.index.canonical(n) for n in names))
+        return [names[i] for i in order]
+
+_graph = None
+
+def skill_graph():
+    """The prerequisite graph over the current O*NET skill index (rebuilt with it)."""
+    global _graph
+    index = onet_skill_index()
+    if _graph is None or _graph.index is not index:
+        _graph = SkillGraph(index)
+    return _graph
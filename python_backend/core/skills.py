@@ -0,0 +1,175 @@
+"""
+Canonical skill normalization. Skill names from O*NET `Technology Skills.txt`
+and a curated alias table are compiled into one dict from normalized surface
+form ("js", "node js", "k8s") to a canonical skill id, so a free-form skill
+list becomes a set of ids in one hash lookup per entry, gaps become set
+differences, and free text is scanned with an n-gram window instead of
+substring checks ("c" no longer matches every word containing a c).
+"""
+import re
+
+# canonical name -> alternative spellings; a canonical name is always its own alias
+SKILL_ALIASES = {
+    "JavaScript": ["js", "ecmascript", "es6", "vanilla js"],
+    "TypeScript": ["ts"],
+    "Python": ["python3", "python 3"],
+    "Java": ["java se", "core java"],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["csharp", "c sharp"],
+    "Go": ["golang"],
+    "Node.js": ["node", "nodejs", "node js"],
+    "React": ["react.js", "reactjs", "react js"],
+    "Vue.js": ["vue", "vuejs", "vue js"],
+    "Angular": ["angularjs", "angular.js"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "SQL": ["structured query language"],
+    "PostgreSQL": ["postgres", "psql"],
+    "MongoDB": ["mongo"],
+    "Git": ["github", "gitlab", "version control"],
+    "Docker": ["containers", "containerization"],
+    "Kubernetes": ["k8s", "kube"],
+    "Amazon Web Services": ["aws", "amazon aws"],
+    "Microsoft Azure": ["azure"],
+    "Google Cloud Platform": ["gcp", "google cloud"],
+    "CI/CD": ["cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "REST API": ["rest", "restful", "rest apis", "restful api", "restful apis"],
+    "Pandas": ["pandas library"],
+    "NumPy": ["numpy library"],
+    "Scikit-learn": ["sklearn", "scikit learn"],
+    "TensorFlow": ["tensor flow"],
+    "PyTorch": ["torch"],
+    "Machine Learning": ["ml"],
+    "Artificial Intelligence": ["ai"],
+    "Generative AI": ["genai", "gen ai", "llm", "llms", "large language models"],
+    "Deep Learning": ["dl", "neural networks"],
+    "Natural Language Processing": ["nlp"],
+    "Data Visualization": ["data viz", "dataviz"],
+    "Tableau": ["tableau desktop"],
+    "Linux": ["unix", "gnu linux"],
+    "Microsoft Excel": ["excel", "ms excel"],
+    "Agile": ["scrum", "kanban"],
+    "System Design": ["systems design", "system architecture"],
+}
+
+# Surfaces that are ordinary words (or letters) in running text: they still
+# normalize an explicit skill entry, but are never reported from text scans.
+TEXT_AMBIGUOUS = {"c", "r", "go", "node", "rest", "ts", "dl", "kube", "containers", "version control", "torch"}
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+_TOKEN_SPAN_RE = re.compile(_TOKEN_RE.pattern, re.IGNORECASE)
+
+def tokenize(text):
+    """Lowercase word tokens, keeping the punctuation that is part of skill names (c++, c#, node.js)."""
+    return _TOKEN_RE.findall(str(text).lower())
+
+def normalize_key(term):
+    return " ".join(tokenize(term))
+
+class SkillIndex:
+    """Hash index from every known surface form to its canonical skill id (the canonical name's key)."""
+
+    def __init__(self, names=(), aliases=SKILL_ALIASES):
+        self.ids = {} # surface key -> canonical id
+        self.display = {} # canonical id -> display name
+        # Curated aliases first, so e.g. an O*NET "AWS" joins "Amazon Web Services" instead of shadowing it
+        for canonical, alternatives in aliases.items():
+            self._add(canonical, canonical)
+            for alias in alternatives:
+                self._add(alias, canonical)
+        for name in names:
+            if isinstance(name, str) and name.strip():
+                self._add(name, name)
+        self.text_ids = {key: cid for key, cid in self.ids.items() if key not in TEXT_AMBIGUOUS}
+        # Multi-word surfaces keyed by token tuple; windows are only tried from tokens that start one
+        self.phrase_ids = {tuple(key.split(" ")): cid for key, cid in self.text_ids.items() if " " in key}
+        self.phrase_lengths = {}
+        for words in self.phrase_ids:
+            self.phrase_lengths.setdefault(words[0], set()).add(len(words))
+
+    def _add(self, surface, canonical):
+        key = normalize_key(surface)
+        if not key or key in self.ids:
+            return
+        canonical_id = self.ids.get(normalize_key(canonical)) or normalize_key(canonical)
+        self.display.setdefault(canonical_id, canonical)
+        self.ids[key] = canonical_id
+
+    def __len__(self):
+        return len(self.display)
+
+    def canonical(self, term):
+        """Canonical id for one skill name; unknown names map to their own normalized form."""
+        key = normalize_key(term)
+        return self.ids.get(key, key)
+
+    def canonical_set(self, terms):
+        return {cid for cid in (self.canonical(t) for t in terms) if cid}
+
+    def name(self, canonical_id):
+        return self.display.get(canonical_id, canonical_id)
+
+    def find_in_text(self, text):
+        """Canonical ids of every known skill mentioned in `text` (whole tokens and whole phrases only)."""
+        tokens = tokenize(text)
+        text_ids = self.text_ids
+        found = {text_ids[t] for t in set(tokens).intersection(text_ids)}
+        phrase_lengths = self.phrase_lengths
+        for i, token in enumerate(tokens):
+            lengths = phrase_lengths.get(token)
+            if lengths:
+                for n in lengths:
+                    cid = self.phrase_ids.get(tuple(tokens[i:i + n]))
+                    if cid is not None:
+                        found.add(cid)
+        return found
+
+    def find_spans(self, text):
+        """
+        Like find_in_text, but every mention with its character offsets into
+        `text`: a list of (canonical id, start, end), longest phrase first at
+        each position and no overlapping mentions.
+        """
+        matches = list(_TOKEN_SPAN_RE.finditer(str(text)))
+        tokens = [m.group().lower() for m in matches]
+        spans = []
+        i = 0
+        while i < len(tokens):
+            hit = None
+            for n in sorted(self.phrase_lengths.get(tokens[i], ()), reverse=True):
+                cid = self.phrase_ids.get(tuple(tokens[i:i + n]))
+                if cid is not None:
+                    hit = (cid, n)
+                    break
+            if hit is None and tokens[i] in self.text_ids:
+                hit = (self.text_ids[tokens[i]], 1)
+            if hit is None:
+                i += 1
+                continue
+            cid, n = hit
+            spans.append((cid, matches[i].start(), matches[i + n - 1].end()))
+            i += n
+        return spans
+
+    def missing(self, required, have):
+        """Required skill names (deduplicated by canonical id, order kept) not covered by `have`."""
+        have_ids = self.canonical_set(have)
+        seen = set()
+        missing = []
+        for skill in required:
+            cid = self.canonical(skill)
+            if cid and cid not in have_ids and cid not in seen:
+                missing.append(skill)
+            seen.add(cid)
+        return missing
+
+_onet_index = None
+
+def onet_skill_index():
+    """The index over all O*NET technology examples, rebuilt if core.onet's table is replaced."""
+    global _onet_index
+    from core import onet
+    if _onet_index is None or _onet_index[0] is not onet.tech_data:
+        names = onet.tech_data["Example"].dropna().unique().tolist() if "Example" in onet.tech_data else []
+        _onet_index = (onet.tech_data, SkillIndex(names))
+    return _onet_index[1]
@@ -0,0 +1,142 @@
+"""
+Batches fire-and-forget analytics inserts off the request path. Used for
+write-mostly records nobody reads back within the same request (readiness
+scans, failure stories, finished interviews, generated projects, profiles),
+and for deferred calls that fold a request into derived aggregates.
+"""
+import atexit
+import os
+import threading
+from collections import deque
+
+from pymongo.errors import BulkWriteError
+
+from core.db import get_db
+from core.metrics import metrics
+
+class WriteBehindBuffer:
+    """
+    Batches fire-and-forget analytics inserts off the request path. A daemon
+    thread flushes them with insert_many(ordered=False) whenever `max_batch`
+    records are pending or every `flush_interval` seconds, and once more at exit.
+    """
+
+    def __init__(self, get_database, max_batch=200, flush_interval=1.0, max_pending=20000):
+        self.get_database = get_database # resolved per flush, so the buffer never forces a connection
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._local = threading.local() # marks the thread while it runs deferred calls
+        self._thread = None
+        self._pid = None
+        self._stopped = False
+        self.stats = {"enqueued": 0, "written": 0, "failed": 0, "dropped": 0, "flushes": 0}
+
+    def _ensure_thread(self):
+        # Started lazily (and restarted after a fork) so preloading parents don't own the flusher
+        if self._thread is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def add(self, collection_name, doc):
+        """Queue one document; returns False (and counts a drop) if the buffer is full."""
+        return self._enqueue((collection_name, doc))
+
+    def defer(self, fn, *args, **kwargs):
+        """
+        Queue a call to run on the flusher, before the inserts queued with it;
+        calls run in the order they were queued. Returns False if the buffer is full.
+        """
+        return self._enqueue((None, (fn, args, kwargs)))
+
+    def _enqueue(self, item):
+        with self._cond:
+            if self._stopped or len(self._pending) >= self.max_pending:
+                self.stats["dropped"] += 1
+                return False
+            self._pending.append(item)
+            self.stats["enqueued"] += 1
+            self._ensure_thread()
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify()
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._pending and not self._stopped:
+                    self._cond.wait(self.flush_interval)
+                if self._stopped and not self._pending:
+                    return
+            self.flush()
+
+    def flush(self):
+        """Run the deferred calls queued so far, then write the documents with one insert_many per collection."""
+        if getattr(self._local, "in_call", False):
+            return # a deferred call asked for a flush; it is already running inside one
+        with self._flush_lock:
+            with self._cond:
+                batch = list(self._pending)
+                self._pending.clear()
+            if not batch:
+                return
+            grouped = {}
+            for name, item in batch:
+                if name is None:
+                    self._call(*item)
+                else:
+                    grouped.setdefault(name, []).append(item)
+            database = self.get_database() if grouped else None
+            for name, docs in grouped.items():
+                try:
+                    result = database[name].insert_many(docs, ordered=False)
+                    self.stats["written"] += len(result.inserted_ids)
+                except BulkWriteError as e:
+                    inserted = e.details.get("nInserted", 0)
+                    self.stats["written"] += inserted
+                    self.stats["failed"] += len(docs) - inserted
+                    print(f"Write-behind partial failure on {name}: {len(docs) - inserted} docs")
+                except Exception as e:
+                    self.stats["failed"] += len(docs)
+                    print(f"Write-behind flush error on {name}: {e}")
+            self.stats["flushes"] += 1
+
+    def _call(self, fn, args, kwargs):
+        self._local.in_call = True
+        try:
+            fn(*args, **kwargs)
+            self.stats["written"] += 1
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"Write-behind deferred call {getattr(fn, '__qualname__', fn)} failed: {e}")
+        finally:
+            self._local.in_call = False
+
+    def snapshot(self):
+        with self._cond:
+            return {**self.stats, "pending": len(self._pending)}
+
+    def close(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=5)
+        self.flush()
+
+analytics_buffer = WriteBehindBuffer(get_db)
+atexit.register(analytics_buffer.close)
+
+def _write_buffer_metrics():
+    snap = analytics_buffer.snapshot()
+    lines = ["# HELP write_behind_records_total Analytics records by outcome.", "# TYPE write_behind_records_total counter"]
+    for state in ("enqueued", "written", "failed", "dropped"):
+        lines.append(f'write_behind_records_total{{state="{state}"}} {snap[state]}')
+    lines += ["# TYPE write_behind_pending gauge", f"write_behind_pending {snap['pending']}"]
+    return lines
+
+metrics.collectors.append(_write_buffer_metrics)
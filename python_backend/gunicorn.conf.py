@@ -0,0 +1,73 @@
+"""
+Production launcher settings (see wsgi.py).
+
+    cd python_backend
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The app is preloaded in the master before forking, so the immutable datasets
+(O*NET DataFrames, ROLE_MCQ_BANK, QUESTION_BANK and its compiled keyword sets,
+the failure rule trie) are loaded once and shared copy-on-write by all
+workers; gc.freeze() keeps the collector from touching (and so copying) them.
+The master opens no Mongo connection: modules bind lazy collection handles
+and defer their indexes, and each worker connects on first use.
+Mutable cross-worker state lives in Mongo: seeding leases (seeding_locks),
+interview sessions and AI rate-limit buckets (INTERVIEW_SESSION_STORE=mongo
+and RATE_LIMIT_STORE=mongo are the defaults here).
+Multiple workers therefore need a real MongoDB - the mongomock fallback is
+per-process.
+
+Sizing (WEB_CONCURRENCY workers x GUNICORN_THREADS threads, gthread workers).
+These figures were taken on the per-process mongomock fallback, so they show
+relative scaling only; re-measure against a real MongoDB before relying on
+absolute numbers. Measured with `python -m benchmarks.load` on a 1 vCPU / 6 GB box against
+benchmarks/fake_ollama.py (0.3s to first token, 50 tokens/s), 32 concurrent
+clients for 20s on a mixed workload (readiness scan, role lookup, failure
+analysis, skill-gap plan, chat):
+
+    workers x threads   req/s   p50 ms   p99 ms
+    1 x 1                 1.6    16538    24345
+    1 x 8                11.6     2150     5596
+    2 x 8                16.0     1506     5501
+    4 x 8                27.5      588     4498
+    2 x 16               41.2       61     2935
+
+Most request time is spent waiting on the model, so total concurrency
+(workers x threads) is what buys throughput, and threads are the cheaper
+way to get it: 2 x 16 beats 4 x 8 with half the processes. Add workers only
+once the CPU-bound routes (PDF parsing, skill matching) saturate a core -
+roughly 2 per core - and keep workers x threads at or below what the model
+server can run concurrently. MODEL_MAX_IN_FLIGHT (core/ratelimit.py) caps
+model calls across all workers (the slots live in Mongo), question seeding
+included; requests over the cap queue briefly or get a fast 503.
+"""
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2))
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+worker_class = "gthread"
+preload_app = True
+timeout = 150 # model calls may legitimately take up to 120s
+graceful_timeout = 30
+keepalive = 5
+
+# Settings read by the app modules at import time; the config is loaded before the app is preloaded
+os.environ.setdefault("INTERVIEW_SESSION_STORE", "mongo")
+os.environ.setdefault("RATE_LIMIT_STORE", "mongo")
+if workers > 1:
+    # Per-process profile caches would serve stale profiles after another worker's write
+    os.environ.setdefault("PROFILE_CACHE_SIZE", "0")
+
+
+def when_ready(server):
+    # The master never touches Mongo: each worker opens its own client on first use (core/db.py)
+    if os.environ.get("MONGO_URI", "").startswith("mongomock://") and workers > 1:
+        server.log.warning("Running on the in-memory mongomock fallback: each worker gets its own copy of the data")
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    server.log.info("Worker %s ready (pid %s)", worker.age, worker.pid)
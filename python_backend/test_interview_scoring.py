@@ -0,0 +1,30 @@
+from blueprints.interview import score_answer, score_answers_batch
+
+def test_stems_and_synonyms_match():
+    # Virtual DOM keywords: dom, copy, diff, update, performance
+    score, matched = score_answer("frontend", 0, "React keeps a virtual DOM, diffs it and patches the page efficiently")
+    assert (score, matched) == (10, 5)
+
+def test_keywords_match_whole_words_only():
+    # REST keywords: http, get, post, client, server; "postgres" and "together" must not count
+    assert score_answer("developer", 0, "postgres together") == (3, 0)
+    assert score_answer("developer", 0, "the client sends a POST over HTTP") == (10, 3)
+
+def test_multi_word_synonym_needs_every_word():
+    # "reference counting" stands in for "collection" only when both words appear
+    assert score_answer("python", 2, "reference counting")[1] == 1
+    assert score_answer("python", 2, "a reference")[1] == 0
+
+def test_batch_matches_single_scoring():
+    items = [
+        {"role": "sql", "index": 1, "answer": "Atomicity, consistency, isolation and durability"},
+        {"role": "sql", "index": 1, "answer": "Atomicity, consistency, isolation and durability"},
+        {"role": "hr", "index": 0, "answer": "I am passionate about my career"},
+        {"role": "hr", "index": 7, "answer": "out of range"},
+        {"role": "nope", "index": 0, "answer": ""},
+    ]
+    results = score_answers_batch(items)
+    expected = [dict(zip(("score", "matched"), score_answer(i["role"], i["index"], i["answer"]))) for i in items[:3]]
+    assert results[:3] == expected
+    assert results[0] == {"score": 10, "matched": 4}
+    assert results[3:] == [{"error": "Unknown question"}, {"error": "Unknown question"}]
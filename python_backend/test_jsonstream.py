@@ -0,0 +1,33 @@
+from core.jsonstream import JsonObjectStream
+
+def feed_all(pieces):
+    stream = JsonObjectStream()
+    found = []
+    for piece in pieces:
+        found += stream.feed(piece)
+    return found, stream
+
+def test_objects_split_across_tokens():
+    text = '[{"question": "What is {x}?", "answer": "a \\"quoted\\" }"}, {"question": "Q2"}]'
+    found, stream = feed_all(text[i:i + 3] for i in range(0, len(text), 3))
+    assert found == [{"question": "What is {x}?", "answer": 'a "quoted" }'}, {"question": "Q2"}]
+    assert stream.malformed == 0
+
+def test_truncated_stream_keeps_complete_objects():
+    found, stream = feed_all(['[{"question": "Q1"}, ', '{"question": "Q2", "opt'])
+    assert found == [{"question": "Q1"}]
+    assert stream.malformed == 0
+
+def test_chatter_around_objects_is_ignored():
+    found, _ = feed_all(['Sure! Here are your questions:\n', '{"question": "Q1"}', ' and also ', '{"question": "Q2"}\nHope this helps.'])
+    assert found == [{"question": "Q1"}, {"question": "Q2"}]
+
+def test_nested_wrapper_object_yields_inner_objects_first():
+    found, _ = feed_all(['{"questions": [{"question": "Q1"}, ', '{"question": "Q2"}]}'])
+    assert found[:2] == [{"question": "Q1"}, {"question": "Q2"}]
+    assert found[2] == {"questions": [{"question": "Q1"}, {"question": "Q2"}]}
+
+def test_malformed_middle_object_is_skipped():
+    found, stream = feed_all(['[{"question": "Q1"}, {"question": Q2 oops}, ', '{"question": "Q3"}]'])
+    assert found == [{"question": "Q1"}, {"question": "Q3"}]
+    assert stream.malformed == 1
@@ -0,0 +1,32 @@
+import pytest
+
+from core.skillgraph import SkillGraph
+from core.skills import SkillIndex
+
+graph = SkillGraph(SkillIndex())
+
+def test_prerequisites_come_first():
+    assert graph.order_skills(["Kubernetes", "Docker", "Linux"]) == ["Linux", "Docker", "Kubernetes"]
+    assert graph.order_skills(["React", "CSS", "JavaScript"]) == ["CSS", "JavaScript", "React"]
+
+def test_transitive_prerequisites_without_the_middle_skill():
+    assert graph.order_skills(["Kubernetes", "Linux"]) == ["Linux", "Kubernetes"]
+    assert graph.order_skills(["Generative AI", "Python"]) == ["Python", "Generative AI"]
+
+def test_unrelated_skills_keep_their_order():
+    assert graph.order_skills(["Tableau", "HTML", "Git"]) == ["Tableau", "HTML", "Git"]
+
+def test_aliases_resolve_to_graph_nodes():
+    assert graph.order_skills(["k8s", "docker", "unix"]) == ["unix", "docker", "k8s"]
+
+def test_plan_is_scheduled_on_the_critical_path():
+    plan = [{"skill": "Kubernetes"}, {"skill": "Python"}, {"skill": "Docker"}, {"skill": "Linux"}]
+    ordered, summary = graph.order_plan(plan)
+    assert [(item["skill"], item["startWeek"]) for item in ordered] == [
+        ("Python", 0), ("Linux", 0), ("Docker", 2), ("Kubernetes", 4)
+    ]
+    assert summary == {"criticalPathWeeks": 7, "totalWeeks": 10}
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError):
+        SkillGraph(SkillIndex(), prerequisites={"A": ["B"], "B": ["A"]})
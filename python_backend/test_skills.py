@@ -0,0 +1,34 @@
+from core.skills import SkillIndex
+
+index = SkillIndex(["C", "AWS", "Kubernetes", "Microsoft Excel"])
+
+def test_aliases_share_a_canonical_id():
+    assert index.canonical("js") == index.canonical("JavaScript") == index.canonical("ES6")
+    assert index.canonical("k8s") == index.canonical("Kubernetes")
+    assert index.canonical("AWS") == index.canonical("Amazon Web Services")
+    assert index.name(index.canonical("k8s")) == "Kubernetes"
+
+def test_missing_compares_canonical_ids():
+    assert index.missing(["JavaScript", "Kubernetes", "Docker", "docker"], ["js", "K8S"]) == ["Docker"]
+
+def test_aliases_found_in_text():
+    found = index.find_in_text("Built dashboards in JS and deployed them on k8s with continuous integration.")
+    assert found == {index.canonical("JavaScript"), index.canonical("Kubernetes"), index.canonical("CI/CD")}
+
+def test_short_words_are_not_skills_in_text():
+    found = index.find_in_text("I like to go climbing; c the attached cv for a concise summary of my cycling.")
+    assert index.canonical("C") not in found
+    assert index.canonical("Go") not in found
+    assert found == set()
+
+def test_explicit_entries_still_normalize_ambiguous_surfaces():
+    assert index.canonical("golang") == index.canonical("go")
+    assert index.canonical("c") in index.canonical_set(["C"])
+    assert index.find_in_text("Services written in Golang and C++") == {index.canonical("Go"), index.canonical("C++")}
+
+def test_spans_prefer_the_longest_phrase():
+    text = "Experienced with Microsoft Excel and Node.js"
+    spans = index.find_spans(text)
+    assert [(index.name(cid), text[start:end]) for cid, start, end in spans] == [
+        ("Microsoft Excel", "Microsoft Excel"), ("Node.js", "Node.js")
+    ]
@@ -0,0 +1,11 @@
+"""
+WSGI entry point for production servers:
+
+    cd python_backend
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+APP_SUBSYSTEMS limits the process to a subset of blueprints (see app.py).
+"""
+from app import create_app
+
+app = create_app()
@@ -1,6 +1,9 @@
 import React, { useState, useEffect } from 'react';
 import { Database, Table, RefreshCw, ChevronRight } from 'lucide-react';
 
+// The data browser is admin-only: send the signed-in admin's token
+const authHeaders = () => ({ 'Authorization': `Bearer ${localStorage.getItem('token')}` });
+
 const AdminData = () => {
     const [collections, setCollections] = useState([]);
     const [selectedCol, setSelectedCol] = useState(null);
@@ -8,19 +11,19 @@ const AdminData = () => {
     const [loading, setLoading] = useState(false);
 
     useEffect(() => {
-        fetch('http://127.0.0.1:5000/api/collections')
+        fetch('http://127.0.0.1:5000/api/collections', { headers: authHeaders() })
             .then(res => res.json())
-            .then(cols => setCollections(cols))
+            .then(cols => setCollections(Array.isArray(cols) ? cols : []))
             .catch(err => console.error("Failed to fetch collections", err));
     }, []);
 
     const fetchData = (colName) => {
         setLoading(true);
         setSelectedCol(colName);
-        fetch(`http://127.0.0.1:5000/api/collection/${colName}`)
+        fetch(`http://127.0.0.1:5000/api/collection/${colName}`, { headers: authHeaders() })
             .then(res => res.json())
             .then(d => {
-                setData(d);
+                setData(Array.isArray(d) ? d : []);
                 setLoading(false);
             })
             .catch(err => {